@@ -11,5 +11,6 @@ FUELDATA_PROPS_DIR = os.path.join(FUELDATA_DIR, "propertiesData")
 TESTS_DIR = os.path.join(FUELLIB_DIR, "tests")
 TESTS_BASELINE_DIR = os.path.join(TESTS_DIR, "baselinePredictions")
 TUTORIALS_DIR = os.path.join(FUELLIB_DIR, "tutorials")
+FUELCACHE_DIR = os.path.join(FUELLIB_DIR, ".fuelCache")
 
 sys.path.append(SOURCE_DIR)
@@ -0,0 +1,141 @@
+import os
+import sys
+import numpy as np
+import FuelLib as fl
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+
+"""
+Simulated distillation curves of multicomponent fuels.
+
+The liquid is boiled at its bubble point, where Raoult's law gives
+sum_i X_i*psat_i(T) = p, and the vapor in equilibrium with it,
+y_i = X_i*psat_i(T)/p, is removed and condensed (Rayleigh batch distillation,
+the equilibrium limit of ASTM D86). With K_i = psat_i(T)/p, the moles of each
+compound in the liquid follow
+
+    d ln(n_i) = K_i d ln(N),  N = sum_i n_i,
+
+which is integrated with an exponential Heun scheme in the fraction of moles
+evaporated. The distillation temperature is reported against the recovered
+liquid volume fraction, with condensate volumes at a reference temperature.
+
+Every curve of a fuel, one for each pressure, is marched together with
+vectorized bubble-point solves, see fuel.bubble_point.
+
+Usage:
+    import FuelLib as fl
+    from Distillation import distillation_curve
+
+    fuel = fl.fuel("posf10325")
+    curve = distillation_curve(fuel, p=101325.0)
+    T, recovered = curve["T"], curve["recovered"]
+"""
+
+# Recovered volume fractions reported by ASTM D86, from the initial boiling point
+D86_RECOVERED = np.array([0.0, 0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95])
+
+
+def distillation_curve(
+    fuel,
+    p=101325.0,
+    recovered=None,
+    Y=None,
+    steps=200,
+    evaporated_max=1.0 - 1e-4,
+    T_ref=288.15,
+    correlation="Lee-Kesler",
+):
+    """
+    Simulate the distillation curves of one or more fuels at one or more pressures.
+
+    :meta private: The liquid is marched on a uniform grid of the evaporated mole fraction up to evaporated_max, and the temperatures are interpolated to the requested recovered volume fractions, nan beyond the volume recovered at evaporated_max.
+
+    :param fuel: Fuel or list of fuels to distill.
+    :type fuel: fl.fuel or list of fl.fuel
+    :param p: Pressure in Pa, scalar or shape (nP,).
+    :type p: float or np.ndarray
+    :param recovered: Recovered liquid volume fractions to report, defaults to the ASTM D86 points D86_RECOVERED.
+    :type recovered: np.ndarray, optional
+    :param Y: Initial mass fractions of each compound of a single fuel, defaults to the composition of each fuel.
+    :type Y: np.ndarray, optional
+    :param steps: Number of integration steps of each curve.
+    :type steps: int, optional
+    :param evaporated_max: Fraction of the initial moles evaporated at the end of the integration.
+    :type evaporated_max: float, optional
+    :param T_ref: Temperature in Kelvin at which the condensate volumes are measured.
+    :type T_ref: float, optional
+    :param correlation: Vapor pressure correlation ("Ambrose-Walton" or "Lee-Kesler").
+    :type correlation: str, optional
+    :return: Dictionary with the "recovered" volume fractions, shape (nR,), and the distillation temperatures "T" in Kelvin, shape (nR,), (nP, nR), (nFuels, nR) or (nFuels, nP, nR).
+    :rtype: dict
+    """
+    fuels = [fuel] if isinstance(fuel, fl.fuel) else list(fuel)
+    p = np.asarray(p, dtype=float)
+    recovered = D86_RECOVERED if recovered is None else np.asarray(recovered, float)
+    if np.any((recovered < 0) | (recovered >= 1)):
+        raise ValueError("Recovered volume fractions must be in [0, 1).")
+
+    T = np.stack(
+        [
+            _distill(
+                f,
+                np.atleast_1d(p),
+                recovered,
+                f.Y_0 if Y is None else Y,
+                steps,
+                evaporated_max,
+                T_ref,
+                correlation,
+            )
+            for f in fuels
+        ]
+    )
+    T = T.reshape((len(fuels),) + p.shape + recovered.shape)
+    if isinstance(fuel, fl.fuel):
+        T = T[0]
+
+    return {"recovered": recovered, "T": T}
+
+
+def _distill(fuel, p, recovered, Y, steps, evaporated_max, T_ref, correlation):
+    """
+    Distillation temperatures of a fuel at each pressure, see distillation_curve.
+
+    :return: Distillation temperatures in Kelvin, shape (nP, nR).
+    :rtype: np.ndarray
+    """
+
+    def bubble(n):
+        """Bubble-point temperature and K-values of the liquids with moles n."""
+        T = fuel.bubble_point(fuel.mass2Y(n * fuel.MW), p, correlation=correlation)
+        return T, fuel.psat(T, correlation=correlation) / p[:, np.newaxis]
+
+    # Moles and condensate molar volumes of each compound per unit initial volume
+    Vm = fuel.molar_liquid_vol(T_ref)
+    n = np.asarray(Y, dtype=float) / fuel.MW
+    n = np.tile(n / (n @ Vm), (len(p), 1))
+
+    # March in the fraction of moles evaporated, exactly for constant K-values
+    evaporated = np.linspace(0.0, evaporated_max, steps + 1)
+    ratio = (1.0 - evaporated[1:]) / (1.0 - evaporated[:-1])
+    T_hist = np.empty((steps + 1, len(p)))
+    V_hist = np.empty((steps + 1, len(p)))
+    T_hist[0], K = bubble(n)
+    V_hist[0] = 0.0
+    for i, f in enumerate(ratio):
+        _, K_pred = bubble(n * f**K)
+        n = n * f ** (0.5 * (K + K_pred))
+        T_hist[i + 1], K = bubble(n)
+        V_hist[i + 1] = 1.0 - n @ Vm
+
+    return np.stack(
+        [
+            np.interp(recovered, V_hist[:, j], T_hist[:, j], right=np.nan)
+            for j in range(len(p))
+        ]
+    )
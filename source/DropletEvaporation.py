@@ -0,0 +1,578 @@
+import os
+import sys
+import numpy as np
+import FuelLib as fl
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+
+"""
+Heating and evaporation of ensembles of multicomponent fuel droplets.
+
+Each droplet is a well-mixed liquid sphere (infinite liquid conductivity and
+diffusivity) in a quiescent gas. The vapor at the surface is in equilibrium
+with the liquid by Raoult's law, and the gas film is quasi-steady with
+properties at the 1/3 rule film temperature. The evaporation rate is
+
+    mdot = 4*pi*r*rho_g*D*log(1 + B_M),  B_M = Y_Fs/(1 - Y_Fs),
+
+split between the compounds in proportion to their vapor mass fractions at
+the surface, and the droplet is heated by conduction with the Stefan flow
+correction z/(exp(z) - 1), z = mdot*cp_v/(4*pi*r*k_g), where cp_v is the
+specific heat of the fuel vapor in the film. FuelLib has no ideal-gas heat
+capacity, so by default the liquid specific heat Cl at the film temperature
+stands in for the vapor, extrapolated beyond the liquid range when the film
+is hot. A vapor heat capacity can be given with cp_vapor.
+
+The states of all droplets are arrays, the mass of each compound of shape
+(num_droplets, num_compounds) and the temperature of shape (num_droplets,),
+and every droplet has its own clock and time step, so an ensemble with
+different radii, temperatures and ambient conditions is advanced together
+with vectorized property evaluations.
+
+Usage:
+    import FuelLib as fl
+    from DropletEvaporation import DropletEnsemble
+
+    fuel = fl.fuel("posf10325")
+    drops = DropletEnsemble(fuel, r=[10e-6, 20e-6], T=300.0, T_gas=800.0)
+    history = drops.solve(np.linspace(0.0, 5e-3, 51))
+"""
+
+# Universal gas constant in J/mol/K
+R_UNIVERSAL = 8.314462618
+
+
+def air_thermal_conductivity(T):
+    """
+    Thermal conductivity of air with Sutherland's law.
+
+    :meta private: k = k_0*(T/T_0)^(3/2)*(T_0 + S)/(T + S) with k_0 = 0.0241 W/m/K, T_0 = 273 K and S = 194 K (White, Viscous Fluid Flow, Table 1-3).
+
+    :param T: Temperature in Kelvin.
+    :type T: float or np.ndarray
+    :return: Thermal conductivity in W/m/K.
+    :rtype: float or np.ndarray
+    """
+    return 0.0241 * (T / 273.0) ** 1.5 * (273.0 + 194.0) / (T + 194.0)
+
+
+def vapor_specific_heat(fuel, T, cp_vapor=None):
+    """
+    Specific heat of the fuel vapor of each compound.
+
+    :meta private: Without cp_vapor, the liquid specific heat fuel.Cl is used as an approximation, since FuelLib has no ideal-gas heat capacity. It is not a vapor property, and it is extrapolated above the range of the liquid correlation at hot film temperatures.
+
+    :param fuel: Fuel of the droplets.
+    :type fuel: fl.fuel
+    :param T: Temperature in Kelvin, shape (n,).
+    :type T: np.ndarray
+    :param cp_vapor: Vapor specific heat of each compound in J/kg/K, either an array of shape (num_compounds,) or a function of T returning shape (n, num_compounds). Defaults to fuel.Cl.
+    :type cp_vapor: np.ndarray or callable, optional
+    :return: Specific heat of each compound in J/kg/K, shape (n, num_compounds).
+    :rtype: np.ndarray
+    """
+    if cp_vapor is None:
+        return fuel.Cl(T)
+    if callable(cp_vapor):
+        return cp_vapor(T)
+    return np.broadcast_to(
+        np.asarray(cp_vapor, dtype=float), (len(T), fuel.num_compounds)
+    )
+
+
+def film_transfer(
+    fuel, X, T, T_gas, p_gas, gas="air", gas_conductivity=None, cp_vapor=None
+):
+    """
+    Quasi-steady transfer through the gas film around droplets.
+
+    :meta private: The vapor at the surface follows Raoult's law, X_s = X*psat(T)/p_gas, and the film properties are evaluated at the 1/3 rule temperature T + (T_gas - T)/3 with the gas alone. The vapor specific heat is weighted by the vapor composition, see vapor_specific_heat for its default.
+
+    :param fuel: Fuel of the droplets.
+    :type fuel: fl.fuel
+    :param X: Mole fractions of the liquid at the surface, shape (num_compounds,) or (n, num_compounds).
+    :type X: np.ndarray
+    :param T: Surface temperature in Kelvin, shape (n,).
+    :type T: np.ndarray
+    :param T_gas: Temperature of the gas in Kelvin, shape (n,).
+    :type T_gas: np.ndarray
+    :param p_gas: Pressure of the gas in Pa, shape (n,).
+    :type p_gas: np.ndarray
+    :param gas: Name of the gas in fl.BATH_GASES.
+    :type gas: str, optional
+    :param gas_conductivity: Thermal conductivity of the gas in W/m/K, shape (n,). Defaults to air_thermal_conductivity at the film temperature.
+    :type gas_conductivity: np.ndarray, optional
+    :param cp_vapor: Vapor specific heat of each compound, see vapor_specific_heat.
+    :type cp_vapor: np.ndarray or callable, optional
+    :return: Mass fraction of each compound in the vapor (n, num_compounds), mass flux rho_g*D*log(1 + B_M) in kg/m/s (n,), gas thermal conductivity in W/m/K (n,) and specific heat cp_v in J/kg/K (n,) from vapor_specific_heat.
+    :rtype: tuple of np.ndarray
+    """
+    MW_gas = fl.bath_gas(gas)[2]
+
+    # Vapor at the surface in equilibrium with the liquid
+    X_s = X * fuel.psat(T) / p_gas[:, np.newaxis]
+
+    # Above the bubble point the surface is pure vapor, kept short of 1
+    X_F = np.sum(X_s, axis=1)
+    X_s = X_s * np.minimum(1.0, (1.0 - 1e-9) / X_F)[:, np.newaxis]
+    X_gas = 1.0 - np.sum(X_s, axis=1)
+    MW_s = X_s @ fuel.MW + X_gas * MW_gas
+    Y_s = X_s * fuel.MW / MW_s[:, np.newaxis]
+    Y_Fs = np.sum(Y_s, axis=1)
+    eps = fuel.mass2Y(Y_s)
+
+    # Gas film properties with the 1/3 rule
+    T_film = T + (T_gas - T) / 3.0
+    rho_g = p_gas * MW_gas / (R_UNIVERSAL * T_film)
+    D = np.sum(eps * fuel.diffusion_coeff(p_gas, T_film, gas=gas), axis=1)
+    cp_v = np.sum(eps * vapor_specific_heat(fuel, T_film, cp_vapor), axis=1)
+    if gas_conductivity is None:
+        gas_conductivity = air_thermal_conductivity(T_film)
+
+    # Spalding mass transfer number B_M = Y_Fs/(1 - Y_Fs)
+    mass_flux = rho_g * D * np.log1p(Y_Fs / (1.0 - Y_Fs))
+    return eps, mass_flux, gas_conductivity, cp_v
+
+
+class DropletEnsemble:
+    """
+    Multicomponent droplets that heat and evaporate in a gas.
+
+    :param fuel: Fuel of the droplets.
+    :type fuel: fl.fuel
+    :param r: Initial radius of each droplet in meters, shape (num_droplets,).
+    :type r: float or np.ndarray
+    :param T: Initial temperature of each droplet in Kelvin.
+    :type T: float or np.ndarray
+    :param Y: Initial mass fractions, shape (num_compounds,) or (num_droplets, num_compounds). Defaults to fuel.Y_0.
+    :type Y: np.ndarray, optional
+    :param T_gas: Temperature of the gas around each droplet in Kelvin.
+    :type T_gas: float or np.ndarray, optional
+    :param p_gas: Pressure of the gas around each droplet in Pa.
+    :type p_gas: float or np.ndarray, optional
+    :param gas: Name of the gas in fl.BATH_GASES for the diffusion coefficients and gas density.
+    :type gas: str, optional
+    :param gas_conductivity: Thermal conductivity of the gas in W/m/K. Defaults to air_thermal_conductivity at the film temperature.
+    :type gas_conductivity: float or np.ndarray, optional
+    :param cp_vapor: Vapor specific heat of each compound for the Stefan flow correction, see vapor_specific_heat. Defaults to the liquid fuel.Cl as an approximation.
+    :type cp_vapor: np.ndarray or callable, optional
+    """
+
+    def __init__(
+        self,
+        fuel,
+        r,
+        T,
+        Y=None,
+        T_gas=800.0,
+        p_gas=101325.0,
+        gas="air",
+        gas_conductivity=None,
+        cp_vapor=None,
+    ):
+        """
+        Set up the initial states of the droplets.
+
+        :param fuel: Fuel of the droplets.
+        :type fuel: fl.fuel
+        :param r: Initial radius of each droplet in meters.
+        :type r: float or np.ndarray
+        :param T: Initial temperature of each droplet in Kelvin.
+        :type T: float or np.ndarray
+        :param Y: Initial mass fractions of the droplets.
+        :type Y: np.ndarray, optional
+        :param T_gas: Temperature of the gas in Kelvin.
+        :type T_gas: float or np.ndarray, optional
+        :param p_gas: Pressure of the gas in Pa.
+        :type p_gas: float or np.ndarray, optional
+        :param gas: Name of the gas in fl.BATH_GASES.
+        :type gas: str, optional
+        :param gas_conductivity: Thermal conductivity of the gas in W/m/K.
+        :type gas_conductivity: float or np.ndarray, optional
+        :param cp_vapor: Vapor specific heat of each compound in J/kg/K.
+        :type cp_vapor: np.ndarray or callable, optional
+        :raises ValueError: If the radii are not positive or the shapes do not broadcast.
+        """
+        self.fuel = fuel
+        Y = fuel.Y_0 if Y is None else np.asarray(Y, dtype=float)
+        num_droplets = np.broadcast(np.asarray(r), np.asarray(T), Y[..., 0]).size
+        shape = (num_droplets,)
+
+        r = np.broadcast_to(np.asarray(r, dtype=float), shape)
+        if not np.all(r > 0):
+            raise ValueError("Droplet radii must be positive.")
+        self.T = np.broadcast_to(np.asarray(T, dtype=float), shape).copy()
+        Y = fuel.mass2Y(np.broadcast_to(Y, shape + (fuel.num_compounds,)))
+
+        # Gas around each droplet
+        self.T_gas = np.broadcast_to(np.asarray(T_gas, dtype=float), shape)
+        self.p_gas = np.broadcast_to(np.asarray(p_gas, dtype=float), shape)
+        self.gas = gas
+        if gas_conductivity is not None:
+            gas_conductivity = np.broadcast_to(
+                np.asarray(gas_conductivity, dtype=float), shape
+            )
+        self.gas_conductivity = gas_conductivity
+        self.cp_vapor = cp_vapor
+
+        # Mass of each compound from the mixture density
+        rho = np.sum(Y * fuel.density(self.T), axis=1)
+        self.mass = fl.droplet_volume(r)[:, np.newaxis] * rho[:, np.newaxis] * Y
+        self.initial_mass = np.sum(self.mass, axis=1)
+
+        # Clock and next time step of each droplet, zero until estimated
+        self.t = np.zeros(shape)
+        self.dt = np.zeros(shape)
+        self.evaporated = np.zeros(shape, dtype=bool)
+
+    @property
+    def num_droplets(self):
+        """Number of droplets in the ensemble."""
+        return len(self.T)
+
+    def radius(self, mass=None, T=None):
+        """
+        Radius of each droplet from the mass of its compounds.
+
+        :param mass: Mass of each compound in kg, shape (n, num_compounds). Defaults to the current states.
+        :type mass: np.ndarray, optional
+        :param T: Temperature of each droplet in Kelvin, shape (n,).
+        :type T: np.ndarray, optional
+        :return: Radius in meters, zero for evaporated droplets.
+        :rtype: np.ndarray
+        """
+        if mass is None:
+            mass, T = self.mass, self.T
+        total = np.sum(mass, axis=1)
+        Y = self.fuel.mass2Y(mass)
+        rho = np.sum(Y * self.fuel.density(T), axis=1)
+        return np.cbrt(3.0 * total / (4.0 * np.pi * np.where(total > 0, rho, 1.0)))
+
+    def rates(self, mass, T, idx=slice(None)):
+        """
+        Time derivatives of the compound masses and temperature of droplets.
+
+        :param mass: Mass of each compound in kg, shape (n, num_compounds).
+        :type mass: np.ndarray
+        :param T: Temperature of each droplet in Kelvin, shape (n,).
+        :type T: np.ndarray
+        :param idx: Indices of the droplets in the ensemble, selecting their gas conditions.
+        :type idx: slice or np.ndarray, optional
+        :return: dm/dt in kg/s of shape (n, num_compounds) and dT/dt in K/s of shape (n,).
+        :rtype: tuple of np.ndarray
+        """
+        fuel = self.fuel
+        T_gas = self.T_gas[idx]
+        r = self.radius(mass, T)
+        k_g = None if self.gas_conductivity is None else self.gas_conductivity[idx]
+        eps, mass_flux, k_g, cp_v = film_transfer(
+            fuel,
+            fuel.mass2X(mass),
+            T,
+            T_gas,
+            self.p_gas[idx],
+            self.gas,
+            k_g,
+            self.cp_vapor,
+        )
+
+        # Evaporation rate split by the vapor composition at the surface
+        mdot = 4.0 * np.pi * r * mass_flux
+        dm_dt = -mdot[:, np.newaxis] * eps
+
+        # Conduction with the Stefan flow correction, minus the latent heat
+        z = mdot * cp_v / (4.0 * np.pi * r * k_g)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            stefan = np.where(z > 1e-12, z / np.expm1(z), 1.0)
+        Q = 4.0 * np.pi * r * k_g * (T_gas - T) * stefan
+        Lv = np.sum(-dm_dt * fuel.latent_heat_vaporization(T), axis=1)
+        heat_capacity = np.sum(mass * fuel.Cl(T), axis=1)
+        dT_dt = (Q - Lv) / heat_capacity
+
+        return dm_dt, dT_dt
+
+    def advance(self, t_end, rtol=1e-4, min_mass=1e-6, max_steps=100000):
+        """
+        Advance every droplet to time t_end with adaptive steps.
+
+        :meta private: Each droplet takes Heun steps with the difference to an Euler step as the error estimate, relative to its temperature and total mass. Steps that exceed rtol are repeated with a smaller step, and the next step of each droplet is chosen from its own error.
+
+        :param t_end: Time in seconds to advance to.
+        :type t_end: float
+        :param rtol: Relative error of each step.
+        :type rtol: float, optional
+        :param min_mass: Fraction of the initial mass below which a droplet is evaporated.
+        :type min_mass: float, optional
+        :param max_steps: Maximum number of steps of the ensemble.
+        :type max_steps: int, optional
+        :raises RuntimeError: If the droplets do not reach t_end within max_steps.
+        """
+        for _ in range(max_steps):
+            active = np.flatnonzero(~self.evaporated & (self.t < t_end))
+            if len(active) == 0:
+                return
+            mass = self.mass[active]
+            T = self.T[active]
+            total = np.sum(mass, axis=1)
+            dm_dt, dT_dt = self.rates(mass, T, active)
+
+            # Initial step from the time scales of mass loss and heating
+            dt = self.dt[active]
+            new = dt == 0
+            if np.any(new):
+                with np.errstate(divide="ignore"):
+                    scale = np.minimum(
+                        total / -np.sum(dm_dt, axis=1), T / np.abs(dT_dt)
+                    )
+                dt[new] = np.sqrt(rtol) * 0.1 * scale[new]
+            dt = np.minimum(dt, t_end - self.t[active])
+
+            # Euler predictor and Heun corrector
+            mass_1 = np.maximum(mass + dt[:, np.newaxis] * dm_dt, 0.0)
+            T_1 = T + dt * dT_dt
+            dm_dt_1, dT_dt_1 = self.rates(mass_1, T_1, active)
+            mass_2 = np.maximum(mass + 0.5 * dt[:, np.newaxis] * (dm_dt + dm_dt_1), 0.0)
+            T_2 = T + 0.5 * dt * (dT_dt + dT_dt_1)
+
+            # Accept the steps within rtol and scale the next steps
+            error = np.maximum(
+                np.max(np.abs(mass_2 - mass_1), axis=1) / total,
+                np.abs(T_2 - T_1) / T,
+            )
+            error = np.where(np.isfinite(error), error, np.inf)
+            accepted = error <= rtol
+            with np.errstate(divide="ignore"):
+                factor = np.clip(0.9 * np.sqrt(rtol / error), 0.2, 2.0)
+            self.dt[active] = dt * factor
+
+            done = active[accepted]
+            self.mass[done] = mass_2[accepted]
+            self.T[done] = T_2[accepted]
+            self.t[done] += dt[accepted]
+
+            # Droplets below min_mass of their initial mass have evaporated
+            gone = done[
+                np.sum(self.mass[done], axis=1) <= min_mass * self.initial_mass[done]
+            ]
+            self.mass[gone] = 0.0
+            self.evaporated[gone] = True
+
+        raise RuntimeError(
+            f"Droplets did not reach t = {t_end} s in {max_steps} steps."
+        )
+
+    def solve(self, t_eval, **kwargs):
+        """
+        Advance the droplets through the output times and record their states.
+
+        :param t_eval: Increasing output times in seconds, shape (nt,).
+        :type t_eval: np.ndarray
+        :param kwargs: Options of advance.
+        :return: Arrays "t" (nt,), "r", "T" and "evaporated" of shape (nt, num_droplets) and "Y" of shape (nt, num_droplets, num_compounds). Evaporated droplets have zero radius and mass fractions and keep their last temperature.
+        :rtype: dict of np.ndarray
+        """
+        t_eval = np.asarray(t_eval, dtype=float)
+        history = {"r": [], "T": [], "Y": [], "evaporated": []}
+        for t in t_eval:
+            self.advance(t, **kwargs)
+            history["r"].append(self.radius())
+            history["T"].append(self.T.copy())
+            history["Y"].append(self.fuel.mass2Y(self.mass))
+            history["evaporated"].append(self.evaporated.copy())
+        history = {key: np.array(values) for key, values in history.items()}
+        history["t"] = t_eval
+        return history
+
+
+def wet_bulb_temperature(
+    fuel, X, T_gas, p_gas, gas="air", gas_conductivity=None, xtol=1e-6, cp_vapor=None
+):
+    """
+    Quasi-steady surface temperature at which conduction balances evaporation.
+
+    :meta private: Solves rho_g*D*log(1 + B_M) = k_g/cp_v*log(1 + B_T), B_T = cp_v*(T_gas - T)/Lv, with the vapor specific heat cp_v of film_transfer and the vapor-weighted latent heat Lv, by the Illinois method between the lowest melting point and the lower of T_gas and the lowest critical temperature. The log of the ratio of the two fluxes is nearly linear in T, so a few iterations suffice.
+
+    :param fuel: Fuel of the droplets.
+    :type fuel: fl.fuel
+    :param X: Mole fractions of the liquid, shape (num_compounds,).
+    :type X: np.ndarray
+    :param T_gas: Temperature of the gas in Kelvin, shape (n,).
+    :type T_gas: np.ndarray
+    :param p_gas: Pressure of the gas in Pa, shape (n,).
+    :type p_gas: np.ndarray
+    :param gas: Name of the gas in fl.BATH_GASES.
+    :type gas: str, optional
+    :param gas_conductivity: Thermal conductivity of the gas in W/m/K. Defaults to air_thermal_conductivity at the film temperature.
+    :type gas_conductivity: float or np.ndarray, optional
+    :param xtol: Tolerance of the temperature in Kelvin.
+    :type xtol: float, optional
+    :param cp_vapor: Vapor specific heat of each compound, see vapor_specific_heat.
+    :type cp_vapor: np.ndarray or callable, optional
+    :return: Surface temperature in Kelvin, shape (n,), at the upper end of the bracket if evaporation outweighs conduction there.
+    :rtype: np.ndarray
+    """
+    T_gas = np.asarray(T_gas, dtype=float)
+    p_gas = np.asarray(p_gas, dtype=float)
+    if gas_conductivity is not None:
+        gas_conductivity = np.broadcast_to(
+            np.asarray(gas_conductivity, dtype=float), T_gas.shape
+        )
+
+    def balance(T, idx):
+        """Log of the evaporative over the conductive mass flux, increasing with T."""
+        k_g = None if gas_conductivity is None else gas_conductivity[idx]
+        eps, mass_flux, k_g, cp_v = film_transfer(
+            fuel, X, T, T_gas[idx], p_gas[idx], gas, k_g, cp_vapor
+        )
+        Lv = np.sum(eps * fuel.latent_heat_vaporization(T), axis=1)
+        B_T = cp_v * (T_gas[idx] - T) / np.maximum(Lv, 1e-300)
+        conduction = k_g / cp_v * np.log1p(B_T)
+        return np.log(np.maximum(mass_flux, 1e-300) / np.maximum(conduction, 1e-300))
+
+    # Bracket below the gas temperature and the lowest critical temperature, where
+    # the latent heat of the lightest compound vanishes
+    idx = np.arange(T_gas.size)
+    b = np.minimum(T_gas, np.min(fuel.Tc)) * (1 - 1e-9)
+    a = np.minimum(np.min(fuel.Tm), b - xtol)
+    fa = balance(a, idx)
+    fb = balance(b, idx)
+    active = (fa < 0) & (fb > 0)
+    for _ in range(100):
+        idx = np.flatnonzero(active)
+        if len(idx) == 0:
+            break
+        c = b[idx] - fb[idx] * (b[idx] - a[idx]) / (fb[idx] - fa[idx])
+        fc = balance(c, idx)
+
+        # Keep the root bracketed, halving the retained end point if it repeats
+        flip = fc * fb[idx] < 0
+        a[idx[flip]], fa[idx[flip]] = b[idx[flip]], fb[idx[flip]]
+        fa[idx[~flip]] /= 2
+        active[idx] = (np.abs(c - b[idx]) > xtol) & (fc != 0)
+        b[idx], fb[idx] = c, fc
+    return b
+
+
+def evaporation_constant(
+    fuel,
+    T_gas,
+    p_gas=101325.0,
+    Y=None,
+    gas="air",
+    gas_conductivity=None,
+    cp_vapor=None,
+):
+    """
+    Evaporation constant of the d^2 law, d^2 = d_0^2 - K*t, of quasi-steady droplets.
+
+    :meta private: K = 8*rho_g*D*log(1 + B_M)/rho_l at the wet-bulb temperature of the initial composition, with the same film model as DropletEnsemble. The composition and temperature stay fixed over the lifetime, so heat-up and preferential evaporation are neglected.
+
+    :param fuel: Fuel of the droplets.
+    :type fuel: fl.fuel
+    :param T_gas: Temperature of the gas in Kelvin.
+    :type T_gas: float or np.ndarray
+    :param p_gas: Pressure of the gas in Pa, broadcast against T_gas.
+    :type p_gas: float or np.ndarray, optional
+    :param Y: Mass fractions of the liquid, shape (num_compounds,). Defaults to fuel.Y_0.
+    :type Y: np.ndarray, optional
+    :param gas: Name of the gas in fl.BATH_GASES.
+    :type gas: str, optional
+    :param gas_conductivity: Thermal conductivity of the gas in W/m/K. Defaults to air_thermal_conductivity at the film temperature.
+    :type gas_conductivity: float or np.ndarray, optional
+    :param cp_vapor: Vapor specific heat of each compound, see vapor_specific_heat.
+    :type cp_vapor: np.ndarray or callable, optional
+    :return: Evaporation constant in m^2/s, wet-bulb temperature in Kelvin and liquid density in kg/m^3, each of shape np.broadcast(T_gas, p_gas).shape.
+    :rtype: tuple of np.ndarray
+    """
+    Y = fuel.Y_0 if Y is None else np.asarray(Y, dtype=float)
+    X = fuel.Y2X(Y)
+    T_gas, p_gas = np.broadcast_arrays(
+        np.asarray(T_gas, dtype=float), np.asarray(p_gas, dtype=float)
+    )
+    shape = T_gas.shape
+    T_gas = T_gas.ravel()
+    p_gas = p_gas.ravel()
+    if gas_conductivity is not None:
+        gas_conductivity = np.broadcast_to(gas_conductivity, shape).ravel()
+
+    T_s = wet_bulb_temperature(
+        fuel, X, T_gas, p_gas, gas, gas_conductivity, cp_vapor=cp_vapor
+    )
+    mass_flux = film_transfer(
+        fuel, X, T_s, T_gas, p_gas, gas, gas_conductivity, cp_vapor
+    )[1]
+    rho_l = np.atleast_1d(fuel.mixture_density(Y, T_s))
+    K = 8.0 * mass_flux / rho_l
+    return K.reshape(shape), T_s.reshape(shape), rho_l.reshape(shape)
+
+
+def d2_lifetimes(
+    fuel, d0, T_gas, p_gas=101325.0, Y=None, bins=100, chunk_size=2**18, **kwargs
+):
+    """
+    Lifetimes and evaporation rates of many droplets with the d^2 law.
+
+    :meta private: Droplets are processed in chunks of chunk_size, and the evaporation constant is computed once for uniform gas conditions or once for each distinct (T_gas, p_gas) pair of a chunk, so the memory of the property evaluations is bounded by chunk_size*num_compounds. The cost is dominated by the number of distinct gas states rather than the number of droplets.
+
+    :param fuel: Fuel of the droplets.
+    :type fuel: fl.fuel
+    :param d0: Initial diameter of each droplet in meters, shape (N,).
+    :type d0: np.ndarray
+    :param T_gas: Temperature of the gas in Kelvin, scalar or shape (N,).
+    :type T_gas: float or np.ndarray
+    :param p_gas: Pressure of the gas in Pa, scalar or shape (N,).
+    :type p_gas: float or np.ndarray, optional
+    :param Y: Initial mass fractions of the liquid, shape (num_compounds,). Defaults to fuel.Y_0.
+    :type Y: np.ndarray, optional
+    :param bins: Number of bins or bin edges in seconds of the lifetime histogram, see np.histogram.
+    :type bins: int or np.ndarray, optional
+    :param chunk_size: Number of droplets processed at once.
+    :type chunk_size: int, optional
+    :param kwargs: Gas options of evaporation_constant (gas, gas_conductivity as a scalar, cp_vapor).
+    :return: Arrays "lifetime" in s, "evaporation_rate" (initial) in kg/s and "K" in m^2/s of shape (N,), and the lifetime "histogram" with its "bin_edges".
+    :rtype: dict of np.ndarray
+    """
+    d0 = np.asarray(d0, dtype=float).ravel()
+    uniform = np.ndim(T_gas) == 0 and np.ndim(p_gas) == 0
+    if uniform:
+        K_0, _, rho_0 = evaporation_constant(fuel, T_gas, p_gas, Y=Y, **kwargs)
+    T_gas = np.broadcast_to(np.asarray(T_gas, dtype=float), d0.shape)
+    p_gas = np.broadcast_to(np.asarray(p_gas, dtype=float), d0.shape)
+    lifetime = np.empty_like(d0)
+    rate = np.empty_like(d0)
+    K = np.empty_like(d0)
+    for begin in range(0, len(d0), chunk_size):
+        chunk = slice(begin, begin + chunk_size)
+
+        # Evaporation constant of each distinct gas state in the chunk
+        if uniform:
+            K[chunk], rho_l = K_0, rho_0
+        else:
+            states, inverse = np.unique(
+                np.stack([T_gas[chunk], p_gas[chunk]], axis=1),
+                axis=0,
+                return_inverse=True,
+            )
+            K_s, _, rho_s = evaporation_constant(
+                fuel, states[:, 0], states[:, 1], Y=Y, **kwargs
+            )
+            inverse = inverse.ravel()
+            K[chunk] = K_s[inverse]
+            rho_l = rho_s[inverse]
+
+        # tau = d0^2/K and mdot = pi/4*rho_l*K*d0 from d(pi/6*rho_l*d^3)/dt
+        lifetime[chunk] = d0[chunk] ** 2 / K[chunk]
+        rate[chunk] = 0.25 * np.pi * rho_l * K[chunk] * d0[chunk]
+
+    histogram, bin_edges = np.histogram(lifetime, bins=bins)
+    return {
+        "lifetime": lifetime,
+        "evaporation_rate": rate,
+        "K": K,
+        "histogram": histogram,
+        "bin_edges": bin_edges,
+    }
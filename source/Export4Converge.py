@@ -3,7 +3,14 @@ import sys
 import numpy as np
 import pandas as pd
 import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 import FuelLib as fl
+from ExportFormats import FORMATS, table_file, write_table, memmap_npz_member
+from ExportManifest import export_record, is_up_to_date, write_manifest
+import PropertyTable as property_table
+import PropertyFits as property_fits
+from PropertyFits import PropertyFits
 
 # Add the FuelLib directory to the Python path
 FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -29,6 +36,12 @@ Options:
         --temp_step <temp_step> (K)
         --export_dir <export_dir>
         --export_mix <export_mix>
+        --adaptive_tol <relative tolerance for adaptive temperature grids>
+        --jobs <number of processes for component export>
+        --component_file <csv or npz for a single component file>
+        --export_format <csv, npz, parquet or hdf5>
+        --force <True or False to regenerate files that are up to date>
+        --fit_rtol <relative error of polynomial fits of the component properties>
 """
 
 
@@ -139,6 +152,422 @@ class UnitConverter:
         }
 
 
+# Fitted component properties: FuelLib property to the UnitConverter label and factor
+FIT_PROPERTIES = {
+    "viscosity_dynamic": ("viscosity", "mu"),
+    "surface_tension": ("surface_tension", "surface_tension"),
+    "latent_heat_vaporization": ("heat_vaporization", "Lv"),
+    "psat": ("vapor_pressure", "P"),
+    "density": ("density", "rho"),
+    "Cl": ("specific_heat", "Cl"),
+    "thermal_conductivity": ("thermal_conductivity", "thermal_conductivity"),
+}
+
+
+def adaptive_temperature_grid(evaluate, T_lo, T_hi, tol, min_step=0.1, num_seeds=9):
+    """
+    Place temperatures so that linear interpolation of each property stays within a tolerance.
+
+    :meta private: Starting from num_seeds uniformly spaced temperatures, intervals are bisected until linear interpolation reproduces every property at the interval midpoint within the relative tolerance.
+    :meta private: Intervals narrower than 2*min_step are not bisected further, which bounds the refinement near the critical point where properties vanish with unbounded slopes.
+
+    :param evaluate: Function returning property values of shape (nprops, nT) for temperatures of shape (nT,).
+    :type evaluate: callable
+    :param T_lo: Lowest temperature (K).
+    :type T_lo: float
+    :param T_hi: Highest temperature (K).
+    :type T_hi: float
+    :param tol: Relative tolerance of linear interpolation between temperatures.
+    :type tol: float
+    :param min_step: Smallest spacing (K) between temperatures.
+    :type min_step: float, optional (default: 0.1)
+    :param num_seeds: Number of initial, uniformly spaced temperatures.
+    :type num_seeds: int, optional (default: 9)
+    :return: Increasing temperatures from T_lo to T_hi.
+    :rtype: np.ndarray
+    """
+    T = np.linspace(T_lo, T_hi, num_seeds)
+    values = np.asarray(evaluate(T))
+
+    # Only intervals with a newly added end point need to be checked
+    new = np.ones(len(T), dtype=bool)
+    while True:
+        check = (new[:-1] | new[1:]) & (np.diff(T) >= 2 * min_step)
+        if not np.any(check):
+            break
+        lo = np.flatnonzero(check)
+        T_mid = 0.5 * (T[lo] + T[lo + 1])
+        values_mid = np.asarray(evaluate(T_mid))
+
+        # Relative error of linear interpolation at the interval midpoints
+        error = np.abs(0.5 * (values[:, lo] + values[:, lo + 1]) - values_mid)
+        refine = np.any(error > tol * np.abs(values_mid), axis=0)
+        if not np.any(refine):
+            break
+
+        # Insert the midpoints of the intervals that need refinement
+        T = np.concatenate([T, T_mid[refine]])
+        values = np.concatenate([values, values_mid[:, refine]], axis=1)
+        new = np.concatenate(
+            [np.zeros(len(new), dtype=bool), np.ones(np.sum(refine), dtype=bool)]
+        )
+        order = np.argsort(T)
+        T, values, new = T[order], values[:, order], new[order]
+
+    return T
+
+
+def nearest_temp(x, base):
+    """
+    Round to nearest multiple of temp_step.
+
+    :param x: Temperature value to round.
+    :type x: float
+    :param base: Base value for rounding (temp_step).
+    :type base: float
+    :return: Rounded temperature.
+    :rtype: float
+    """
+    return base * round(x / base)
+
+
+def nearest_floor(array, value):
+    """
+    Find the largest value in the array that is less than or equal to the given value.
+
+    :param array: Array of temperature values.
+    :type array: np.ndarray
+    :param value: Reference value.
+    :type value: float
+    :return: Largest array value <= reference value.
+    :rtype: float
+    :raises ValueError: If no array value is <= reference value.
+    """
+    if np.any(array <= value):
+        return array[array <= value].max()
+    else:
+        raise ValueError(
+            f"No temperature in the array is less than or equal to the critical point {value}. Choose a lower temp_min"
+        )
+
+
+def nearest_ceil(array, value):
+    """
+    Find the smallest value in the array that is greater than or equal to the given value.
+
+    :param array: Array of temperature values.
+    :type array: np.ndarray
+    :param value: Reference value.
+    :type value: float
+    :return: Smallest array value >= reference value.
+    :rtype: float
+    :raises ValueError: If no array value is >= reference value.
+    """
+    if np.any(array >= value):
+        return array[array >= value].min()
+    else:
+        raise ValueError(
+            f"No temperature in the array is greater than or equal the freezing point {value}. Choose a higher temp_max"
+        )
+
+
+def map_jobs(task, items, jobs=1):
+    """
+    Apply a task to each item in order, with a pool of worker processes if jobs > 1.
+
+    :param task: Picklable function of one item.
+    :type task: callable
+    :param items: Items to process.
+    :type items: iterable
+    :param jobs: Number of worker processes.
+    :type jobs: int, optional (default: 1)
+    :return: Results of the task, in the order of the items.
+    :rtype: generator
+    """
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            yield from executor.map(task, items)
+    else:
+        yield from map(task, items)
+
+
+def calculate_mixture_properties(T_array, fuel):
+    """
+    Calculate mixture properties for a range of temperatures.
+
+    :param T_array: Array of temperature values.
+    :type T_array: np.ndarray
+    :param fuel: Fuel object.
+    :type fuel: fl.fuel
+    :return: Tuple of property arrays (mu, surface_tension, Lv, pv, rho, Cl, thermal_conductivity).
+    :rtype: tuple
+    """
+    # Evaluate all mixture properties in one pass over the temperatures
+    props = fuel.evaluate(
+        T_array,
+        fuel.Y_0,
+        props=[
+            "density",
+            "viscosity_dynamic",
+            "psat",
+            "surface_tension",
+            "thermal_conductivity",
+            "latent_heat_vaporization",
+            "Cl",
+        ],
+    )
+    rho = props["density"]  # kg/m^3
+    mu = props["viscosity_dynamic"]  # Pa*s
+    pv = props["psat"]  # Pa
+    surface_tension = props["surface_tension"]  # N/m
+    thermal_conductivity = props["thermal_conductivity"]  # W/m/K
+
+    # Generic mixing rules for latent heat and specific heat
+    Lv = props["latent_heat_vaporization"]  # J/kg
+    Cl = props["Cl"]  # J/kg/K
+
+    return mu, surface_tension, Lv, pv, rho, Cl, thermal_conductivity
+
+
+def calculate_component_properties(T_array, fuel, comp_idx):
+    """
+    Calculate individual component properties for a range of temperatures.
+
+    :param T_array: Array of temperature values.
+    :type T_array: np.ndarray
+    :param fuel: Fuel object.
+    :type fuel: fl.fuel
+    :param comp_idx: Index of the component.
+    :type comp_idx: int
+    :return: Tuple of property arrays (mu, surface_tension, Lv, pv, rho, Cl, thermal_conductivity).
+    :rtype: tuple
+    """
+    # Each property method evaluates the whole temperature array at once
+    rho = fuel.density(T_array, comp_idx=comp_idx)  # kg/m^3
+    mu = fuel.viscosity_dynamic(T_array, comp_idx=comp_idx)  # Pa*s
+    pv = fuel.psat(T_array, comp_idx=comp_idx)  # Pa
+    surface_tension = fuel.surface_tension(T_array, comp_idx=comp_idx)  # N/m
+    thermal_conductivity = fuel.thermal_conductivity(T_array, comp_idx=comp_idx)
+    Lv = fuel.latent_heat_vaporization(T_array, comp_idx=comp_idx)  # J/kg
+    Cl = fuel.Cl(T_array, comp_idx=comp_idx)  # J/kg/K
+
+    return mu, surface_tension, Lv, pv, rho, Cl, thermal_conductivity
+
+
+def export_properties_to_csv(file_path, data_dict, overwrite=True):
+    """
+    Export properties data to CSV file.
+
+    :param file_path: Path to the output CSV file.
+    :type file_path: str
+    :param data_dict: Dictionary containing property data.
+    :type data_dict: dict
+    :param overwrite: Whether to overwrite existing file.
+    :type overwrite: bool
+    """
+    # Create directory if it doesn't exist
+    directory = os.path.dirname(file_path)
+    os.makedirs(directory, exist_ok=True)
+
+    # Remove existing file if overwrite is True
+    if overwrite and os.path.exists(file_path):
+        os.remove(file_path)
+
+    # Create and save DataFrame
+    df = pd.DataFrame(data_dict)
+    df.to_csv(file_path, index=False)
+
+
+def calculate_component_table(comp_idx, fuel, converter, temp_step, adaptive_tol=None):
+    """
+    Calculate the property table of one component of a fuel.
+
+    :param comp_idx: Index of the component.
+    :type comp_idx: int
+    :param fuel: Fuel object.
+    :type fuel: fl.fuel
+    :param converter: Unit converter for the exported properties.
+    :type converter: UnitConverter
+    :param temp_step: Step size for temperature (K).
+    :type temp_step: float
+    :param adaptive_tol: Relative tolerance for an adaptive temperature grid.
+    :type adaptive_tol: float, optional
+    :return: Tuple of (log message, dictionary with converted properties and labels).
+    :rtype: tuple
+    """
+    compound = fuel.compounds[comp_idx]
+
+    # Get component-specific temperature limits
+    T_freeze = fuel.Tm[comp_idx]
+    T_crit = fuel.Tc[comp_idx]
+    T_min_allowed = nearest_temp(T_freeze, temp_step)
+
+    # Create temperature array up to critical temperature
+    maxtemps = np.array(
+        [
+            nearest_temp(T_crit, temp_step) - temp_step,
+            nearest_temp(T_crit, temp_step),
+            nearest_temp(T_crit, temp_step) + temp_step,
+        ]
+    )
+    T_nearest_floor = nearest_floor(maxtemps, T_crit)
+    nT = int((T_nearest_floor - T_min_allowed) / temp_step) + 1
+    T = np.linspace(T_min_allowed, T_nearest_floor, nT)
+    T = np.append(T, T_crit)
+    T_max_allowed = T_crit
+
+    # Replace the uniform grid by an adaptive grid over the same range
+    if adaptive_tol is not None:
+        T = adaptive_temperature_grid(
+            lambda T: calculate_component_properties(T, fuel, comp_idx),
+            T[0],
+            T[-1],
+            adaptive_tol,
+        )
+
+    # Calculate GCM properties for a range of temperatures
+    log = f"\nCalculating properties for {compound} over {len(T)} temperatures from {T_min_allowed} K to {T_max_allowed} K..."
+    props = calculate_component_properties(T, fuel, comp_idx)
+
+    # Create data dictionary with converted units
+    data = converter.create_data_dict(T, T_crit, *props)
+
+    return log, data
+
+
+def export_properties(file_path, data_dict):
+    """
+    Export properties data to a CSV or binary table file, see ExportFormats.
+
+    :param file_path: Path to the output file, the extension selects the format.
+    :type file_path: str
+    :param data_dict: Dictionary containing property data.
+    :type data_dict: dict
+    """
+    if file_path.endswith(".csv"):
+        export_properties_to_csv(file_path, data_dict)
+    else:
+        write_table(file_path, data_dict)
+
+
+def export_component(
+    comp_idx,
+    fuel,
+    path,
+    converter,
+    temp_step,
+    adaptive_tol=None,
+    export_format="csv",
+):
+    """
+    Calculate and export the properties of one component of a fuel.
+
+    :meta private: Runs in a worker process when export_converge is called with jobs > 1, so the log is returned instead of printed.
+
+    :param comp_idx: Index of the component.
+    :type comp_idx: int
+    :param fuel: Fuel object.
+    :type fuel: fl.fuel
+    :param path: Directory to save the component file.
+    :type path: str
+    :param converter: Unit converter for the exported properties.
+    :type converter: UnitConverter
+    :param temp_step: Step size for temperature (K).
+    :type temp_step: float
+    :param adaptive_tol: Relative tolerance for an adaptive temperature grid.
+    :type adaptive_tol: float, optional
+    :param export_format: Format of the component file, see ExportFormats.FORMATS.
+    :type export_format: str, optional
+    :return: Log messages of the export.
+    :rtype: str
+    """
+    compound = fuel.compounds[comp_idx]
+    log, data = calculate_component_table(
+        comp_idx, fuel, converter, temp_step, adaptive_tol
+    )
+
+    # Export the properties to file
+    file_name = table_file(os.path.join(path, f"{comp_idx}_{compound}"), export_format)
+    log += f"\n\nWriting properties for {compound} to {file_name}"
+    export_properties(file_name, data)
+
+    return log
+
+
+def export_component_file(file_path, fuel, tables, converter):
+    """
+    Export the property tables of all components of a fuel to a single file.
+
+    :meta private: A ".csv" file holds one long-format table with the component index and name in the first two columns.
+    :meta private: A ".npz" file holds one uncompressed array of shape (nT, nprops) per component, named "component_<index>", along with the column labels and the composition. See load_component_table.
+
+    :param file_path: Path to the output .csv or .npz file.
+    :type file_path: str
+    :param fuel: Fuel object.
+    :type fuel: fl.fuel
+    :param tables: Dictionary with converted properties and labels of each component, see calculate_component_table.
+    :type tables: list of dict
+    :param converter: Unit converter for the exported properties.
+    :type converter: UnitConverter
+    :raises ValueError: If the file extension is not .csv or .npz.
+    """
+    columns = list(tables[0].keys())
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".csv":
+        # Long-format table with one block of rows per component
+        nT = [len(data[columns[0]]) for data in tables]
+        data_dict = {
+            "Index": np.repeat(np.arange(len(tables)), nT),
+            "Component": np.repeat(fuel.compounds, nT),
+        }
+        for column in columns:
+            data_dict[column] = np.concatenate([data[column] for data in tables])
+        export_properties_to_csv(file_path, data_dict)
+    elif extension == ".npz":
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        arrays = {
+            f"component_{comp_idx}": np.column_stack([data[c] for c in columns])
+            for comp_idx, data in enumerate(tables)
+        }
+        np.savez(
+            file_path,
+            columns=np.array(columns),
+            compounds=np.array(fuel.compounds),
+            mass_fraction=fuel.Y_0,
+            mole_fraction=fuel.Y2X(fuel.Y_0),
+            molecular_weight=fuel.MW * converter.mw,
+            **arrays,
+        )
+    else:
+        raise ValueError(
+            f"Component file must be a .csv or .npz file, got '{file_path}'"
+        )
+
+
+def load_component_table(file_path, component):
+    """
+    Memory-map the property table of one component from a consolidated .npz file.
+
+    :meta private: Only the header of the requested member is read, the table itself is mapped from disk.
+
+    :param file_path: Path to a .npz file written by export_converge with component_file="npz".
+    :type file_path: str
+    :param component: Index or name of the component.
+    :type component: int or str
+    :return: Property table of shape (nT, nprops), columns labeled by the "columns" array of the file.
+    :rtype: np.memmap
+    :raises KeyError: If the component is not in the file.
+    """
+    if isinstance(component, str):
+        with np.load(file_path) as data:
+            compounds = [str(compound) for compound in data["compounds"]]
+        if component not in compounds:
+            raise KeyError(f"Component '{component}' not found in {file_path}")
+        component = compounds.index(component)
+
+    return memmap_npz_member(file_path, f"component_{component}")
+
+
 def export_converge(
     fuel,
     path=os.path.join(FUELLIB_DIR, "exportData"),
@@ -147,6 +576,12 @@ def export_converge(
     temp_max=1000,
     temp_step=10,
     export_mix=False,
+    adaptive_tol=None,
+    jobs=1,
+    component_file=None,
+    export_format="csv",
+    force=False,
+    fit_rtol=None,
 ):
     """
     Export mixture fuel properties to csv files for Converge simulations.
@@ -172,6 +607,24 @@ def export_converge(
     :param export_mix: Whether to export individual component or mixture properties.
     :type export_mix: bool, optional (default: False)
 
+    :param adaptive_tol: Relative tolerance for linear interpolation between exported temperatures. Replaces the uniform temp_step grid with an adaptive grid over the same range.
+    :type adaptive_tol: float, optional (default: None)
+
+    :param jobs: Number of worker processes that export component files concurrently.
+    :type jobs: int, optional (default: 1)
+
+    :param component_file: Write all component tables to a single "csv" (long format) or "npz" file instead of one CSV file per component.
+    :type component_file: str, optional (default: None)
+
+    :param export_format: Format of the exported tables: "csv" or the binary "npz", "parquet" or "hdf5" (see ExportFormats).
+    :type export_format: str, optional (default: "csv")
+
+    :param force: Regenerate the files even if the manifest of the previous export shows that their inputs and parameters are unchanged.
+    :type force: bool, optional (default: False)
+
+    :param fit_rtol: Also export polynomial fits of the component properties with this maximum relative error, see PropertyFits. Only for component exports.
+    :type fit_rtol: float, optional (default: None)
+
     :return: None
     :rtype: None
 
@@ -196,73 +649,85 @@ def export_converge(
     if temp_step <= 0:
         raise ValueError(f"temp_step must be positive, got {temp_step}")
 
+    if adaptive_tol is not None and adaptive_tol <= 0:
+        raise ValueError(f"adaptive_tol must be positive, got {adaptive_tol}")
+
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+
+    if export_format not in FORMATS:
+        raise ValueError(
+            f"export_format must be one of {list(FORMATS)}, got '{export_format}'"
+        )
+
+    if component_file is not None and component_file not in ["csv", "npz"]:
+        raise ValueError(
+            f"component_file must be 'csv' or 'npz', got '{component_file}'"
+        )
+
+    if fit_rtol is not None and export_mix:
+        raise ValueError("fit_rtol is only supported for component exports.")
+
     # Ensure output directory exists
     if not os.path.exists(path):
         os.makedirs(path)
 
     if export_mix:
         # Export mixture properties only
-        file_name = os.path.join(path, f"mixturePropsGCM_{fuel.name}.csv")
-        components = [fuel.name]
+        file_name = table_file(
+            os.path.join(path, f"mixturePropsGCM_{fuel.name}"), export_format
+        )
+        outputs = [file_name]
+        manifest_file = f"{file_name}.manifest.json"
     else:
         # Export individual component properties and composition
         path = os.path.join(path, fuel.name)
-        components = fuel.compounds
+        if component_file is None:
+            outputs = [
+                table_file(os.path.join(path, f"{i}_{compound}"), export_format)
+                for i, compound in enumerate(fuel.compounds)
+            ]
+        else:
+            outputs = [
+                os.path.join(path, f"componentPropsGCM_{fuel.name}.{component_file}")
+            ]
+        composition_file = table_file(
+            os.path.join(path, f"composition_{fuel.name}"), export_format
+        )
+        if component_file != "npz":
+            outputs.append(composition_file)
+        fits_file = table_file(
+            os.path.join(path, f"propertyFitsGCM_{fuel.name}"), export_format
+        )
+        if fit_rtol is not None:
+            outputs.append(fits_file)
+        manifest_file = os.path.join(path, f"components_{fuel.name}.manifest.json")
+
+    # Skip the export if the files are current
+    record = export_record(
+        fuel,
+        dict(
+            units=units,
+            temp_min=temp_min,
+            temp_max=temp_max,
+            temp_step=temp_step,
+            export_mix=export_mix,
+            adaptive_tol=adaptive_tol,
+            component_file=component_file,
+            export_format=export_format,
+            fit_rtol=fit_rtol,
+        ),
+        code_files=[__file__, property_table.__file__, property_fits.__file__],
+    )
+    if not force and is_up_to_date(manifest_file, record, outputs):
+        print(
+            f"\n{manifest_file} is up to date, skipping export (use force to regenerate)."
+        )
+        return
 
     # Initialize unit converter
     converter = UnitConverter(units)
 
-    def nearest_temp(x, base=temp_step):
-        """
-        Round to nearest multiple of temp_step.
-
-        :param x: Temperature value to round.
-        :type x: float
-        :param base: Base value for rounding (temp_step).
-        :type base: float
-        :return: Rounded temperature.
-        :rtype: float
-        """
-        return base * round(x / base)
-
-    def nearest_floor(array, value):
-        """
-        Find the largest value in the array that is less than or equal to the given value.
-
-        :param array: Array of temperature values.
-        :type array: np.ndarray
-        :param value: Reference value.
-        :type value: float
-        :return: Largest array value <= reference value.
-        :rtype: float
-        :raises ValueError: If no array value is <= reference value.
-        """
-        if np.any(array <= value):
-            return array[array <= value].max()
-        else:
-            raise ValueError(
-                f"No temperature in the array is less than or equal to the critical point {value}. Choose a lower temp_min"
-            )
-
-    def nearest_ceil(array, value):
-        """
-        Find the smallest value in the array that is greater than or equal to the given value.
-
-        :param array: Array of temperature values.
-        :type array: np.ndarray
-        :param value: Reference value.
-        :type value: float
-        :return: Smallest array value >= reference value.
-        :rtype: float
-        :raises ValueError: If no array value is >= reference value.
-        """
-        if np.any(array >= value):
-            return array[array >= value].min()
-        else:
-            raise ValueError(
-                f"No temperature in the array is greater than or equal the freezing point {value}. Choose a higher temp_max"
-            )
-
     def validate_temperature_range(T_array, T_freeze, T_crit, is_mixture=True):
         """
         Validate and adjust temperature range based on freezing and critical temperatures.
@@ -278,7 +743,7 @@ def export_converge(
         :return: Tuple of (T_min_allowed, T_max_allowed, adjusted_T_array).
         :rtype: tuple
         """
-        T_min_allowed = nearest_temp(T_freeze)
+        T_min_allowed = nearest_temp(T_freeze, temp_step)
         T_max_allowed = T_crit
 
         # Handle minimum temperature warnings
@@ -317,100 +782,6 @@ def export_converge(
 
         return T_min_allowed, T_max_allowed, adjusted_T
 
-    def calculate_mixture_properties(T_array, fuel):
-        """
-        Calculate mixture properties for a range of temperatures.
-
-        :param T_array: Array of temperature values.
-        :type T_array: np.ndarray
-        :param fuel: Fuel object.
-        :type fuel: fl.fuel
-        :return: Tuple of property arrays (mu, surface_tension, Lv, pv, rho, Cl, thermal_conductivity).
-        :rtype: tuple
-        """
-        # Initialize property arrays
-        mu = np.zeros_like(T_array)
-        surface_tension = np.zeros_like(T_array)
-        Lv = np.zeros_like(T_array)
-        pv = np.zeros_like(T_array)
-        rho = np.zeros_like(T_array)
-        Cl = np.zeros_like(T_array)
-        thermal_conductivity = np.zeros_like(T_array)
-
-        for k, Temp in enumerate(T_array):
-            Y_li = fuel.Y_0
-            X_li = fuel.Y2X(Y_li)
-
-            # Standard mixing rules for properties
-            rho[k] = fuel.mixture_density(Y_li, Temp)  # kg/m^3
-            mu[k] = fuel.mixture_dynamic_viscosity(Y_li, Temp)  # Pa*s
-            pv[k] = fuel.mixture_vapor_pressure(Y_li, Temp)  # Pa
-            surface_tension[k] = fuel.mixture_surface_tension(Y_li, Temp)  # N/m
-            thermal_conductivity[k] = fuel.mixture_thermal_conductivity(Y_li, Temp)
-
-            # Generic mixing rules for latent heat and specific heat
-            Lv[k] = fl.mixing_rule(fuel.latent_heat_vaporization(Temp), X_li)  # J/kg
-            Cl[k] = fl.mixing_rule(fuel.Cl(Temp), X_li)  # J/kg/K
-
-        return mu, surface_tension, Lv, pv, rho, Cl, thermal_conductivity
-
-    def calculate_component_properties(T_array, fuel, comp_idx):
-        """
-        Calculate individual component properties for a range of temperatures.
-
-        :param T_array: Array of temperature values.
-        :type T_array: np.ndarray
-        :param fuel: Fuel object.
-        :type fuel: fl.fuel
-        :param comp_idx: Index of the component.
-        :type comp_idx: int
-        :return: Tuple of property arrays (mu, surface_tension, Lv, pv, rho, Cl, thermal_conductivity).
-        :rtype: tuple
-        """
-        # Initialize property arrays
-        mu = np.zeros_like(T_array)
-        surface_tension = np.zeros_like(T_array)
-        Lv = np.zeros_like(T_array)
-        pv = np.zeros_like(T_array)
-        rho = np.zeros_like(T_array)
-        Cl = np.zeros_like(T_array)
-        thermal_conductivity = np.zeros_like(T_array)
-
-        for k, Temp in enumerate(T_array):
-            rho[k] = fuel.density(Temp, comp_idx=comp_idx)  # kg/m^3
-            mu[k] = fuel.viscosity_dynamic(Temp, comp_idx=comp_idx)  # Pa*s
-            pv[k] = fuel.psat(Temp, comp_idx=comp_idx)  # Pa
-            surface_tension[k] = fuel.surface_tension(Temp, comp_idx=comp_idx)  # N/m
-            thermal_conductivity[k] = fuel.thermal_conductivity(Temp, comp_idx=comp_idx)
-            Lv[k] = fuel.latent_heat_vaporization(Temp, comp_idx=comp_idx)  # J/kg
-            Cl[k] = fuel.Cl(Temp, comp_idx=comp_idx)  # J/kg/K
-
-        return mu, surface_tension, Lv, pv, rho, Cl, thermal_conductivity
-
-    def export_properties_to_csv(file_path, data_dict, overwrite=True):
-        """
-        Export properties data to CSV file.
-
-        :param file_path: Path to the output CSV file.
-        :type file_path: str
-        :param data_dict: Dictionary containing property data.
-        :type data_dict: dict
-        :param overwrite: Whether to overwrite existing file.
-        :type overwrite: bool
-        """
-        # Create directory if it doesn't exist
-        directory = os.path.dirname(file_path)
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-
-        # Remove existing file if overwrite is True
-        if overwrite and os.path.exists(file_path):
-            os.remove(file_path)
-
-        # Create and save DataFrame
-        df = pd.DataFrame(data_dict)
-        df.to_csv(file_path, index=False)
-
     if export_mix:
         # Vector of evenly spaced temperatures
         nT = int((temp_max - temp_min) / temp_step) + 1
@@ -432,70 +803,56 @@ def export_converge(
             T, T_freeze, T_crit, is_mixture=True
         )
 
-    for comp_idx, compound in enumerate(components):
-        if not export_mix:
-            # Get component-specific temperature limits
-            T_freeze = fuel.Tm[comp_idx]
-            T_crit = fuel.Tc[comp_idx]
-            T_min_allowed = nearest_temp(T_freeze)
-
-            # Create temperature array up to critical temperature
-            maxtemps = np.array(
-                [
-                    nearest_temp(T_crit) - temp_step,
-                    nearest_temp(T_crit),
-                    nearest_temp(T_crit) + temp_step,
-                ]
+        # Replace the uniform grid by an adaptive grid over the same range
+        if adaptive_tol is not None:
+            T = adaptive_temperature_grid(
+                lambda T: calculate_mixture_properties(T, fuel),
+                T[0],
+                T[-1],
+                adaptive_tol,
             )
-            T_nearest_floor = nearest_floor(maxtemps, T_crit)
-            nT = int((T_nearest_floor - T_min_allowed) / temp_step) + 1
-            T = np.linspace(T_min_allowed, T_nearest_floor, nT)
-            T = np.append(T, T_crit)
-            T_max_allowed = T_crit
+
         # Calculate GCM properties for a range of temperatures
-        comp_text = "" if export_mix else f"for {compound}"
         print(
-            f"\nCalculating properties {comp_text} over {len(T)} temperatures from {T_min_allowed} K to {T_max_allowed} K..."
+            f"\nCalculating properties  over {len(T)} temperatures from {T_min_allowed} K to {T_max_allowed} K..."
         )
+        props = calculate_mixture_properties(T, fuel)
 
-        if export_mix:
-            (
-                mu,
-                surface_tension,
-                Lv,
-                pv,
-                rho,
-                Cl,
-                thermal_conductivity,
-            ) = calculate_mixture_properties(T, fuel)
-        else:
-            (
-                mu,
-                surface_tension,
-                Lv,
-                pv,
-                rho,
-                Cl,
-                thermal_conductivity,
-            ) = calculate_component_properties(T, fuel, comp_idx)
-
-        # Create data dictionary with converted units
-        data = converter.create_data_dict(
-            T, T_crit, mu, surface_tension, Lv, pv, rho, Cl, thermal_conductivity
+        # Create data dictionary with converted units and export to CSV file
+        data = converter.create_data_dict(T, T_crit, *props)
+        print(f"\nWriting mixture properties to {file_name}")
+        export_properties(file_name, data)
+    else:
+        # Export each component, optionally with a pool of worker processes
+        options = dict(
+            fuel=fuel,
+            converter=converter,
+            temp_step=temp_step,
+            adaptive_tol=adaptive_tol,
         )
-
-        # Export the properties to CSV file
-        if export_mix:
-            print(f"\nWriting mixture properties to {file_name}")
+        if component_file is None:
+            task = partial(
+                export_component, path=path, export_format=export_format, **options
+            )
         else:
-            file_name = os.path.join(path, f"{comp_idx}_{compound}.csv")
-            print(f"\nWriting properties for {compound} to {file_name}")
-
-        export_properties_to_csv(file_name, data)
-
-    if not export_mix:
-        # Also export the initial mass fractions
-        composition_file = os.path.join(path, f"composition_{fuel.name}.csv")
+            task = partial(calculate_component_table, **options)
+        tables = []
+        for result in map_jobs(task, range(fuel.num_compounds), jobs):
+            if component_file is None:
+                print(result)
+            else:
+                log, data = result
+                print(log)
+                tables.append(data)
+
+        # Write all component tables to a single file
+        if component_file is not None:
+            file_name = outputs[0]
+            print(f"\nWriting properties for all components to {file_name}")
+            export_component_file(file_name, fuel, tables, converter)
+
+    # Also export the initial mass fractions, which npz component files contain
+    if not export_mix and component_file != "npz":
         print(f"\nWriting mass fractions for {fuel.name} to {composition_file}")
         composition_data = {
             "Index": range(len(fuel.compounds)),
@@ -504,7 +861,25 @@ def export_converge(
             "Mole Fraction": fuel.Y2X(fuel.Y_0),
             converter.labels["molecular_weight"]: fuel.MW * converter.mw,
         }
-        export_properties_to_csv(composition_file, composition_data)
+        export_properties(composition_file, composition_data)
+
+    # Polynomial fits of the component properties in the exported units
+    if fit_rtol is not None:
+        print(f"\nWriting property fits for {fuel.name} to {fits_file}")
+        fits = PropertyFits(fuel, props=list(FIT_PROPERTIES), rtol=fit_rtol)
+        fits_data = fits.coefficient_table(
+            labels={
+                prop: converter.labels[label]
+                for prop, (label, _) in FIT_PROPERTIES.items()
+            },
+            scales={
+                prop: getattr(converter, factor)
+                for prop, (_, factor) in FIT_PROPERTIES.items()
+            },
+        )
+        export_properties(fits_file, fits_data)
+
+    write_manifest(manifest_file, record, outputs)
 
 
 def validate_fuel_files(fuel_name, fuel_data_dir):
@@ -559,6 +934,24 @@ def main():
     :param --export_mix: Whether to export individual component or mixture properties.
     :type --export_mix: bool, optional (default: False)
 
+    :param --adaptive_tol: Relative tolerance for an adaptive temperature grid instead of temp_step.
+    :type --adaptive_tol: float, optional (default: None)
+
+    :param --jobs: Number of processes that export component files concurrently.
+    :type --jobs: int, optional (default: 1)
+
+    :param --component_file: Write all component tables to a single csv or npz file.
+    :type --component_file: str, optional (default: None)
+
+    :param --export_format: Format of the exported tables (csv, npz, parquet or hdf5).
+    :type --export_format: str, optional (default: csv)
+
+    :param --force: Regenerate the files even if their inputs and options are unchanged (True or False). Default is False.
+    :type --force: bool, optional
+
+    :param --fit_rtol: Also export polynomial fits of the component properties with this maximum relative error. Default is None.
+    :type --fit_rtol: float, optional
+
     :raises FileNotFoundError: If required files for the specified fuel are not found.
     """
 
@@ -628,6 +1021,56 @@ def main():
         help="Option to export mixture properties of the fuel (True or False, default: False).",
     )
 
+    # Optional argument for adaptive temperature grids
+    parser.add_argument(
+        "--adaptive_tol",
+        type=float,
+        default=None,
+        help="Relative tolerance of linear interpolation between exported temperatures. Places temperatures adaptively instead of using temp_step (optional, default: None).",
+    )
+
+    # Optional argument for parallel component export
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes that export component files concurrently (optional, default: 1).",
+    )
+
+    # Optional argument for a single component file
+    parser.add_argument(
+        "--component_file",
+        choices=["csv", "npz"],
+        default=None,
+        help="Write all component tables to a single long-format csv or npz file instead of one file per component (optional, default: None).",
+    )
+
+    # Optional argument for the table format
+    parser.add_argument(
+        "--export_format",
+        choices=list(FORMATS),
+        default="csv",
+        help="Format of the exported tables, binary formats keep full precision (optional, default: csv).",
+    )
+
+    # Optional argument to regenerate files that are up to date
+    parser.add_argument(
+        "--force",
+        type=lambda x: str(x).lower() in ["true", "1"],
+        nargs="?",
+        const=True,
+        default=False,
+        help="Regenerate the files even if their inputs and options are unchanged (True or False, default: False).",
+    )
+
+    # Optional argument for polynomial fits of the component properties
+    parser.add_argument(
+        "--fit_rtol",
+        type=float,
+        default=None,
+        help="Also export polynomial fits of the component properties with this relative error (optional, default: None).",
+    )
+
     # Parse arguments
     args = parser.parse_args()
     fuel_name = args.fuel_name
@@ -638,6 +1081,12 @@ def main():
     temp_step = args.temp_step
     export_dir = args.export_dir
     export_mix = args.export_mix
+    adaptive_tol = args.adaptive_tol
+    jobs = args.jobs
+    component_file = args.component_file
+    export_format = args.export_format
+    force = args.force
+    fit_rtol = args.fit_rtol
 
     # Print the parsed arguments
     print(f"Preparing to export mixture properties:")
@@ -647,7 +1096,10 @@ def main():
     print(f"    Units: {units}")
     print(f"    Minimum temperature: {temp_min} K")
     print(f"    Maximum temperature: {temp_max} K")
-    print(f"    Temperature step size: {temp_step} K")
+    if adaptive_tol is not None:
+        print(f"    Adaptive temperature tolerance: {adaptive_tol}")
+    else:
+        print(f"    Temperature step size: {temp_step} K")
     print(f"    Export directory: {export_dir}")
     print(f"    Fuel data directory: {fuel_data_dir}")
 
@@ -675,6 +1127,12 @@ def main():
         temp_max=temp_max,
         temp_step=temp_step,
         export_mix=export_mix,
+        adaptive_tol=adaptive_tol,
+        jobs=jobs,
+        component_file=component_file,
+        export_format=export_format,
+        force=force,
+        fit_rtol=fit_rtol,
     )
 
     print("\nExport completed successfully!")
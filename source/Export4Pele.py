@@ -1,9 +1,11 @@
 import os
 import sys
+import numpy as np
 import pandas as pd
 import argparse
 import subprocess
 from datetime import datetime
+from functools import lru_cache
 from scipy import stats as st
 import FuelLib as fl
 
@@ -12,6 +14,12 @@ FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
 if FUELLIB_DIR not in sys.path:
     sys.path.append(FUELLIB_DIR)
 from paths import *
+from ExportFormats import FORMATS, table_file, write_table, write_text_atomic
+from ExportManifest import export_record, is_up_to_date, write_manifest
+import PropertyTable as property_table
+import PropertyFits as property_fits
+from PropertyTable import PropertyTable
+from PropertyFits import PropertyFits
 
 """
 Script that exports critical properties and initial mass fraction data
@@ -35,8 +43,15 @@ Options:
         --export_mix <True or False to export mixture properties of fuel>
         --export_mix_name <name the mixture if different than fuel_name>
         --fuel_data_dir <directory where fuel data files are located>
-        --liq_prop_model <gcm or mp>
+        --liq_prop_model <gcm, mp, table or fit>
         --psat_antoine <True or False for Antoine coefficients in MP model>
+        --table_temp_min <lowest temperature of the property tables> (K)
+        --table_temp_max <highest temperature of the property tables> (K)
+        --table_num_temps <number of temperatures in the property tables>
+        --table_rtol <relative interpolation error of the property tables>
+        --fit_rtol <relative error of the polynomial fits of the fit model>
+        --export_format <inp, csv, npz, parquet or hdf5>
+        --force <True or False to regenerate files that are up to date>
 """
 
 
@@ -74,6 +89,10 @@ class UnitConverter:
             self.Vm = 1e6  # m^3/mol to cm^3/mol
             self.Lv = 1e4  # J/kg to erg/g
             self.P = 1e1  # Pa to dyne/cm^2
+            self.rho = 1e-3  # kg/m^3 to g/cm^3
+            self.mu = 1e1  # Pa*s to g/cm/s
+            self.lambda_ = 1e5  # W/m/K to erg/s/cm/K
+            self.sigma = 1e3  # N/m to dyne/cm
         else:
             # MKS units (no conversion)
             self.MW = 1.0
@@ -81,12 +100,19 @@ class UnitConverter:
             self.Vm = 1.0
             self.Lv = 1.0
             self.P = 1.0
+            self.rho = 1.0
+            self.mu = 1.0
+            self.lambda_ = 1.0
+            self.sigma = 1.0
 
 
+@lru_cache(maxsize=None)
 def get_git_info():
     """
     Get git commit hash and remote URL for file header.
 
+    :meta private: The result is cached, so batch exports run git only once per process.
+
     :return: Tuple containing git commit hash and remote URL.
     :rtype: tuple[str, str]
     """
@@ -111,13 +137,36 @@ def get_git_info():
     return git_commit, git_remote
 
 
+# Properties of the table and fit models: FuelLib property to the Pele name,
+# the unit conversion factor of UnitConverter and the units in MKS and CGS
+TABLE_PROPERTIES = {
+    "density": ("rho", "rho", ["kg/m^3", "g/cm^3"]),
+    "viscosity_dynamic": ("mu", "mu", ["Pa*s", "g/cm/s"]),
+    "psat": ("psat", "P", ["Pa", "dyne/cm^2"]),
+    "latent_heat_vaporization": ("latent", "Lv", ["J/kg", "erg/g"]),
+    "Cl": ("cp", "Cp", ["J/kg/K", "erg/g/K"]),
+    "thermal_conductivity": ("lambda", "lambda_", ["W/m/K", "erg/s/cm/K"]),
+    "surface_tension": ("sigma", "sigma", ["N/m", "dyne/cm"]),
+}
+
+# Name of each liquid property model in the exported file names
+MODEL_NAMES = {"gcm": "GCM", "mp": "MP", "table": "Table", "fit": "Fit"}
+
+# Description of each compound family in the input file
+FAMILY_NAMES = {
+    0: "saturated hydrocarbons",
+    1: "aromatics",
+    2: "cycloparaffins",
+}
+
+
 def get_filename(fuel_name, liq_prop_model, export_mix, path):
     """
     Generate appropriate filename based on parameters.
 
     :param fuel_name: Name of the fuel.
     :type fuel_name: str
-    :param liq_prop_model: Liquid property model ('gcm' or 'mp').
+    :param liq_prop_model: Liquid property model ('gcm', 'mp', 'table' or 'fit').
     :type liq_prop_model: str
     :param export_mix: Whether exporting mixture properties.
     :type export_mix: bool
@@ -126,16 +175,11 @@ def get_filename(fuel_name, liq_prop_model, export_mix, path):
     :return: Full path to output file.
     :rtype: str
     """
-    if liq_prop_model.lower() == "gcm":
-        if not export_mix:
-            return os.path.join(path, f"sprayPropsGCM_{fuel_name}.inp")
-        else:
-            return os.path.join(path, f"sprayPropsGCM_mixture_{fuel_name}.inp")
-    else:  # mp method
-        if not export_mix:
-            return os.path.join(path, f"sprayPropsMP_{fuel_name}.inp")
-        else:
-            return os.path.join(path, f"sprayPropsMP_mixture_{fuel_name}.inp")
+    model = MODEL_NAMES[liq_prop_model.lower()]
+    if not export_mix:
+        return os.path.join(path, f"sprayProps{model}_{fuel_name}.inp")
+    else:
+        return os.path.join(path, f"sprayProps{model}_mixture_{fuel_name}.inp")
 
 
 def create_individual_compounds_dataframe(fuel, compound_names, converter):
@@ -254,6 +298,13 @@ def export_pele(
     export_mix_name=None,
     liq_prop_model="gcm",
     psat_antoine=True,
+    export_format="inp",
+    force=False,
+    table_temp_min=None,
+    table_temp_max=None,
+    table_num_temps=257,
+    table_rtol=None,
+    fit_rtol=1e-4,
 ):
     """
     Export fuel properties to input file for Pele simulations.
@@ -279,12 +330,33 @@ def export_pele(
     :param export_mix_name: Name the mixture if different than fuel_name.
     :type export_mix_name: str, optional (default: None)
 
-    :param liq_prop_model: Model for liquid properties. Options are "gcm" (default) or "mp".
+    :param liq_prop_model: Model for liquid properties. Options are "gcm" (default), "mp", "table" for property tables on a uniform temperature grid or "fit" for polynomial fits of each compound.
     :type liq_prop_model: str, optional (default: "gcm")
 
     :param psat_antoine: Use Antoine coefficients for vapor pressure in MP model (True or False). Default is True.
     :type psat_antoine: bool, optional
 
+    :param export_format: Format of the exported file. "inp" writes the Pele input file, the table formats ("csv", "npz", "parquet" or "hdf5") write the same properties with one row per compound. For the table and fit models, the table formats write the property tables or fit coefficients to a companion file of the input file instead.
+    :type export_format: str, optional (default: "inp")
+
+    :param force: Regenerate the file even if the manifest of the previous export shows that its inputs and parameters are unchanged.
+    :type force: bool, optional (default: False)
+
+    :param table_temp_min: Lowest temperature (K) of the property tables of the table model. Defaults to the lowest melting point.
+    :type table_temp_min: float, optional (default: None)
+
+    :param table_temp_max: Highest temperature (K) of the property tables of the table model. Defaults to PropertyTable.TR_MAX times the lowest critical temperature.
+    :type table_temp_max: float, optional (default: None)
+
+    :param table_num_temps: Number of temperatures in the property tables of the table model.
+    :type table_num_temps: int, optional (default: 257)
+
+    :param table_rtol: Maximum relative error of linear interpolation in the property tables. The number of temperatures is increased until it is met.
+    :type table_rtol: float, optional (default: None)
+
+    :param fit_rtol: Maximum relative error of the polynomial fits of the fit model, which sets the degree of each fit.
+    :type fit_rtol: float, optional (default: 1e-4)
+
     :return: None
     :rtype: None
 
@@ -295,9 +367,20 @@ def export_pele(
     if not hasattr(fuel, "compounds") or not hasattr(fuel, "Y_0"):
         raise TypeError("fuel parameter must be a valid FuelLib fuel object")
 
-    if liq_prop_model.lower() not in ["gcm", "mp"]:
+    if liq_prop_model.lower() not in MODEL_NAMES:
+        raise ValueError(
+            f"liq_prop_model must be one of {list(MODEL_NAMES)}, got '{liq_prop_model}'"
+        )
+    is_table = liq_prop_model.lower() == "table"
+    is_fit = liq_prop_model.lower() == "fit"
+    if is_fit and export_mix:
+        raise ValueError(
+            "The fit model fits the properties of each compound and cannot export a mixture."
+        )
+
+    if export_format != "inp" and export_format not in FORMATS:
         raise ValueError(
-            f"liq_prop_model must be 'gcm' or 'mp', got '{liq_prop_model}'"
+            f"export_format must be 'inp' or one of {list(FORMATS)}, got '{export_format}'"
         )
 
     # Initialize unit converter (also validates units)
@@ -309,6 +392,39 @@ def export_pele(
 
     # Generate output filename
     file_name = get_filename(fuel.name, liq_prop_model, export_mix, path)
+    companion_file = None
+    if export_format != "inp" and (is_table or is_fit):
+        companion_file = table_file(os.path.splitext(file_name)[0], export_format)
+    elif export_format != "inp":
+        file_name = table_file(os.path.splitext(file_name)[0], export_format)
+    outputs = [file_name] if companion_file is None else [file_name, companion_file]
+
+    # Skip the export if the file is current
+    manifest_file = f"{file_name}.manifest.json"
+    record = export_record(
+        fuel,
+        dict(
+            units=units,
+            dep_fuel_names=dep_fuel_names,
+            use_pp_keys=use_pp_keys,
+            export_mix=export_mix,
+            export_mix_name=export_mix_name,
+            liq_prop_model=liq_prop_model,
+            psat_antoine=psat_antoine,
+            export_format=export_format,
+            table_temp_min=table_temp_min,
+            table_temp_max=table_temp_max,
+            table_num_temps=table_num_temps,
+            table_rtol=table_rtol,
+            fit_rtol=fit_rtol,
+        ),
+        code_files=[__file__, property_table.__file__, property_fits.__file__],
+    )
+    if not force and is_up_to_date(manifest_file, record, outputs):
+        print(
+            f"\n{file_name} is up to date, skipping export (use force to regenerate)."
+        )
+        return
 
     # Check if PelePhysics keys are available
     if use_pp_keys:
@@ -389,6 +505,52 @@ def export_pele(
             "Lv_stp",
         ]
 
+    elif is_table:
+        prop_names = ["MW", "Tc", "Tb"]
+
+        # Tabulate the properties for linear interpolation on a uniform grid
+        table = PropertyTable(
+            fuel,
+            Y=fuel.Y_0 if export_mix else None,
+            props=list(TABLE_PROPERTIES),
+            T_min=table_temp_min,
+            T_max=table_temp_max,
+            nT=table_num_temps,
+            rtol=table_rtol,
+            interpolation="linear",
+        )
+        print(
+            f"Tabulated {len(TABLE_PROPERTIES)} properties at {len(table.T)} "
+            f"temperatures from {table.T_min:.2f} K to {table.T_max:.2f} K."
+        )
+
+        # Column i of each table and its interpolation error belong to compound i
+        kind = "mixture" if export_mix else "compound"
+        table_values = {}
+        table_errors = {}
+        for prop, (_, factor, _) in TABLE_PROPERTIES.items():
+            begin, end = table.columns[f"{kind}/{prop}"]
+            values = table.values[:, begin:end]
+            if prop in PropertyTable.LOG_PROPERTIES:
+                values = np.exp(values)
+            table_values[prop] = values * getattr(converter, factor)
+            table_errors[prop] = table.column_errors[begin:end]
+
+    elif is_fit:
+        prop_names = ["MW", "Tc", "Tb"]
+
+        # Fit the properties of each compound with the lowest degree that meets fit_rtol
+        fits = PropertyFits(fuel, props=list(TABLE_PROPERTIES), rtol=fit_rtol)
+        scales = {
+            prop: getattr(converter, factor)
+            for prop, (_, factor, _) in TABLE_PROPERTIES.items()
+        }
+        degrees = np.hstack(list(fits.degrees.values()))
+        print(
+            f"Fitted {len(TABLE_PROPERTIES)} properties with polynomials of degree "
+            f"{degrees.min()} to {degrees.max()}."
+        )
+
     else:  # mp method
         prop_names = ["MW", "Tc", "Tb", "Lv_stp", "Cp_stp", "rho"]
         if psat_antoine:
@@ -421,6 +583,24 @@ def export_pele(
             df["psat_C"] = psat_C
             df["psat_D"] = psat_D
 
+    # Write the properties as a table with one row per compound
+    if export_format != "inp" and companion_file is None:
+        data_dict = {
+            "Compound": df["Compound"].to_numpy(dtype=str),
+            "Y_0": df["Y_0"].to_numpy(),
+            "dep_fuel_species": list(dep_fuel_names),
+        }
+        for prop in prop_names:
+            if prop == "psat":
+                for coeff in ["psat_A", "psat_B", "psat_C", "psat_D"]:
+                    data_dict[coeff] = df[coeff].to_numpy()
+            else:
+                data_dict[prop] = df[prop].to_numpy()
+        print(f"Writing properties to {file_name}.")
+        write_table(file_name, data_dict)
+        write_manifest(manifest_file, record, outputs)
+        return
+
     # Dictionary of formatted names
     formatted_names = {
         "Family": ("family", ["", ""]),
@@ -445,72 +625,136 @@ def export_pele(
     dt_string = now.strftime("%Y-%m-%d %H:%M:%S")
     git_commit, git_remote = get_git_info()
 
+    # Index each column once so compounds are looked up by row position
+    # instead of a scan over all compound names
+    unit_idx = 1 if units.lower() == "cgs" else 0
+    columns = {col: df[col].to_numpy() for col in df.columns}
+    is_mp = liq_prop_model.lower() == "mp"
+
+    # Build the input deck in a single buffer
+    lines = [
+        f"# -----------------------------------------------------------------------------\n"
+        f"# Liquid fuel properties for {liq_prop_model.upper()} in Pele\n"
+        f"# Fuel: {fuel.name}\n"
+        f"# Number of compounds: {len(compound_names)}\n"
+        f"# Generated: {dt_string}\n"
+        f"# FuelLib remote URL: {git_remote}\n"
+        f"# Git commit: {git_commit}\n"
+        f"# Units: {units.upper()}\n"
+        f"# -----------------------------------------------------------------------------\n\n",
+        f"particles.fuel_species = {vec_to_str(columns['Compound'].tolist())}\n",
+        f"particles.Y_0 = {vec_to_str(columns['Y_0'].tolist())}\n",
+        f"particles.dep_fuel_species = {vec_to_str(dep_fuel_names)}\n",
+    ]
+    if is_mp:
+        lines.append(f"particles.fuel_ref_temp = {ref_T} # K\n")
+    if is_table:
+        log_names = [
+            TABLE_PROPERTIES[prop][0]
+            for prop in PropertyTable.LOG_PROPERTIES
+            if prop in TABLE_PROPERTIES
+        ]
+        lines += [
+            f"particles.prop_table_temp = {table.T_min} {table.T_max} {len(table.T)} # K, uniform grid\n",
+            f"particles.prop_table_interp = linear\n",
+            f"particles.prop_table_log = {vec_to_str(log_names)}\n",
+        ]
+        if companion_file is not None:
+            lines.append(
+                f"particles.prop_table_file = {os.path.basename(companion_file)}\n"
+            )
+    if is_fit:
+        log_names = [
+            TABLE_PROPERTIES[prop][0]
+            for prop in PropertyFits.LOG_PROPERTIES
+            if prop in TABLE_PROPERTIES
+        ]
+        lines.append(f"particles.prop_fit_log = {vec_to_str(log_names)}\n")
+        if companion_file is not None:
+            lines.append(
+                f"particles.prop_fit_file = {os.path.basename(companion_file)}\n"
+            )
+
+    for i, comp_name in enumerate(compound_names):
+        lines.append(f"\n# Properties for {comp_name} in {units.upper()}\n")
+        for prop in prop_names:
+            if prop not in formatted_names:
+                continue
+            prop_name, unit_txt = formatted_names[prop]
+            unit_txt = unit_txt[unit_idx]
+            if prop == "Family":
+                value = columns[prop][i]
+                unit_txt = FAMILY_NAMES.get(value, "olefins")
+                lines.append(
+                    f"particles.{comp_name}_{prop_name} = {value} # {unit_txt}\n"
+                )
+            elif prop == "psat":
+                psat_coeffs = [
+                    columns[coeff][i]
+                    for coeff in ["psat_A", "psat_B", "psat_C", "psat_D"]
+                ]
+                lines.append(
+                    f"particles.{comp_name}_{prop_name} = {vec_to_str(psat_coeffs)} # {unit_txt}\n"
+                )
+            else:
+                # Scalar properties, Cp_stp is written as 'cp' for the MP model
+                value = columns[prop][i]
+                lines.append(
+                    f"particles.{comp_name}_{prop_name} = {value:.6f} # {unit_txt}\n"
+                )
+
+        # Property tables with the error of interpolating them linearly
+        if is_table:
+            errors = ", ".join(
+                f"{prop_name} {table_errors[prop][i]:.1e}"
+                for prop, (prop_name, _, _) in TABLE_PROPERTIES.items()
+            )
+            lines.append(f"# Max relative interpolation error: {errors}\n")
+            if companion_file is None:
+                for prop, (prop_name, _, unit_txt) in TABLE_PROPERTIES.items():
+                    values = " ".join(f"{v:.10e}" for v in table_values[prop][:, i])
+                    lines.append(
+                        f"particles.{comp_name}_{prop_name}_table = {values} # {unit_txt[unit_idx]}\n"
+                    )
+
+        # Polynomial fits in x = (2*T - T_lo - T_hi)/(T_hi - T_lo) with their errors
+        if is_fit:
+            errors = ", ".join(
+                f"{prop_name} {fits.errors[prop][i]:.1e}"
+                for prop, (prop_name, _, _) in TABLE_PROPERTIES.items()
+            )
+            lines.append(f"# Max relative fit error: {errors}\n")
+            if companion_file is None:
+                T_range = f"{fits.T_min[i]} {fits.T_max[i]}"
+                for prop, (prop_name, _, unit_txt) in TABLE_PROPERTIES.items():
+                    degree = fits.degrees[prop][i]
+                    coeffs = fits.power_coefficients(prop, scales[prop])[: degree + 1]
+                    values = " ".join(f"{a:.15e}" for a in coeffs[:, i])
+                    lines.append(
+                        f"particles.{comp_name}_{prop_name}_fit = {T_range} {values} # {unit_txt[unit_idx]}\n"
+                    )
+
+    # Write the companion file before the input file that refers to it
+    if companion_file is not None and is_fit:
+        data_dict = fits.coefficient_table(
+            labels={prop: name for prop, (name, _, _) in TABLE_PROPERTIES.items()},
+            scales=scales,
+        )
+        data_dict["Component"] = np.tile(compound_names, len(TABLE_PROPERTIES))
+        print(f"Writing property fits to {companion_file}.")
+        write_table(companion_file, data_dict)
+    elif companion_file is not None:
+        data_dict = {"T": table.T}
+        for i, comp_name in enumerate(compound_names):
+            for prop, (prop_name, _, _) in TABLE_PROPERTIES.items():
+                data_dict[f"{comp_name}_{prop_name}"] = table_values[prop][:, i]
+        print(f"Writing property tables to {companion_file}.")
+        write_table(companion_file, data_dict)
+
     # Write the properties to the input file
     print(f"Writing properties to {file_name}.")
-    if os.path.exists(file_name):
-        os.remove(file_name)
-    with open(file_name, "a") as f:
-        f.write(
-            f"# -----------------------------------------------------------------------------\n"
-            f"# Liquid fuel properties for {liq_prop_model.upper()} in Pele\n"
-            f"# Fuel: {fuel.name}\n"
-            f"# Number of compounds: {len(compound_names)}\n"
-            f"# Generated: {dt_string}\n"
-            f"# FuelLib remote URL: {git_remote}\n"
-            f"# Git commit: {git_commit}\n"
-            f"# Units: {units.upper()}\n"
-            f"# -----------------------------------------------------------------------------\n\n"
-        )
-        f.write(f"particles.fuel_species = {vec_to_str(df['Compound'].tolist())}\n")
-        f.write(f"particles.Y_0 = {vec_to_str(df['Y_0'].tolist())}\n")
-        f.write(f"particles.dep_fuel_species = {vec_to_str(dep_fuel_names)}\n")
-        if liq_prop_model.lower() == "mp":
-            f.write(f"particles.fuel_ref_temp = {ref_T} # K\n")
-
-        for comp_name in compound_names:
-            f.write(f"\n# Properties for {comp_name} in {units.upper()}\n")
-            for prop in prop_names:
-                if prop in formatted_names:
-                    prop_name, unit_txt = formatted_names[prop]
-                    if units.lower() == "cgs":
-                        unit_txt = unit_txt[1]
-                    else:
-                        unit_txt = unit_txt[0]
-                    # MP model: Write Cp_stp as 'cp' for each component
-                    if liq_prop_model.lower() == "mp" and prop == "Cp_stp":
-                        value = df.loc[df["Compound"] == comp_name, prop].values[0]
-                        f.write(
-                            f"particles.{comp_name}_cp = {value:.6f} # {unit_txt}\n"
-                        )
-                        continue
-                    # Write the property to the file
-                    if prop == "Family":
-                        value = df.loc[df["Compound"] == comp_name, prop].values[0]
-                        if value == 0:
-                            unit_txt = "saturated hydrocarbons"
-                        elif value == 1:
-                            unit_txt = "aromatics"
-                        elif value == 2:
-                            unit_txt = "cycloparaffins"
-                        else:
-                            unit_txt = "olefins"
-                        f.write(
-                            f"particles.{comp_name}_{prop_name} = {value} # {unit_txt}\n"
-                        )
-                    elif prop == "psat":
-                        A = df.loc[df["Compound"] == comp_name, "psat_A"].values[0]
-                        B = df.loc[df["Compound"] == comp_name, "psat_B"].values[0]
-                        C = df.loc[df["Compound"] == comp_name, "psat_C"].values[0]
-                        D = df.loc[df["Compound"] == comp_name, "psat_D"].values[0]
-                        psat_coeffs = [A, B, C, D]
-                        f.write(
-                            f"particles.{comp_name}_{prop_name} = {vec_to_str(psat_coeffs)} # {unit_txt}\n"
-                        )
-                    elif not (liq_prop_model.lower() == "mp" and prop == "Cp_stp"):
-                        value = df.loc[df["Compound"] == comp_name, prop].values[0]
-                        f.write(
-                            f"particles.{comp_name}_{prop_name} = {value:.6f} # {unit_txt}\n"
-                        )
+    write_text_atomic(file_name, "".join(lines))
+    write_manifest(manifest_file, record, outputs)
 
 
 def main():
@@ -544,12 +788,33 @@ def main():
     :param --export_mix_name: Name the mixture if different than fuel_name. Default is fuel_name.
     :type --export_mix_name: str, optional
 
-    :param --liq_prop_model: Model for liquid properties. Options are "gcm" (default) or "mp".
+    :param --liq_prop_model: Model for liquid properties. Options are "gcm" (default), "mp", "table" or "fit".
     :type --liq_prop_model: str, optional
 
     :param --psat_antoine: Use Antoine coefficients for vapor pressure in MP model (True or False). Default is True.
     :type --psat_antoine: bool, optional
 
+    :param --export_format: Format of the exported file: "inp" (default), "csv", "npz", "parquet" or "hdf5".
+    :type --export_format: str, optional
+
+    :param --force: Regenerate the file even if its inputs and options are unchanged (True or False). Default is False.
+    :type --force: bool, optional
+
+    :param --table_temp_min: Lowest temperature (K) of the property tables of the table model. Default is the lowest melting point.
+    :type --table_temp_min: float, optional
+
+    :param --table_temp_max: Highest temperature (K) of the property tables of the table model. Default is 0.99 times the lowest critical temperature.
+    :type --table_temp_max: float, optional
+
+    :param --table_num_temps: Number of temperatures in the property tables of the table model. Default is 257.
+    :type --table_num_temps: int, optional
+
+    :param --table_rtol: Maximum relative error of linear interpolation in the property tables. Default is None.
+    :type --table_rtol: float, optional
+
+    :param --fit_rtol: Maximum relative error of the polynomial fits of the fit model. Default is 1e-4.
+    :type --fit_rtol: float, optional
+
     :raises FileNotFoundError: If required files for the specified fuel are not found.
     """
 
@@ -629,7 +894,7 @@ def main():
     parser.add_argument(
         "--liq_prop_model",
         default="gcm",
-        help='Model for liquid properties: "gcm" (default) or "mp" (optional, default: gcm).',
+        help='Model for liquid properties: "gcm" (default), "mp", "table" or "fit" (optional, default: gcm).',
     )
 
     # Optional argument for printing Antoine coefficients in MP model
@@ -640,6 +905,58 @@ def main():
         help="Use Antoine coefficients for vapor pressure in MP model (True or False, default: True).",
     )
 
+    # Optional argument for the format of the exported file
+    parser.add_argument(
+        "--export_format",
+        default="inp",
+        choices=["inp"] + list(FORMATS),
+        help='Format of the exported file: "inp" for the Pele input file or a table format (optional, default: inp).',
+    )
+
+    # Optional argument to regenerate files that are up to date
+    parser.add_argument(
+        "--force",
+        type=lambda x: str(x).lower() in ["true", "1"],
+        nargs="?",
+        const=True,
+        default=False,
+        help="Regenerate the file even if its inputs and options are unchanged (True or False, default: False).",
+    )
+
+    # Optional arguments for the property tables of the table model
+    parser.add_argument(
+        "--table_temp_min",
+        type=float,
+        default=None,
+        help="Lowest temperature (K) of the property tables (optional, default: lowest melting point).",
+    )
+    parser.add_argument(
+        "--table_temp_max",
+        type=float,
+        default=None,
+        help="Highest temperature (K) of the property tables (optional, default: 0.99 * lowest critical temperature).",
+    )
+    parser.add_argument(
+        "--table_num_temps",
+        type=int,
+        default=257,
+        help="Number of temperatures in the property tables (optional, default: 257).",
+    )
+    parser.add_argument(
+        "--table_rtol",
+        type=float,
+        default=None,
+        help="Maximum relative error of linear interpolation in the property tables (optional, default: None).",
+    )
+
+    # Optional argument for the polynomial fits of the fit model
+    parser.add_argument(
+        "--fit_rtol",
+        type=float,
+        default=1e-4,
+        help="Maximum relative error of the polynomial fits (optional, default: 1e-4).",
+    )
+
     # Parse arguments
     args = parser.parse_args()
     fuel_name = args.fuel_name
@@ -653,6 +970,13 @@ def main():
     export_mix_name = args.export_mix_name
     liq_prop_model = args.liq_prop_model.lower()
     psat_antoine = args.psat_antoine
+    export_format = args.export_format
+    force = args.force
+    table_temp_min = args.table_temp_min
+    table_temp_max = args.table_temp_max
+    table_num_temps = args.table_num_temps
+    table_rtol = args.table_rtol
+    fit_rtol = args.fit_rtol
 
     # Print the parsed arguments
     print(f"Preparing to export properties:")
@@ -664,6 +988,7 @@ def main():
     if liq_prop_model.lower() == "mp":
         print(f"    Antoine coefficients: {psat_antoine}")
     print(f"    Export mixture properties: {export_mix}")
+    print(f"    Export format: {export_format}")
     print(f"    Export directory: {export_dir}")
     print(f"    Fuel data directory: {fuel_data_dir}")
 
@@ -700,6 +1025,13 @@ def main():
         export_mix_name=export_mix_name,
         liq_prop_model=liq_prop_model,
         psat_antoine=psat_antoine,
+        export_format=export_format,
+        force=force,
+        table_temp_min=table_temp_min,
+        table_temp_max=table_temp_max,
+        table_num_temps=table_num_temps,
+        table_rtol=table_rtol,
+        fit_rtol=fit_rtol,
     )
 
     print("\nExport completed successfully!")
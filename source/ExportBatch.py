@@ -0,0 +1,315 @@
+import os
+import sys
+import io
+import json
+import inspect
+import argparse
+import itertools
+import contextlib
+from functools import lru_cache, partial
+import FuelLib as fl
+from Export4Pele import export_pele
+from Export4Converge import export_converge, map_jobs
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+
+"""
+Script that runs many Pele and Converge exports from a manifest in a single
+process.
+
+The GCM table, the fuel objects and the git metadata written to the Pele
+headers are loaded once and shared by every export of the batch. Exports of
+the same fuel are run together, so with --jobs each worker process loads a
+fuel only once.
+
+The manifest is a JSON file with a list of exports. Each export names the
+exporter ("pele" or "converge"), the fuel and the options of the exporter.
+Options given as a list are expanded into one export per value, and the
+optional "defaults" apply to every export. The export_dir may contain
+fields of the other options, such as "exportData/{units}", so exports that
+only differ in their options do not overwrite each other's files:
+
+    {
+        "defaults": {"export_dir": "exportData/{units}"},
+        "exports": [
+            {
+                "exporter": "pele",
+                "fuel_name": ["posf10264", "posf10325"],
+                "units": ["mks", "cgs"],
+                "liq_prop_model": ["gcm", "mp"],
+                "export_mix": [false, true]
+            },
+            {"exporter": "converge", "fuel_name": "posf10264", "export_mix": true}
+        ]
+    }
+
+Usage:
+    python ExportBatch.py --manifest <manifest.json>
+
+Options:
+    --jobs <number of worker processes>
+    --use_cache <True or False to use the compiled fuel cache>
+    --force <True or False to regenerate files that are up to date>
+"""
+
+# Export function of each exporter
+EXPORTERS = {
+    "pele": export_pele,
+    "converge": export_converge,
+}
+
+# Options that select the fuel rather than being passed to the exporter
+FUEL_OPTIONS = ("fuel_name", "fuel_decomp_name", "fuel_data_dir")
+
+# Options whose value is a list for a single export, so lists are not expanded
+LIST_OPTIONS = ("dep_fuel_names",)
+
+
+@lru_cache(maxsize=None)
+def load_fuel(
+    fuel_name, fuel_decomp_name=None, fuel_data_dir=FUELDATA_DIR, use_cache=False
+):
+    """
+    Load a fuel object once per process and share it between exports.
+
+    :param fuel_name: Name of the fuel.
+    :type fuel_name: str
+    :param fuel_decomp_name: Name of the decomposition file if different from fuel_name.
+    :type fuel_decomp_name: str, optional
+    :param fuel_data_dir: Directory where the fuel data files are located.
+    :type fuel_data_dir: str, optional
+    :param use_cache: Load the fuel from the compiled fuel cache.
+    :type use_cache: bool, optional
+    :return: Shared fuel object.
+    :rtype: fl.fuel
+    """
+    return fl.fuel(
+        fuel_name,
+        decompName=fuel_decomp_name,
+        fuelDataDir=fuel_data_dir,
+        useCache=use_cache,
+    )
+
+
+def expand_manifest(manifest):
+    """
+    Expand a manifest into the list of exports it describes.
+
+    :param manifest: Manifest with a list of "exports" and optional "defaults".
+    :type manifest: dict
+    :return: One dictionary of options per export, in manifest order.
+    :rtype: list[dict]
+    :raises ValueError: If an export has an unknown exporter, no fuel_name or an unknown option.
+    """
+    defaults = manifest.get("defaults", {})
+    exports = []
+    for entry in manifest["exports"]:
+        entry = {**defaults, **entry}
+
+        # Expand every list of options into the product of its values
+        names = list(entry)
+        values = [
+            (
+                entry[name]
+                if isinstance(entry[name], list) and name not in LIST_OPTIONS
+                else [entry[name]]
+            )
+            for name in names
+        ]
+        for combination in itertools.product(*values):
+            options = dict(zip(names, combination))
+            validate_export(options)
+            exports.append(options)
+    return exports
+
+
+def validate_export(options):
+    """
+    Check the exporter, fuel and options of an export.
+
+    :param options: Options of the export.
+    :type options: dict
+    :raises ValueError: If the exporter is unknown, fuel_name is missing, an option is not accepted by the exporter or export_dir uses an option that is not set.
+    """
+    exporter = options.get("exporter")
+    if exporter not in EXPORTERS:
+        raise ValueError(f"exporter must be one of {list(EXPORTERS)}, got '{exporter}'")
+    if "fuel_name" not in options:
+        raise ValueError(f"Export {options} has no fuel_name")
+
+    accepted = set(inspect.signature(EXPORTERS[exporter]).parameters) - {
+        "fuel",
+        "path",
+    }
+    accepted.update(FUEL_OPTIONS + ("exporter", "export_dir"))
+    unknown = set(options) - accepted
+    if unknown:
+        raise ValueError(f"Unknown options {sorted(unknown)} for exporter '{exporter}'")
+
+    try:
+        options.get("export_dir", "").format(**options)
+    except KeyError as e:
+        raise ValueError(
+            f"export_dir '{options['export_dir']}' uses option {e} that is not set"
+        ) from e
+
+
+def read_manifest(file_path):
+    """
+    Read a manifest file and expand it into the list of exports.
+
+    :param file_path: Path of the JSON manifest.
+    :type file_path: str
+    :return: One dictionary of options per export, in manifest order.
+    :rtype: list[dict]
+    """
+    with open(file_path, "r") as f:
+        return expand_manifest(json.load(f))
+
+
+def fuel_key(options):
+    """
+    Get the fuel that an export uses.
+
+    :param options: Options of the export.
+    :type options: dict
+    :return: Fuel name, decomposition name and fuel data directory.
+    :rtype: tuple
+    """
+    return (
+        options["fuel_name"],
+        options.get("fuel_decomp_name"),
+        options.get("fuel_data_dir", FUELDATA_DIR),
+    )
+
+
+def run_exports(exports, use_cache=False):
+    """
+    Run the exports of one fuel and capture their output.
+
+    :param exports: Options of each export, all using the same fuel.
+    :type exports: list[dict]
+    :param use_cache: Load the fuel from the compiled fuel cache.
+    :type use_cache: bool, optional (default: False)
+    :return: Printed output of the exports.
+    :rtype: str
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        for options in exports:
+            fuel = load_fuel(*fuel_key(options), use_cache=use_cache)
+            kwargs = {
+                name: value
+                for name, value in options.items()
+                if name not in FUEL_OPTIONS + ("exporter", "export_dir")
+            }
+            if "export_dir" in options:
+                kwargs["path"] = options["export_dir"].format(**options)
+            print(f"\n=== {options['exporter']} export of {fuel.name}: {kwargs} ===")
+            EXPORTERS[options["exporter"]](fuel, **kwargs)
+    return log.getvalue()
+
+
+def export_batch(exports, jobs=1, use_cache=False):
+    """
+    Run a batch of exports, grouped by fuel so each fuel is loaded once.
+
+    :param exports: Options of each export, see expand_manifest.
+    :type exports: list[dict]
+    :param jobs: Number of worker processes that run the exports of different fuels concurrently.
+    :type jobs: int, optional (default: 1)
+    :param use_cache: Load the fuels from the compiled fuel cache.
+    :type use_cache: bool, optional (default: False)
+    :return: None
+    :rtype: None
+    :raises ValueError: If jobs is less than one.
+    """
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, got {jobs}")
+
+    # Group the exports by fuel, in order of first appearance
+    groups = {}
+    for options in exports:
+        groups.setdefault(fuel_key(options), []).append(options)
+
+    task = partial(run_exports, use_cache=use_cache)
+    for log in map_jobs(task, list(groups.values()), jobs):
+        print(log, end="")
+
+
+def main():
+    """
+    Main function to execute the batch export.
+
+    :param --manifest: Path of the JSON manifest of exports (mandatory).
+    :type --manifest: str
+
+    :param --jobs: Number of worker processes. Default is 1.
+    :type --jobs: int, optional
+
+    :param --use_cache: Load the fuels from the compiled fuel cache (True or False). Default is False.
+    :type --use_cache: bool, optional
+
+    :param --force: Regenerate every file, even those that are up to date (True or False). Default is False.
+    :type --force: bool, optional
+    """
+
+    # Set up argument parser
+    parser = argparse.ArgumentParser(
+        description="Run Pele and Converge exports of many fuels from a manifest."
+    )
+
+    # Mandatory argument for the manifest
+    parser.add_argument(
+        "--manifest",
+        required=True,
+        help="Path of the JSON manifest of exports (mandatory).",
+    )
+
+    # Optional argument for the number of worker processes
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes (optional, default: 1).",
+    )
+
+    # Optional argument for the compiled fuel cache
+    parser.add_argument(
+        "--use_cache",
+        type=lambda x: str(x).lower() in ["true", "1"],
+        default=False,
+        help="Load the fuels from the compiled fuel cache (True or False, default: False).",
+    )
+
+    # Optional argument to regenerate files that are up to date
+    parser.add_argument(
+        "--force",
+        type=lambda x: str(x).lower() in ["true", "1"],
+        nargs="?",
+        const=True,
+        default=False,
+        help="Regenerate every file, even those that are up to date (True or False, default: False).",
+    )
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    exports = read_manifest(args.manifest)
+    if args.force:
+        for options in exports:
+            options["force"] = True
+    num_fuels = len({fuel_key(options) for options in exports})
+    print(f"Running {len(exports)} exports of {num_fuels} fuels from {args.manifest}")
+
+    export_batch(exports, jobs=args.jobs, use_cache=args.use_cache)
+
+    print("\nBatch export completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+import os
+import sys
+import struct
+import zipfile
+import numpy as np
+import pandas as pd
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+
+"""
+File formats for the property tables written by Export4Converge and Export4Pele.
+
+A table is a dictionary of column label to one-dimensional array. CSV is the
+default format. The binary formats store every column as a contiguous array
+in full double precision, so tables are written without converting floats to
+text and read back with memory-mapping instead of parsing:
+
+    npz:     NumPy archive with one uncompressed member per column
+    parquet: Apache Parquet file (requires pyarrow or fastparquet)
+    hdf5:    HDF5 file with one contiguous dataset per column (requires h5py)
+
+Usage:
+    from ExportFormats import table_file, write_table, read_table
+
+    file = table_file("props", "npz")
+    write_table(file, {"Temperature (K)": T, "Density (kg/m^3)": rho})
+    table = read_table(file)
+"""
+
+# File extension of each table format
+FORMATS = {
+    "csv": ".csv",
+    "npz": ".npz",
+    "parquet": ".parquet",
+    "hdf5": ".h5",
+}
+
+
+def table_file(file_base, fmt="csv"):
+    """
+    Get the path of a table file from its path without extension.
+
+    :param file_base: Path of the file without extension.
+    :type file_base: str
+    :param fmt: Table format, see FORMATS.
+    :type fmt: str, optional (default: "csv")
+    :return: Path of the file with the extension of the format.
+    :rtype: str
+    :raises ValueError: If the format is not supported.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Format must be one of {list(FORMATS)}, got '{fmt}'")
+    return file_base + FORMATS[fmt]
+
+
+def table_format(file_path):
+    """
+    Get the table format of a file from its extension.
+
+    :param file_path: Path of the table file.
+    :type file_path: str
+    :return: Table format, see FORMATS.
+    :rtype: str
+    :raises ValueError: If the file extension is not a supported format.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    for fmt, ext in FORMATS.items():
+        if ext == extension:
+            return fmt
+    raise ValueError(
+        f"File extension must be one of {list(FORMATS.values())}, got '{file_path}'"
+    )
+
+
+def write_table(file_path, data_dict):
+    """
+    Write a table of columns to a file in the format given by its extension.
+
+    :param file_path: Path of the file, see FORMATS for the extensions.
+    :type file_path: str
+    :param data_dict: Column label to values, all of the same length.
+    :type data_dict: dict
+    :raises ValueError: If the file extension is not a supported format.
+    :raises ImportError: If the optional package required by the format is missing.
+    """
+    fmt = table_format(file_path)
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    WRITERS[fmt](file_path, data_dict)
+
+
+def read_table(file_path, columns=None):
+    """
+    Read a table written by write_table.
+
+    :meta private: Columns of npz and hdf5 files are memory-mapped, parquet files are read from a memory map.
+
+    :param file_path: Path of the table file.
+    :type file_path: str
+    :param columns: Labels of the columns to read. Defaults to all.
+    :type columns: list of str, optional
+    :return: Column label to values.
+    :rtype: dict
+    :raises ValueError: If the file extension is not a supported format.
+    :raises ImportError: If the optional package required by the format is missing.
+    """
+    return READERS[table_format(file_path)](file_path, columns)
+
+
+def write_text_atomic(file_path, text):
+    """
+    Write text to a file by renaming a temporary file in the same directory.
+
+    :meta private: Readers of the file never see it partially written, and an existing file is kept if writing fails.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param text: Contents of the file.
+    :type text: str
+    """
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# -----------------------------------------------------------------------------
+# CSV
+# -----------------------------------------------------------------------------
+def _write_csv(file_path, data_dict):
+    """
+    Write a table to a CSV file.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param data_dict: Column label to values.
+    :type data_dict: dict
+    """
+    pd.DataFrame(data_dict).to_csv(file_path, index=False)
+
+
+def _read_csv(file_path, columns=None):
+    """
+    Read a table from a CSV file.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param columns: Labels of the columns to read.
+    :type columns: list of str, optional
+    :return: Column label to values.
+    :rtype: dict
+    """
+    df = pd.read_csv(file_path, usecols=columns, float_precision="round_trip")
+    return {label: df[label].to_numpy() for label in df.columns}
+
+
+# -----------------------------------------------------------------------------
+# NPZ
+# -----------------------------------------------------------------------------
+def _write_npz(file_path, data_dict):
+    """
+    Write a table to an uncompressed NumPy archive with one member per column.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param data_dict: Column label to values.
+    :type data_dict: dict
+    """
+    arrays = {
+        f"column_{i}": np.asarray(values) for i, values in enumerate(data_dict.values())
+    }
+    np.savez(file_path, columns=np.array(list(data_dict.keys())), **arrays)
+
+
+def _read_npz(file_path, columns=None):
+    """
+    Memory-map the columns of a table in a NumPy archive.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param columns: Labels of the columns to read.
+    :type columns: list of str, optional
+    :return: Column label to values.
+    :rtype: dict
+    """
+    with np.load(file_path) as data:
+        labels = [str(label) for label in data["columns"]]
+    if columns is None:
+        columns = labels
+    return {
+        label: memmap_npz_member(file_path, f"column_{labels.index(label)}")
+        for label in columns
+    }
+
+
+def memmap_npz_member(file_path, name):
+    """
+    Memory-map one array of an uncompressed NumPy archive.
+
+    :meta private: Only the zip and .npy headers of the member are read, the array itself is mapped from disk.
+
+    :param file_path: Path of the .npz file.
+    :type file_path: str
+    :param name: Name of the array in the archive.
+    :type name: str
+    :return: Read-only view of the array.
+    :rtype: np.memmap
+    :raises KeyError: If the array is not in the archive.
+    :raises ValueError: If the array is compressed.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        info = archive.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"Cannot memory-map compressed member {info.filename}")
+
+    with open(file_path, "rb") as f:
+        # Skip the local file header of the zip member
+        f.seek(info.header_offset)
+        header = f.read(30)
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+
+        # Read the .npy header to locate the array data
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    if int(np.prod(shape)) == 0:
+        return np.empty(shape, dtype=dtype)
+    order = "F" if fortran_order else "C"
+    return np.memmap(
+        file_path, dtype=dtype, mode="r", shape=shape, order=order, offset=offset
+    )
+
+
+# -----------------------------------------------------------------------------
+# Parquet
+# -----------------------------------------------------------------------------
+def _write_parquet(file_path, data_dict):
+    """
+    Write a table to an Apache Parquet file.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param data_dict: Column label to values.
+    :type data_dict: dict
+    :raises ImportError: If neither pyarrow nor fastparquet is installed.
+    """
+    pd.DataFrame(data_dict).to_parquet(file_path, index=False)
+
+
+def _read_parquet(file_path, columns=None):
+    """
+    Read a table from an Apache Parquet file through a memory map.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param columns: Labels of the columns to read.
+    :type columns: list of str, optional
+    :return: Column label to values.
+    :rtype: dict
+    :raises ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading parquet tables requires pyarrow.") from e
+
+    table = pq.read_table(file_path, columns=columns, memory_map=True)
+    return {label: table.column(label).to_numpy() for label in table.column_names}
+
+
+# -----------------------------------------------------------------------------
+# HDF5
+# -----------------------------------------------------------------------------
+def _import_h5py():
+    """
+    Import h5py, which is only required for HDF5 tables.
+
+    :return: The h5py module.
+    :rtype: module
+    :raises ImportError: If h5py is not installed.
+    """
+    try:
+        import h5py
+    except ImportError as e:
+        raise ImportError("HDF5 tables require h5py.") from e
+    return h5py
+
+
+def _write_hdf5(file_path, data_dict):
+    """
+    Write a table to an HDF5 file with one contiguous dataset per column.
+
+    :meta private: Column labels may contain "/", so datasets are named by column index and the labels are stored in the "columns" attribute.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param data_dict: Column label to values.
+    :type data_dict: dict
+    :raises ImportError: If h5py is not installed.
+    """
+    h5py = _import_h5py()
+    with h5py.File(file_path, "w") as f:
+        f.attrs["columns"] = list(data_dict.keys())
+        for i, values in enumerate(data_dict.values()):
+            values = np.asarray(values)
+            if values.dtype.kind == "U":
+                values = np.char.encode(values, "utf-8")
+            f.create_dataset(f"column_{i}", data=values)
+
+
+def _read_hdf5(file_path, columns=None):
+    """
+    Memory-map the columns of a table in an HDF5 file.
+
+    :param file_path: Path of the file.
+    :type file_path: str
+    :param columns: Labels of the columns to read.
+    :type columns: list of str, optional
+    :return: Column label to values.
+    :rtype: dict
+    :raises ImportError: If h5py is not installed.
+    """
+    h5py = _import_h5py()
+    table = {}
+    with h5py.File(file_path, "r") as f:
+        labels = [str(label) for label in f.attrs["columns"]]
+        if columns is None:
+            columns = labels
+        for label in columns:
+            dataset = f[f"column_{labels.index(label)}"]
+            offset = dataset.id.get_offset()
+            if dataset.dtype.kind == "S":
+                table[label] = np.char.decode(dataset[()], "utf-8")
+            elif offset is None:
+                table[label] = dataset[()]
+            else:
+                table[label] = np.memmap(
+                    file_path,
+                    dtype=dataset.dtype,
+                    mode="r",
+                    shape=dataset.shape,
+                    offset=offset,
+                )
+    return table
+
+
+# Writer and reader of each table format
+WRITERS = {
+    "csv": _write_csv,
+    "npz": _write_npz,
+    "parquet": _write_parquet,
+    "hdf5": _write_hdf5,
+}
+READERS = {
+    "csv": _read_csv,
+    "npz": _read_npz,
+    "parquet": _read_parquet,
+    "hdf5": _read_hdf5,
+}
@@ -0,0 +1,143 @@
+import os
+import sys
+import json
+import hashlib
+import numpy as np
+import FuelLib as fl
+import ExportFormats
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+
+"""
+Manifests that let the export scripts skip exports whose outputs are current.
+
+After an export, a manifest is written next to its outputs. It records the
+hashes of the fuel's input files (gcData, groupDecomposition and GCM table),
+of the fuel properties actually exported, of the FuelLib and export source
+code, the parameters of the export and the hashes of the output files. An
+export is skipped when all of these are unchanged, unless it is forced.
+
+Usage:
+    from ExportManifest import export_record, is_up_to_date, write_manifest
+
+    record = export_record(fuel, parameters, code_files=[__file__])
+    if force or not is_up_to_date(manifest_file, record, outputs):
+        ...  # write the outputs
+        write_manifest(manifest_file, record, outputs)
+"""
+
+# Version of the manifest contents, increase to invalidate existing manifests
+MANIFEST_VERSION = 1
+
+
+def fuel_hash(fuel):
+    """
+    Hash the compounds, composition and GCM properties of a fuel object.
+
+    :meta private: Catches fuels that were modified after loading, which the input file hashes alone would miss.
+
+    :param fuel: Fuel object.
+    :type fuel: fl.fuel
+    :return: Hexadecimal SHA-256 digest.
+    :rtype: str
+    """
+    h = hashlib.sha256(fuel.name.encode())
+    h.update("\n".join(fuel.compounds).encode())
+    if fuel.pelephysics_keys is not None:
+        h.update("\n".join(fuel.pelephysics_keys).encode())
+    for prop in ("Y_0", "fam") + fuel.CACHED_PROPS:
+        h.update(np.ascontiguousarray(getattr(fuel, prop), dtype=float).tobytes())
+    return h.hexdigest()
+
+
+def export_record(fuel, parameters, code_files=()):
+    """
+    Describe everything the outputs of an export depend on.
+
+    :param fuel: Fuel object that is exported.
+    :type fuel: fl.fuel
+    :param parameters: Parameters of the export, which must be JSON serializable.
+    :type parameters: dict
+    :param code_files: Source files of the exporter, in addition to FuelLib and the export modules.
+    :type code_files: list of str, optional
+    :return: Record of the input hashes, code hash and parameters.
+    :rtype: dict
+    """
+    code_files = [fl.__file__, ExportFormats.__file__, __file__, *code_files]
+    code = hashlib.sha256()
+    for file in code_files:
+        code.update(fl.file_hash(file).encode())
+
+    record = {
+        "version": MANIFEST_VERSION,
+        "inputs": {
+            "gcData": fl.file_hash(fuel.gcxgcFile),
+            "groupDecomposition": fl.file_hash(fuel.groupDecompFile),
+            "gcmTable": fl.file_hash(fuel.gcmTableFile),
+        },
+        "fuel": fuel_hash(fuel),
+        "code": code.hexdigest(),
+        "parameters": parameters,
+    }
+
+    # Round trip through JSON so the record compares equal to a loaded manifest
+    return json.loads(json.dumps(record, default=str))
+
+
+def is_up_to_date(manifest_file, record, outputs):
+    """
+    Check whether the outputs of an export are current.
+
+    :param manifest_file: Path of the manifest of the previous export.
+    :type manifest_file: str
+    :param record: Record of the export, see export_record.
+    :type record: dict
+    :param outputs: Paths of the files the export writes.
+    :type outputs: list of str
+    :return: True if the manifest matches the record and lists every output with its current hash.
+    :rtype: bool
+    """
+    try:
+        with open(manifest_file, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    if manifest.get("record") != record:
+        return False
+
+    hashes = manifest.get("outputs", {})
+    directory = os.path.dirname(manifest_file)
+    for output in outputs:
+        name = os.path.relpath(output, directory)
+        if not os.path.exists(output) or hashes.get(name) != fl.file_hash(output):
+            return False
+    return True
+
+
+def write_manifest(manifest_file, record, outputs):
+    """
+    Write the manifest of an export after its outputs are written.
+
+    :param manifest_file: Path of the manifest.
+    :type manifest_file: str
+    :param record: Record of the export, see export_record.
+    :type record: dict
+    :param outputs: Paths of the files the export wrote.
+    :type outputs: list of str
+    """
+    directory = os.path.dirname(manifest_file)
+    manifest = {
+        "record": record,
+        "outputs": {
+            os.path.relpath(output, directory): fl.file_hash(output)
+            for output in outputs
+        },
+    }
+    ExportFormats.write_text_atomic(
+        manifest_file, json.dumps(manifest, indent=4) + "\n"
+    )
@@ -1,8 +1,9 @@
 import os
 import sys
+import json
+import hashlib
 import numpy as np
 import pandas as pd
-from scipy.optimize import curve_fit
 
 # Add the FuelLib directory to the Python path
 FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -21,6 +22,10 @@ class fuel:
     :type decompName: str, optional
     :param fuelDataDir: Directory where the fuel data is stored. Defaults to FuelLib/fuelData.
     :type fuelDataDir: str, optional
+    :param useCache: Load and store the derived GCM properties in a compiled cache. Defaults to False.
+    :type useCache: bool, optional
+    :param cacheDir: Directory where the compiled cache is stored. Defaults to FuelLib/.fuelCache.
+    :type cacheDir: str, optional
     """
 
     # Number of first and second order groups from Constantinou and Gani
@@ -30,7 +35,96 @@ class fuel:
     # Boltzmann's constant J/K
     k_B = 1.380649e-23
 
-    def __init__(self, name, decompName=None, fuelDataDir=FUELDATA_DIR):
+    # Latini parameters A* and beta for saturated hydrocarbons, aromatics,
+    # cycloparaffins and olefins (Poling Table 10-4), indexed by fam
+    LATINI_ASTAR = np.array([0.00350, 0.0346, 0.0310, 0.0361])
+    LATINI_BETA = np.array([0.5, 1.0, 1.0, 1.0])
+
+    # Properties available from fuel.evaluate
+    PROPERTIES = (
+        "density",
+        "viscosity_kinematic",
+        "viscosity_dynamic",
+        "psat",
+        "surface_tension",
+        "thermal_conductivity",
+        "latent_heat_vaporization",
+        "Cl",
+        "molar_liquid_vol",
+    )
+
+    # Mixture properties of spray parcels from fuel.parcel_properties
+    PARCEL_PROPERTIES = (
+        "density",
+        "viscosity_dynamic",
+        "Cl",
+        "latent_heat_vaporization",
+        "psat",
+        "surface_tension",
+    )
+
+    # Version of the compiled cache format, increment when the GCM changes
+    CACHE_VERSION = 1
+
+    # Per-compound properties stored in the compiled cache
+    CACHED_PROPS = (
+        "MW",
+        "Tc",
+        "Pc",
+        "Vc",
+        "Tb",
+        "Tm",
+        "Hf",
+        "Gf",
+        "Hv_stp",
+        "omega",
+        "Vm_stp",
+        "Cp_stp",
+        "Cp_B",
+        "Cp_C",
+        "Lv_stp",
+        "epsilonByKB",
+        "sigma",
+    )
+
+    # Temperature-independent coefficients of the correlations, see coefficients
+    COEFFICIENTS = (
+        "nu_a",  # Dutt: 442.78 + 1.6452*Tb in Celsius
+        "nu_b",  # Dutt: 239 - 0.19*Tb in Celsius
+        "Vm_phi_stp",  # Rackett: (1 - Tstp/Tc)^(2/7)
+        "Vm_log_z",  # Rackett: log(0.29056 - 0.08775*omega)
+        "Lv_scale",  # Watson: Lv_stp/(1 - Tb/Tc)^0.38
+        "st_brock_bird",  # Brock-Bird: Pc^(2/3)*Tc^(1/3)*Q in N/m
+        "st_pitzer",  # Pitzer: Pc^(2/3)*Tc^(1/3)*Q in N/m
+        "tc_A",  # Latini: A*Tb^alpha/(MW^beta*Tc^gamma)
+        "psat_lk_A",  # Lee-Kesler: log(psat) = A + B/T + C*log(T) + D*T^6
+        "psat_lk_B",
+        "psat_lk_C",
+        "psat_lk_D",
+        "psat_aw_a",  # Ambrose-Walton: log(psat/Pc) = (a*tau + b*tau^1.5 + c*tau^2.5 + d*tau^5)/Tr
+        "psat_aw_b",
+        "psat_aw_c",
+        "psat_aw_d",
+    )
+    _COEFFICIENT_INDEX = {name: i for i, name in enumerate(COEFFICIENTS)}
+
+    # Properties the coefficients are derived from, setting one resets them
+    COEFFICIENT_INPUTS = ("MW", "Tc", "Pc", "Tb", "omega", "Lv_stp", "fam")
+
+    # Number of rows per chunk of the bubble-point and dew-point solvers
+    SATURATION_CHUNK = 1024
+
+    # Coefficient block, computed on first use
+    _coefficients = None
+
+    def __init__(
+        self,
+        name,
+        decompName=None,
+        fuelDataDir=FUELDATA_DIR,
+        useCache=False,
+        cacheDir=FUELCACHE_DIR,
+    ):
         """
         Initialize the fuel object and calculate GCM properties.
 
@@ -40,6 +134,10 @@ class fuel:
         :type decompName: str, optional
         :param fuelDataDir: Directory where the fuel data is stored.
         :type fuelDataDir: str, optional
+        :param useCache: Load and store the derived GCM properties in a compiled cache.
+        :type useCache: bool, optional
+        :param cacheDir: Directory where the compiled cache is stored.
+        :type cacheDir: str, optional
         """
 
         self.name = name
@@ -58,7 +156,16 @@ class fuel:
 
         self.groupDecompFile = os.path.join(self.fuelDataDecompDir, f"{decompName}.csv")
         self.gcxgcFile = os.path.join(self.fuelDataGcDir, f"{name}_init.csv")
-        self.gcmTableFile = os.path.join(GCMTABLE_DIR, "gcmTable.csv")
+        self.gcmTableFile = _gcm_table_file
+
+        # Skip parsing the input files if a compiled cache of this fuel exists
+        self.cacheFile = None
+        if useCache:
+            self.cacheFile = os.path.join(
+                cacheDir, f"{name}_{self.input_hash()[:16]}.cache"
+            )
+            if self.load_cache(self.cacheFile):
+                return
 
         # Read functional group data for mixture (num_compounds,num_groups)
         df_Nij = pd.read_csv(self.groupDecompFile)
@@ -71,7 +178,7 @@ class fuel:
         # 1: aromatics
         # 2: cycloparaffins
         # 3: olefins
-        self.fam = np.zeros(self.num_compounds, dtype=int)
+        fam = np.zeros(self.num_compounds, dtype=int)
         aromatics = 10  # starting index for aromatic groups
         num_aromatics = 5
         cyclos = 84  # starting index for membered ring groups
@@ -81,13 +188,14 @@ class fuel:
         for i in range(self.num_compounds):
             # Check if aromatic: does it contain AC's?
             if sum(self.Nij[i, aromatics : aromatics + num_aromatics]) > 0:
-                self.fam[i] = 1
+                fam[i] = 1
             # Check if cycloparaffin: does it contain rings?
             elif sum(self.Nij[i, cyclos : cyclos + num_cyclos]) > 0:
-                self.fam[i] = 2
+                fam[i] = 2
             # Check if olefin: does it contain double bonds?
             elif sum(self.Nij[i, olefins : olefins + num_olefins]) > 0:
-                self.fam[i] = 3
+                fam[i] = 3
+        self.fam = fam
 
         # Read initial liquid composition of mixture and normalize to get mass frac
         df_gcxgc = pd.read_csv(self.gcxgcFile)
@@ -118,88 +226,67 @@ class fuel:
                 f"equal the number of compounds in {self.gcxgcFile}."
             )
 
-        # Read and store GCM table properties
-        df_table = pd.read_csv(self.gcmTableFile)
-        df_table = df_table.drop(columns=["Units"])
+        # Group contribution sums of every GCM property in a single matrix product
+        gcmTable = get_gcm_table()
+        gcmSums = gcmTable.contributions(self.Nij)
 
-        def get_row(property_name):
+        def get_sum(property_name):
             """
-            Get property row from GCM table.
+            Get the group contribution sum of a GCM table property.
 
             :param property_name: Name of the property to retrieve.
             :type property_name: str
-            :return: Property values for all functional groups.
+            :return: Sum of the group contributions for each compound.
             :rtype: np.ndarray
-            :raises ValueError: If property not found in GCM table.
             """
-            row = df_table[df_table["Property"] == property_name]
-            if row.empty:
-                raise ValueError(f"Property '{property_name}' not found in GCM table.")
-            return row.iloc[:, 1:].to_numpy().flatten()
-
-        # Table data for functional groups (num_compounds,)
-        Tck = get_row("tck")  # critical temperature (1)
-        Pck = get_row("pck")  # critical pressure (bar)
-        Vck = get_row("vck")  # critical volume (m^3/kmol)
-        Tbk = get_row("tbk")  # boiling temperature (1)
-        Tmk = get_row("tmk")  # melting point temperature (1)
-        hfk = get_row("hfk")  # enthalpy of formation, (kJ/mol)
-        gfk = get_row("gfk")  # Gibbs energy (kJ/mol)
-        hvk = get_row("hvk")  # latent heat of vaporization (kJ/mol)
-        wk = get_row("wk")  # accentric factor (1)
-        Vmk = get_row("vmk")  # liquid molar volume fraction (m^3/kmol)
-        cpak = get_row("CpAk")  # specific heat values (J/mol/K)
-        cpbk = get_row("CpBk")  # specific heat values (J/mol/K)
-        cpck = get_row("CpCk")  # specific heat values (J/mol/K)
-        mwk = get_row("MW")  # molecular weights (g/mol)
+            return gcmSums[gcmTable.index(property_name)]
 
         # --- Compute critical properties at standard temp (num_compounds,)
         # Molecular weights
-        self.MW = np.matmul(self.Nij, mwk)  # g/mol
-        self.MW *= 1e-3  # Convert to kg/mol
+        self.MW = get_sum("MW") * 1e-3  # Convert to kg/mol from g/mol
 
         # T_c (critical temperature)
-        self.Tc = 181.128 * np.log(np.matmul(self.Nij, Tck))  # K
+        self.Tc = 181.128 * np.log(get_sum("tck"))  # K
 
         # p_c (critical pressure)
-        self.Pc = 1.3705 + (np.matmul(self.Nij, Pck) + 0.10022) ** (-2)  # bar
-        self.Pc *= 1e5  # Convert to Pa from bar
+        Pc = 1.3705 + (get_sum("pck") + 0.10022) ** (-2)  # bar
+        self.Pc = Pc * 1e5  # Convert to Pa from bar
 
         # V_c (critical volume)
-        self.Vc = -0.00435 + (np.matmul(self.Nij, Vck))  # m^3/kmol
+        self.Vc = -0.00435 + (get_sum("vck"))  # m^3/kmol
         self.Vc *= 1e-3  # Convert to m^3/mol
 
         # T_b (boiling temperature)
-        self.Tb = 204.359 * np.log(np.matmul(self.Nij, Tbk))  # K
+        self.Tb = 204.359 * np.log(get_sum("tbk"))  # K
 
         # T_m (melting temperature)
-        self.Tm = 102.425 * np.log(np.matmul(self.Nij, Tmk))  # K
+        self.Tm = 102.425 * np.log(get_sum("tmk"))  # K
 
         # H_f (enthalpy of formation)
-        self.Hf = 10.835 + np.matmul(self.Nij, hfk)  # kJ/mol
+        self.Hf = 10.835 + get_sum("hfk")  # kJ/mol
         self.Hf *= 1e3  # Convert to J/mol
 
         # G_f (Gibbs free energy)
-        self.Gf = -14.828 + np.matmul(self.Nij, gfk)  # kJ/mol
+        self.Gf = -14.828 + get_sum("gfk")  # kJ/mol
         self.Gf *= 1e3  # Convert to J/mol
 
         # H_v,stp (enthalpy of vaporization at 298 K)
-        self.Hv_stp = 6.829 + (np.matmul(self.Nij, hvk))  # kJ/mol
+        self.Hv_stp = 6.829 + (get_sum("hvk"))  # kJ/mol
         self.Hv_stp *= 1e3  # Convert to J/mol
 
         # omega (accentric factor)
-        self.omega = 0.4085 * np.log(np.matmul(self.Nij, wk) + 1.1507) ** (1.0 / 0.5050)
+        self.omega = 0.4085 * np.log(get_sum("wk") + 1.1507) ** (1.0 / 0.5050)
 
         # V_m (molar liquid volume at 298 K)
-        self.Vm_stp = 0.01211 + np.matmul(self.Nij, Vmk)  # m^3/kmol
+        self.Vm_stp = 0.01211 + get_sum("vmk")  # m^3/kmol
         self.Vm_stp *= 1e-3  # Convert to m^3/mol
 
         # C_p,stp (specific heat at 298 K)
-        self.Cp_stp = np.matmul(self.Nij, cpak) - 19.7779  # J/mol/K
+        self.Cp_stp = get_sum("CpAk") - 19.7779  # J/mol/K
 
         # Temperature corrections for C_p
-        self.Cp_B = np.matmul(self.Nij, cpbk)
-        self.Cp_C = np.matmul(self.Nij, cpck)
+        self.Cp_B = get_sum("CpBk")
+        self.Cp_C = get_sum("CpCk")
 
         # L_v,stp (latent heat of vaporization at 298 K)
         self.Lv_stp = self.Hv_stp / self.MW  # J/kg
@@ -212,6 +299,236 @@ class fuel:
         )  # Angstroms
         self.sigma *= 1e-10  # Convert from Angstroms to m
 
+        if useCache:
+            self.save_cache(self.cacheFile)
+
+    # -------------------------------------------------------------------------
+    # Compiled cache
+    # -------------------------------------------------------------------------
+    def input_hash(self):
+        """
+        Hash the contents of the files the GCM properties are derived from.
+
+        :return: Hexadecimal SHA-256 digest of the gcData, groupDecomposition and GCM table files.
+        :rtype: str
+        """
+        h = hashlib.sha256(f"v{self.CACHE_VERSION}".encode())
+        for file in [self.gcxgcFile, self.groupDecompFile, self.gcmTableFile]:
+            h.update(file_hash(file).encode())
+        return h.hexdigest()
+
+    def save_cache(self, cacheFile):
+        """
+        Store the derived GCM properties in a compiled cache file.
+
+        :meta private: The file holds a one-line JSON header followed by the raw array data.
+
+        :param cacheFile: Path to the cache file.
+        :type cacheFile: str
+        """
+        arrays = {
+            "props": np.vstack([getattr(self, prop) for prop in self.CACHED_PROPS]),
+            "Nij": self.Nij,
+            "fam": self.fam,
+            "Y_0": self.Y_0,
+        }
+        arrays = {key: np.ascontiguousarray(a) for key, a in arrays.items()}
+        header = {
+            "version": self.CACHE_VERSION,
+            "props": list(self.CACHED_PROPS),
+            "compounds": self.compounds,
+            "pelephysics_keys": self.pelephysics_keys,
+            "arrays": [[key, a.dtype.str, a.shape] for key, a in arrays.items()],
+        }
+
+        # Write to a temporary file first so concurrent readers never see a partial cache
+        os.makedirs(os.path.dirname(cacheFile), exist_ok=True)
+        tmpFile = f"{cacheFile}.{os.getpid()}.tmp"
+        with open(tmpFile, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            for a in arrays.values():
+                f.write(a.tobytes())
+        os.replace(tmpFile, cacheFile)
+
+    def load_cache(self, cacheFile):
+        """
+        Load the derived GCM properties from a compiled cache file.
+
+        :param cacheFile: Path to the cache file.
+        :type cacheFile: str
+        :return: True if the cache was loaded, False if it does not exist or is invalid.
+        :rtype: bool
+        """
+        try:
+            with open(cacheFile, "rb") as f:
+                header = json.loads(f.readline())
+                buffer = bytearray(f.read())
+            if header["version"] != self.CACHE_VERSION or header["props"] != list(
+                self.CACHED_PROPS
+            ):
+                return False
+
+            # A truncated or padded body does not match the sizes in the header
+            layout = [
+                (key, np.dtype(dtype), tuple(shape))
+                for key, dtype, shape in header["arrays"]
+            ]
+            sizes = [dtype.itemsize * int(np.prod(shape)) for _, dtype, shape in layout]
+            if sum(sizes) != len(buffer):
+                return False
+
+            # Arrays are views into a writable buffer, so no data is copied
+            arrays = {}
+            offset = 0
+            for (key, dtype, shape), size in zip(layout, sizes):
+                arrays[key] = np.frombuffer(
+                    buffer, dtype=dtype, count=size // dtype.itemsize, offset=offset
+                ).reshape(shape)
+                offset += size
+            num_compounds, num_groups = arrays["Nij"].shape
+            if arrays["props"].shape != (len(self.CACHED_PROPS), num_compounds):
+                return False
+            compounds = header["compounds"]
+            pelephysics_keys = header["pelephysics_keys"]
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return False
+
+        self.Nij = arrays["Nij"]
+        self.fam = arrays["fam"]
+        self.Y_0 = arrays["Y_0"]
+        self.compounds = compounds
+        self.pelephysics_keys = pelephysics_keys
+        self.num_compounds = num_compounds
+        self.num_groups = num_groups
+        for prop, values in zip(self.CACHED_PROPS, arrays["props"]):
+            setattr(self, prop, values)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Precomputed coefficients
+    # -------------------------------------------------------------------------
+    def __setattr__(self, name, value):
+        # Reassigning a property the coefficients depend on invalidates them, and
+        # it is stored as a read-only copy so in-place modifications raise
+        if name in self.COEFFICIENT_INPUTS:
+            value = np.array(value)
+            value.setflags(write=False)
+            self.__dict__["_coefficients"] = None
+        object.__setattr__(self, name, value)
+
+    def coefficients(self):
+        """
+        Get the temperature-independent coefficients of the property correlations.
+
+        :meta private: Computed on first use and recomputed when a property in COEFFICIENT_INPUTS is reassigned. These properties are read-only arrays, so modified values must be assigned as a new array, e.g. fuel.Tc = fuel.Tc * 1.05.
+
+        :return: Coefficient block of shape (len(COEFFICIENTS), num_compounds), rows ordered as COEFFICIENTS.
+        :rtype: np.ndarray
+        """
+        if self._coefficients is None:
+            Tb_cels = K2C(self.Tb)
+            Trb = self.Tb / self.Tc
+
+            # Brock-Bird and Pitzer surface tension factors
+            Pc = self.Pc * 1e-5  # convert from Pa to bar
+            w = self.omega
+            Q_brock_bird = (
+                0.1196 * (1.0 + (Trb * np.log(Pc / 1.01325)) / (1.0 - Trb)) - 0.279
+            )
+            Q_pitzer = (
+                (1.86 + 1.18 * w)
+                / 19.05
+                * (((3.75 + 0.91 * w) / (0.291 - 0.08 * w)) ** (2.0 / 3.0))
+            )
+            st_scale = Pc ** (2.0 / 3.0) * self.Tc ** (1.0 / 3.0) * 1e-3  # N/m
+
+            # Latini family dependent parameters, indexed by fam
+            Astar = self.LATINI_ASTAR[self.fam]
+            alpha = 1.2
+            beta = self.LATINI_BETA[self.fam]
+            gamma = 0.167
+            MW_beta = (self.MW * 1e3) ** beta  # convert from kg/mol to g/mol
+
+            # Lee-Kesler vapor pressure in terms of T instead of Tr = T/Tc
+            lk = [
+                a + self.omega * b
+                for a, b in zip(
+                    (5.92714, -6.09648, -1.28862, 0.169347),
+                    (15.2518, -15.6875, -13.4721, 0.43577),
+                )
+            ]
+
+            # Ambrose-Walton vapor pressure with f0 + omega*f1 + omega^2*f2 combined
+            aw = [
+                a + self.omega * b + self.omega**2 * c
+                for a, b, c in zip(
+                    (-5.97616, 1.29874, -0.60394, -1.06841),
+                    (-5.03365, 1.11505, -5.41217, -7.46628),
+                    (-0.64771, 2.41539, -4.26979, -3.25259),
+                )
+            ]
+
+            Tstp = 298.0
+            coefficients = {
+                "nu_a": 442.78 + 1.6452 * Tb_cels,
+                "nu_b": 239 - 0.19 * Tb_cels,
+                "Vm_phi_stp": (1 - (Tstp / self.Tc)) ** (2.0 / 7.0),
+                "Vm_log_z": np.log(0.29056 - 0.08775 * self.omega),
+                "Lv_scale": self.Lv_stp / (1.0 - Trb) ** 0.38,
+                "st_brock_bird": st_scale * Q_brock_bird,
+                "st_pitzer": st_scale * Q_pitzer,
+                "tc_A": Astar * self.Tb**alpha / (MW_beta * self.Tc**gamma),
+                "psat_lk_A": np.log(self.Pc) + lk[0] - lk[2] * np.log(self.Tc),
+                "psat_lk_B": lk[1] * self.Tc,
+                "psat_lk_C": lk[2],
+                "psat_lk_D": lk[3] / self.Tc**6,
+                "psat_aw_a": aw[0],
+                "psat_aw_b": aw[1],
+                "psat_aw_c": aw[2],
+                "psat_aw_d": aw[3],
+            }
+            self._coefficients = np.vstack(
+                [coefficients[name] for name in self.COEFFICIENTS]
+            )
+        return self._coefficients
+
+    def reset_coefficients(self):
+        """
+        Discard the precomputed coefficients, which are recomputed on next use.
+        """
+        self._coefficients = None
+
+    def _coefficient(self, name, comp_idx=None):
+        """
+        Get one row of the coefficient block.
+
+        :param name: Name of the coefficient in COEFFICIENTS.
+        :type name: str
+        :param comp_idx: Index of compound to get the coefficient for.
+        :type comp_idx: int, optional
+        :return: Coefficient of each compound.
+        :rtype: np.ndarray
+        """
+        row = self.coefficients()[self._COEFFICIENT_INDEX[name]]
+        return row if comp_idx is None else row[comp_idx]
+
+    def _coefficient_rows(self, names, comp_idx=None):
+        """
+        Get several rows of the coefficient block, fetching the block once.
+
+        :param names: Names of the coefficients in COEFFICIENTS.
+        :type names: tuple of str
+        :param comp_idx: Index of compound to get the coefficients for.
+        :type comp_idx: int, optional
+        :return: Coefficients of each compound, one entry per name.
+        :rtype: list of np.ndarray
+        """
+        block = self.coefficients()
+        index = self._COEFFICIENT_INDEX
+        if comp_idx is None:
+            return [block[index[name]] for name in names]
+        return [block[index[name], comp_idx] for name in names]
+
     # -------------------------------------------------------------------------
     # Member functions
     # -------------------------------------------------------------------------
@@ -219,33 +536,30 @@ class fuel:
         """
         Calculate the mean molecular weight of the mixture.
 
-        :param Yi: Mass fractions of each compound.
+        :param Yi: Mass fractions of each compound, shape (num_compounds,) or (nY, num_compounds).
         :type Yi: np.ndarray
-        :return: Mean molecular weight of the mixture in kg/mol.
-        :rtype: float
+        :return: Mean molecular weight of the mixture in kg/mol, zero for compositions that sum to zero.
+        :rtype: float or np.ndarray
         """
-        if np.sum(Yi) != 0:
-            Mbar = 1 / np.sum(Yi / self.MW)  # mean molar weight of the mixture
-        else:
-            Mbar = 0.0
+        Yi = np.asarray(Yi)
+        nonzero = np.sum(Yi, axis=-1) != 0
+        with np.errstate(divide="ignore"):
+            # mean molar weight of the mixture
+            Mbar = np.where(nonzero, 1 / np.sum(Yi / self.MW, axis=-1), 0.0)
 
-        return Mbar
+        return Mbar[()]
 
     def mass2Y(self, mass):
         """
         Calculate the mass fractions from the mass of each component.
 
-        :param mass: Mass of each compound.
+        :param mass: Mass of each compound, shape (num_compounds,) or (nY, num_compounds).
         :type mass: np.ndarray
-        :return: Mass fractions of the compounds (shape: num_compounds,).
+        :return: Mass fractions of the compounds (shape: num_compounds,) or (nY, num_compounds).
         :rtype: np.ndarray
         """
         # Normalize to get group mole fractions
-        total_mass = np.sum(mass)
-        if total_mass != 0:
-            Yi = mass / total_mass
-        else:
-            Yi = np.zeros_like(self.MW)
+        Yi = _normalize(mass)
 
         return Yi
 
@@ -253,20 +567,16 @@ class fuel:
         """
         Calculate the mole fractions from the mass of each component.
 
-        :param mass: Mass of each compound.
+        :param mass: Mass of each compound, shape (num_compounds,) or (nY, num_compounds).
         :type mass: np.ndarray
-        :return: Mass fractions of the compounds (shape: num_compounds,).
+        :return: Mass fractions of the compounds (shape: num_compounds,) or (nY, num_compounds).
         :rtype: np.ndarray
         """
         # Calculate the number of moles for each compound
         num_mole = mass / self.MW
 
         # Normalize to get group mole fractions
-        total_moles = np.sum(num_mole)
-        if total_moles != 0:
-            Xi = num_mole / total_moles
-        else:
-            Xi = np.zeros_like(self.MW)
+        Xi = _normalize(num_mole)
 
         return Xi
 
@@ -274,20 +584,16 @@ class fuel:
         """
         Calculate the mass fractions from the mole fractions of each component.
 
-        :param Xi: Mole fractions of each compound.
+        :param Xi: Mole fractions of each compound, shape (num_compounds,) or (nY, num_compounds).
         :type Xi: np.ndarray
-        :return: Mass fractions of the compounds (shape: num_compounds,).
+        :return: Mass fractions of the compounds (shape: num_compounds,) or (nY, num_compounds).
         :rtype: np.ndarray
         """
         # Calculate the mass for each compound
         mass = Xi * self.MW
 
         # Normalize to get group mass fractions
-        total_mass = np.sum(mass)
-        if total_mass != 0:
-            Yi = mass / total_mass
-        else:
-            Yi = np.zeros_like(self.MW)
+        Yi = _normalize(mass)
 
         return Yi
 
@@ -295,25 +601,52 @@ class fuel:
         """
         Calculate the mole fractions from the mass fractions of each component.
 
-        :param Yi: Mass fractions of each compound.
+        :param Yi: Mass fractions of each compound, shape (num_compounds,) or (nY, num_compounds).
         :type Yi: np.ndarray
-        :return: Mole fractions of the compounds (shape: num_compounds,).
+        :return: Mole fractions of the compounds (shape: num_compounds,) or (nY, num_compounds).
         :rtype: np.ndarray
         """
+        # Compositions that sum to zero have Mbar = 0 and therefore Xi = 0
         Mbar = self.mean_molecular_weight(Yi)
-        if np.sum(Yi) != 0:
-            Xi = Mbar * Yi / self.MW
-        else:
-            Xi = np.zeros_like(self.MW)
+        Xi = np.asarray(Mbar)[..., np.newaxis] * Yi / self.MW
 
         return Xi
 
+    def _temperature(self, T, comp_idx=None):
+        """
+        Shape temperatures to broadcast against the per-compound properties.
+
+        :param T: Temperature in Kelvin.
+        :type T: float or np.ndarray
+        :param comp_idx: Index of compound to calculate property for.
+        :type comp_idx: int, optional
+        :return: T with a trailing compound axis if T is an array and comp_idx is None.
+        :rtype: float or np.ndarray
+        """
+        if comp_idx is None and np.ndim(T) > 0:
+            return np.asarray(T, dtype=float)[..., np.newaxis]
+        return T
+
+    def _reduced_temperature(self, T, comp_idx=None):
+        """
+        Reduced temperature T/Tc shaped to broadcast against the per-compound properties.
+
+        :param T: Temperature in Kelvin.
+        :type T: float or np.ndarray
+        :param comp_idx: Index of compound to calculate property for.
+        :type comp_idx: int, optional
+        :return: Reduced temperature of each compound.
+        :rtype: np.ndarray
+        """
+        Tc = self.Tc if comp_idx is None else self.Tc[comp_idx]
+        return self._temperature(T, comp_idx) / Tc
+
     def density(self, T, comp_idx=None):
         """
         Calculate the density of each component at temperature T.
 
-        :param T: Temperature of the mixture in Kelvin.
-        :type T: float
+        :param T: Temperature of the mixture in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
         :param comp_idx: Index of compound to calculate property for.
         :type comp_idx: int, optional
         :return: Density of each compound in kg/m^3.
@@ -336,8 +669,8 @@ class fuel:
         :meta private: This uses Dutt's equation (4.23) from "Viscosity of Liquids".
         :meta private: The equation predicts viscosity in mm^2/s and is converted to SI units.
 
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
         :param comp_idx: Index of compound to calculate property for.
         :type comp_idx: int, optional
         :return: Viscosity of each component in m^2/s.
@@ -345,14 +678,11 @@ class fuel:
         """
 
         # Convert temperature to Celsius
-        T_cels = K2C(T)
-        if comp_idx is None:
-            Tb_cels = K2C(self.Tb)
-        else:
-            Tb_cels = K2C(self.Tb[comp_idx])
+        T_cels = K2C(self._temperature(T, comp_idx))
 
         # RHS of Dutt's equation (4.23) in Viscosity of Liquids
-        rhs = -3.0171 + (442.78 + 1.6452 * Tb_cels) / (T_cels + 239 - 0.19 * Tb_cels)
+        nu_a, nu_b = self._coefficient_rows(("nu_a", "nu_b"), comp_idx)
+        rhs = -3.0171 + nu_a / (T_cels + nu_b)
         nu_i = np.exp(rhs)  # Viscosity in mm^2/s
 
         # Convert to SI (m^2/s)
@@ -366,8 +696,8 @@ class fuel:
 
         :meta private: Uses Dutt's equation (4.23) for kinematic viscosity, combined with density.
 
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
         :param comp_idx: Index of compound to calculate property for.
         :type comp_idx: int, optional
         :return: Dynamic viscosity in Pa*s.
@@ -383,15 +713,15 @@ class fuel:
         """
         Compute specific heat capacity at a given temperature.
 
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
         :param comp_idx: Index of compound to calculate property for.
         :type comp_idx: int, optional
         :return: Specific heat capacity in J/mol/K.
         :rtype: np.ndarray
         """
 
-        theta = (T - 298) / 700
+        theta = (self._temperature(T, comp_idx) - 298) / 700
         if comp_idx is None:
             Cp_stp = self.Cp_stp
             Cp_B = self.Cp_B
@@ -409,8 +739,8 @@ class fuel:
         """
         Compute liquid specific heat capacity in J/kg/K at a given temperature.
 
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
         :param comp_idx: Index of compound to calculate property for.
         :type comp_idx: int, optional
         :return: Specific heat capacity in J/kg/K.
@@ -429,8 +759,8 @@ class fuel:
 
         :meta private: Can use Ambrose-Walton or Lee-Kesler correlations (default Lee-Kesler).
 
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
         :param comp_idx: Index of compound to calculate property for.
         :type comp_idx: int, optional
         :param correlation: Correlation method ("Ambrose-Walton" or "Lee-Kesler").
@@ -438,13 +768,26 @@ class fuel:
         :return: Saturated vapor pressure in Pa.
         :rtype: np.ndarray
         """
+        Tr = self._reduced_temperature(T, comp_idx)
+        return self._psat(Tr, comp_idx=comp_idx, correlation=correlation)
 
+    def _psat(self, Tr, comp_idx=None, correlation="Lee-Kesler"):
+        """
+        Compute saturated vapor pressure from the reduced temperature, see psat.
+
+        :param Tr: Reduced temperature of each compound.
+        :type Tr: np.ndarray
+        :param comp_idx: Index of compound to calculate property for.
+        :type comp_idx: int, optional
+        :param correlation: Correlation method ("Ambrose-Walton" or "Lee-Kesler").
+        :type correlation: str, optional
+        :return: Saturated vapor pressure in Pa.
+        :rtype: np.ndarray
+        """
         if comp_idx is None:
-            Tr = T / self.Tc
             Pc = self.Pc
             omega = self.omega
         else:
-            Tr = T / self.Tc[comp_idx]
             Pc = self.Pc[comp_idx]
             omega = self.omega[comp_idx]
 
@@ -482,132 +825,175 @@ class fuel:
         psat = Pc * rhs
         return psat
 
-    def psat_antoine_coeffs(self, Tvals=None, units="mks", correlation="Lee-Kesler"):
+    def dpsat_dT(self, T, comp_idx=None, correlation="Lee-Kesler"):
+        """
+        Compute the temperature derivative of the saturated vapor pressure.
+
+        :meta private: Analytic derivative of the Ambrose-Walton or Lee-Kesler correlations (default Lee-Kesler), see psat.
+
+        :param T: Temperature in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
+        :param comp_idx: Index of compound to calculate property for.
+        :type comp_idx: int, optional
+        :param correlation: Correlation method ("Ambrose-Walton" or "Lee-Kesler").
+        :type correlation: str, optional
+        :return: Derivative of the saturated vapor pressure in Pa/K.
+        :rtype: np.ndarray
+        """
+        Tr = self._reduced_temperature(T, comp_idx)
+        Tc = self.Tc if comp_idx is None else self.Tc[comp_idx]
+        psat = self._psat(Tr, comp_idx=comp_idx, correlation=correlation)
+        return psat * self._dlog_psat_dTr(Tr, comp_idx, correlation) / Tc
+
+    def _dlog_psat_dTr(self, Tr, comp_idx=None, correlation="Lee-Kesler"):
+        """
+        Compute the derivative of log(psat) with respect to the reduced temperature, see dpsat_dT.
+
+        :param Tr: Reduced temperature of each compound.
+        :type Tr: np.ndarray
+        :param comp_idx: Index of compound to calculate property for.
+        :type comp_idx: int, optional
+        :param correlation: Correlation method ("Ambrose-Walton" or "Lee-Kesler").
+        :type correlation: str, optional
+        :return: Derivative of log(psat) with respect to Tr.
+        :rtype: np.ndarray
+        """
+        omega = self.omega if comp_idx is None else self.omega[comp_idx]
+
+        if correlation.casefold() == "Ambrose-Walton".casefold():
+            # d(g(tau)/Tr)/dTr = -(g'(tau) + g(tau)/Tr)/Tr with tau = 1 - Tr
+            tau = 1 - Tr
+
+            def term(a1, a2, a3, a4):
+                g = a1 * tau + a2 * tau**1.5 + a3 * tau**2.5 + a4 * tau**5.0
+                dg = (
+                    a1 + 1.5 * a2 * tau**0.5 + 2.5 * a3 * tau**1.5 + 5.0 * a4 * tau**4.0
+                )
+                return -(dg + g / Tr) / Tr
+
+            df0 = term(-5.97616, 1.29874, -0.60394, -1.06841)
+            df1 = term(-5.03365, 1.11505, -5.41217, -7.46628)
+            df2 = term(-0.64771, 2.41539, -4.26979, -3.25259)
+            return df0 + omega * df1 + omega**2 * df2
+
+        # Default correlation is Lee-Kesler
+        df0 = (6.09648 / Tr**2) - 1.28862 / Tr + 6 * 0.169347 * (Tr**5)
+        df1 = (15.6875 / Tr**2) - 13.4721 / Tr + 6 * 0.43577 * (Tr**5)
+        return df0 + omega * df1
+
+    def psat_antoine_coeffs(
+        self,
+        Tvals=None,
+        units="mks",
+        correlation="Lee-Kesler",
+        return_residuals=False,
+    ):
         """
         Estimate Antoine coefficients for vapor pressure of an individual compound.
 
+        :meta private: All compounds are fit together, see fit_antoine.
+
         :param Tvals: Temperature range or nodes for Antoine fit in Kelvin (default [273.15, Tb_i]).
         :type Tvals: np.ndarray, optional
         :param units: Units for pressure in fit ("mks", "cgs", "bar", "atm")
         :type units: str, optional
         :param correlation: Correlation method ("Ambrose-Walton" or "Lee-Kesler").
         :type correlation: str, optional
-        :return: Coefficients A, B, C, D
-        :rtype: 4 np.ndarrays
+        :param return_residuals: Also return the RMS residual of log10(psat) for each compound.
+        :type return_residuals: bool, optional
+        :return: Coefficients A, B, C, D (and residuals if requested)
+        :rtype: 4 np.ndarrays (5 with residuals)
         """
 
-        # Define or get temperature nodes for fit
+        # Define or get temperature nodes for fit (nT, num_compounds)
         if Tvals is None:
             print("Tvals not specified, using [273.15, Tb_i] for each compound.")
-            # Initialize as zeros for now, calculated for each compound later
-            T = np.zeros(20)
+            T = np.linspace(273.15, self.Tb, 20)
         elif len(Tvals) == 2:
             T = np.linspace(Tvals[0], Tvals[1], 20)
         elif len(Tvals) > 2:
-            T = Tvals
+            T = np.asarray(Tvals, dtype=float)
         else:
             raise ValueError("Tvals must be None, length 2, or length > 2.")
-
-        # Antoine equation log10(p) = A - B/(C + T)
-        def antoine_eq(T, A, B, C):
-            """Antoine equation for vapor pressure."""
-            return A - B / (T + C)
+        T = np.broadcast_to(T.reshape(len(T), -1), (len(T), self.num_compounds))
 
         # Determine conversion factor for pressure in MKS, CGS, bar, or atm
-        D = 1  # default is Pa
-        if units.lower() == "bar":
-            D = 1e5
-        elif units.lower() == "atm":
-            D = 1.01325e5
-        elif units.lower() == "cgs":
-            D = 1 / 10  # dyne/cm^2
-
-        # Fit Antoine coefficients for each compound
-        A = np.zeros(self.num_compounds)
-        B = np.zeros(self.num_compounds)
-        C = np.zeros(self.num_compounds)
-        for i in range(self.num_compounds):
-            # Update T if not specified
-            if Tvals is None:
-                T = np.linspace(273.15, self.Tb[i], 20)
-            Pvals = np.zeros_like(T)
-            for k in range(len(T)):
-                Pvals[k] = 1 / D * self.psat(T[k], correlation=correlation)[i]
-
-            logP = np.log10(Pvals)
-            popt, _ = curve_fit(antoine_eq, T, logP, p0=[1, 1e3, -1])
-            A[i], B[i], C[i] = popt
+        D = antoine_pressure_scale(units)
+
+        # Vapor pressure of each compound at its own temperature nodes
+        logP = np.log10(self._psat(T / self.Tc, correlation=correlation) / D)
+
+        # Fit Antoine coefficients for all compounds at once
+        A, B, C, residuals = fit_antoine(T, logP)
         D = D + np.zeros(self.num_compounds)  # make D an array
+        if return_residuals:
+            return A, B, C, D, residuals
         return A, B, C, D
 
     def molar_liquid_vol(self, T, comp_idx=None):
         """
         Compute molar liquid volume with temperature correction.
 
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
         :param comp_idx: Index of compound to calculate property for.
         :type comp_idx: int, optional
         :return: Molar liquid volume in m^3/mol.
         :rtype: np.ndarray
         """
+        Tr = self._reduced_temperature(T, comp_idx)
+        return self._molar_liquid_vol(Tr, comp_idx=comp_idx)
 
-        Tstp = 298.0
-        if comp_idx is None:
-            Tc = self.Tc
-            omega = self.omega
-            Vm_stp = self.Vm_stp
-        else:
-            Tc = np.array([self.Tc[comp_idx]])
-            omega = np.array([self.omega[comp_idx]])
-            Vm_stp = np.array([self.Vm_stp[comp_idx]])
-        phi = np.zeros_like(Tc)
-        for i in range(len(Tc)):
-            if T > Tc[i]:
-                phi[i] = -((1 - (Tstp / Tc[i])) ** (2.0 / 7.0))
-            else:
-                phi[i] = ((1 - (T / Tc[i])) ** (2.0 / 7.0)) - (
-                    (1 - (Tstp / Tc[i])) ** (2.0 / 7.0)
-                )
-        z = 0.29056 - 0.08775 * omega
-        Vmi = Vm_stp * np.power(z, phi)
-        if comp_idx is not None:
-            Vmi = Vmi[0]
+    def _molar_liquid_vol(self, Tr, comp_idx=None):
+        """
+        Compute molar liquid volume from the reduced temperature, see molar_liquid_vol.
+
+        :param Tr: Reduced temperature of each compound.
+        :type Tr: np.ndarray
+        :param comp_idx: Index of compound to calculate property for.
+        :type comp_idx: int, optional
+        :return: Molar liquid volume in m^3/mol.
+        :rtype: np.ndarray
+        """
+        Vm_stp = self.Vm_stp if comp_idx is None else self.Vm_stp[comp_idx]
+
+        Vm_phi_stp, Vm_log_z = self._coefficient_rows(
+            ("Vm_phi_stp", "Vm_log_z"), comp_idx
+        )
+
+        # Supercritical compounds (Tr > 1) reduce to phi = -(1 - Tstp/Tc)^(2/7)
+        phi = (np.maximum(1 - Tr, 0.0) ** (2.0 / 7.0)) - Vm_phi_stp
+        Vmi = Vm_stp * np.exp(phi * Vm_log_z)
         return Vmi
 
     def latent_heat_vaporization(self, T, comp_idx=None):
         """
         Calculate latent heat of vaporization adjusted for temperature.
 
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
         :param comp_idx: Index of compound to calculate property for.
         :type comp_idx: int, optional
         :return: Latent heat of vaporization in J/kg.
         :rtype: np.ndarray
         """
-        if comp_idx is None:
-            Tc = self.Tc
-            Tb = self.Tb
-            Lv_stp = self.Lv_stp
-        else:
-            Tc = np.array([self.Tc[comp_idx]])
-            Tb = np.array([self.Tb[comp_idx]])
-            Lv_stp = np.array([self.Lv_stp[comp_idx]])
-
-        # Reduced temperatures
-        Tr = T / Tc
-        Trb = Tb / Tc
-
-        Lvi = np.zeros_like(Tc)
-        for i in range(len(Tc)):
-            if T > Tc[i]:
-                Lvi[i] = 0.0
-            else:
-                Lvi[i] = Lv_stp[i] * (((1.0 - Tr[i]) / (1.0 - Trb[i])) ** 0.38)
+        Tr = self._reduced_temperature(T, comp_idx)
+        return self._latent_heat_vaporization(Tr, comp_idx=comp_idx)
 
-        if comp_idx is not None:
-            Lvi = Lvi[0]
+    def _latent_heat_vaporization(self, Tr, comp_idx=None):
+        """
+        Compute latent heat of vaporization from the reduced temperature, see latent_heat_vaporization.
+
+        :param Tr: Reduced temperature of each compound.
+        :type Tr: np.ndarray
+        :param comp_idx: Index of compound to calculate property for.
+        :type comp_idx: int, optional
+        :return: Latent heat of vaporization in J/kg.
+        :rtype: np.ndarray
+        """
+        # Latent heat vanishes for supercritical compounds (Tr > 1)
+        Lv_scale = self._coefficient("Lv_scale", comp_idx)
+        Lvi = Lv_scale * np.maximum(1.0 - Tr, 0.0) ** 0.38
         return Lvi
 
     def diffusion_coeff(
@@ -618,28 +1004,53 @@ class fuel:
         epsilonByKB_gas=97.0,
         MW_gas=28.97e-3,
         correlation="Tee",
+        gas=None,
     ):
         """
         Compute diffusion coefficients using Lennard-Jones parameters.
 
         :meta private: Uses Wilke and Lee method (Poling, equation 11-4.1).
         :meta private: Ambient gas defaults to air parameters.
+        :meta private: Arrays of gas parameters of shape (ngas,) give results of shape (ngas,) + np.broadcast(p, T).shape + (num_compounds,).
 
-        :param p: Pressure in Pa.
-        :type p: float
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param p: Pressure in Pa. Broadcast against T, e.g. p[:, None] with T of shape (nT,) gives results of shape (np, nT, num_compounds).
+        :type p: float or np.ndarray
+        :param T: Temperature in Kelvin. Broadcast against p.
+        :type T: float or np.ndarray
         :param sigma_gas: Collision diameter in m.
-        :type sigma_gas: float, optional
+        :type sigma_gas: float or np.ndarray, optional
         :param epsilonByKB_gas: Well depth over Boltzmann constant, in K.
-        :type epsilonByKB_gas: float, optional
+        :type epsilonByKB_gas: float or np.ndarray, optional
         :param MW_gas: Mean molecular weight of ambient gas in kg/mol.
-        :type MW_gas: float, optional
+        :type MW_gas: float or np.ndarray, optional
         :param correlation: Method to calculate sigma and epsilon ("Tee" or "Wilke").
         :type correlation: str, optional
-        :return: Diffusion coefficient.
+        :param gas: Name or list of names of bath gases in BATH_GASES, overriding sigma_gas, epsilonByKB_gas and MW_gas.
+        :type gas: str or list of str, optional
+        :return: Diffusion coefficient in m^2/s of shape np.broadcast(p, T).shape + (num_compounds,).
         :rtype: np.ndarray
         """
+        if gas is not None:
+            sigma_gas, epsilonByKB_gas, MW_gas = bath_gas(gas)
+
+        # Append a compound axis to the broadcast (p, T) states
+        p, T = np.broadcast_arrays(
+            np.asarray(p, dtype=float), np.asarray(T, dtype=float)
+        )
+        p = p[..., np.newaxis]
+        T = T[..., np.newaxis]
+
+        # Prepend a gas axis when several bath gases are given
+        sigma_gas, epsilonByKB_gas, MW_gas = np.broadcast_arrays(
+            np.asarray(sigma_gas, dtype=float),
+            np.asarray(epsilonByKB_gas, dtype=float),
+            np.asarray(MW_gas, dtype=float),
+        )
+        if sigma_gas.ndim > 0:
+            gas_shape = sigma_gas.shape + (1,) * T.ndim
+            sigma_gas = sigma_gas.reshape(gas_shape)
+            epsilonByKB_gas = epsilonByKB_gas.reshape(gas_shape)
+            MW_gas = MW_gas.reshape(gas_shape)
 
         # Method of Tee for calculating liquid sigma and epsilon
         if correlation.casefold() == "Tee".casefold():
@@ -647,9 +1058,8 @@ class fuel:
             epsilonByKB_i = self.epsilonByKB  # K
         else:
             # Method of Wilke & Lee calculating liquid sigma and epsilon
-            Vmb_i = np.zeros_like(self.Tb)
-            for n in range(self.num_compounds):
-                Vmb_i[n] = self.molar_liquid_vol(self.Tb[n])[n] * 1e6  # cm^3/mol
+            # Molar volume of each compound at its own boiling point
+            Vmb_i = self._molar_liquid_vol(self.Tb / self.Tc) * 1e6  # cm^3/mol
             sigma_i = 1.18 * Vmb_i ** (1 / 3)  # Angstroms, Poling (11-4.2)
             epsilonByKB_i = 1.15 * self.Tb  # K , Poling (11-4.3)
 
@@ -702,8 +1112,8 @@ class fuel:
 
         :meta private: Uses Brock-Bird (default) or Pitzer correlations (Poling 12-3.5, 12-3.7).
 
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
         :param comp_idx: Index of compound to calculate property for.
         :type comp_idx: int, optional
         :param correlation: Correlation method ("Brock-Bird" or "Pitzer").
@@ -711,35 +1121,28 @@ class fuel:
         :return: Surface tension in N/m.
         :rtype: np.ndarray
         """
-        if comp_idx is None:
-            Tc = self.Tc
-            Pc = self.Pc
-            Tb = self.Tb
-            omega = self.omega
-        else:
-            Tc = np.array([self.Tc[comp_idx]])
-            Pc = np.array([self.Pc[comp_idx]])
-            Tb = np.array([self.Tb[comp_idx]])
-            omega = np.array([self.omega[comp_idx]])
-        Tr = T / Tc
-        Pc = Pc * 1e-5  # convert from Pa to bar
+        Tr = self._reduced_temperature(T, comp_idx)
+        return self._surface_tension(Tr, comp_idx=comp_idx, correlation=correlation)
 
+    def _surface_tension(self, Tr, comp_idx=None, correlation="Brock-Bird"):
+        """
+        Compute surface tension from the reduced temperature, see surface_tension.
+
+        :param Tr: Reduced temperature of each compound.
+        :type Tr: np.ndarray
+        :param comp_idx: Index of compound to calculate property for.
+        :type comp_idx: int, optional
+        :param correlation: Correlation method ("Brock-Bird" or "Pitzer").
+        :type correlation: str, optional
+        :return: Surface tension in N/m.
+        :rtype: np.ndarray
+        """
         if correlation.casefold() == "Brock-Bird".casefold():
-            Tbr = Tb / Tc
-            Q = 0.1196 * (1.0 + (Tbr * np.log(Pc / 1.01325)) / (1.0 - Tbr)) - 0.279
+            st_scale = self._coefficient("st_brock_bird", comp_idx)
         else:
-            w = omega
-            Q = (
-                (1.86 + 1.18 * w)
-                / 19.05
-                * (((3.75 + 0.91 * w) / (0.291 - 0.08 * w)) ** (2.0 / 3.0))
-            )
-
-        st = Pc ** (2.0 / 3.0) * Tc ** (1.0 / 3.0) * Q * (1 - Tr) ** (11.0 / 9.0)
+            st_scale = self._coefficient("st_pitzer", comp_idx)
 
-        st = st * 1e-3  # Convert from dyn/cm to N/m
-        if comp_idx is not None:
-            st = st[0]
+        st = st_scale * (1 - Tr) ** (11.0 / 9.0)  # N/m
 
         return st
 
@@ -749,70 +1152,195 @@ class fuel:
 
         :meta private: Uses Latini et al. method (Poling equation 10-9.1).
 
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin. An array of shape (nT,) gives results of shape (nT, num_compounds).
+        :type T: float or np.ndarray
         :param comp_idx: Index of compound to calculate property for.
         :type comp_idx: int, optional
         :return: Thermal conductivity in W/m/K.
         :rtype: np.ndarray
         """
-        if comp_idx is None:
-            MW = self.MW
-            Tc = self.Tc
-            Tb = self.Tb
-            fam = self.fam
-        else:
-            MW = np.array([self.MW[comp_idx]])
-            Tc = np.array([self.Tc[comp_idx]])
-            Tb = np.array([self.Tb[comp_idx]])
-            fam = np.array([self.fam[comp_idx]])
-
-        Astar = 0.00350 + np.zeros_like(Tc)
-        alpha = 1.2
-        beta = 0.5 + np.zeros_like(Tc)
-        gamma = 0.167
-        MW_beta = MW * 1e3  # convert from kg/mol to g/mol
-        Tr = T / Tc
-
-        for i in range(len(Tc)):
-            if fam[i] == 1:
-                # Aromatics
-                Astar[i] = 0.0346
-                beta[i] = 1.0
-            elif fam[i] == 2:
-                # Cycloparaffins
-                Astar[i] = 0.0310
-                beta[i] = 1.0
-            elif fam[i] == 3:
-                # Olefins
-                Astar[i] = 0.0361
-                beta[i] = 1.0
-            MW_beta[i] = MW_beta[i] ** beta[i]
-
-        A = Astar * Tb**alpha / (MW_beta * Tc**gamma)
+        Tr = self._reduced_temperature(T, comp_idx)
+        return self._thermal_conductivity(Tr, comp_idx=comp_idx)
+
+    def _thermal_conductivity(self, Tr, comp_idx=None):
+        """
+        Compute thermal conductivity from the reduced temperature, see thermal_conductivity.
+
+        :param Tr: Reduced temperature of each compound.
+        :type Tr: np.ndarray
+        :param comp_idx: Index of compound to calculate property for.
+        :type comp_idx: int, optional
+        :return: Thermal conductivity in W/m/K.
+        :rtype: np.ndarray
+        """
+        A = self._coefficient("tc_A", comp_idx)
         tc = A * (1 - Tr) ** (0.38) / (Tr ** (1 / 6))
 
-        if comp_idx is not None:
-            tc = tc[0]
         return tc
 
+    def evaluate(self, T, Y=None, props=None):
+        """
+        Evaluate several properties in a single pass, sharing intermediate results.
+
+        :meta private: The reduced temperature, molar volume, kinematic viscosity and mole fractions are computed once and reused by every property that needs them.
+        :meta private: Mixture values use the same rules as the mixture_* methods, and the arithmetic mixing_rule for molar_liquid_vol, latent_heat_vaporization and Cl.
+
+        :param T: Temperature in Kelvin, scalar or shape (nT,).
+        :type T: float or np.ndarray
+        :param Y: Mass fractions, shape (num_compounds,) or (nY, num_compounds). Defaults to None for per-compound properties.
+        :type Y: np.ndarray, optional
+        :param props: Names of the properties to evaluate (see fuel.PROPERTIES). Defaults to all.
+        :type props: list of str, optional
+        :return: Property name to per-compound values of shape (..., num_compounds), or mixture values of shape (), (nT,), (nY,) or (nY, nT) if Y is given.
+        :rtype: dict of np.ndarray
+        :raises ValueError: If a property name is not recognized.
+        """
+        if props is None:
+            props = self.PROPERTIES
+        for prop in props:
+            if prop not in self.PROPERTIES:
+                raise ValueError(
+                    f"Unknown property '{prop}', options are {self.PROPERTIES}."
+                )
+
+        # Shared reduced temperature (..., num_compounds)
+        Tr = self._reduced_temperature(T)
+
+        # Per-compound properties, each computed at most once
+        compound = {}
+
+        def get(prop):
+            """Per-compound property, computed on first use."""
+            if prop not in compound:
+                compound[prop] = compound_kernels[prop]()
+            return compound[prop]
+
+        compound_kernels = {
+            "molar_liquid_vol": lambda: self._molar_liquid_vol(Tr),
+            "density": lambda: self.MW / get("molar_liquid_vol"),
+            "viscosity_kinematic": lambda: self.viscosity_kinematic(T),
+            "viscosity_dynamic": lambda: get("viscosity_kinematic") * get("density"),
+            "psat": lambda: self._psat(Tr),
+            "surface_tension": lambda: self._surface_tension(Tr),
+            "thermal_conductivity": lambda: self._thermal_conductivity(Tr),
+            "latent_heat_vaporization": lambda: self._latent_heat_vaporization(Tr),
+            "Cl": lambda: self.Cl(T),
+        }
+
+        if Y is None:
+            return {prop: get(prop) for prop in props}
+
+        # Mixture properties, each computed at most once
+        X = self.Y2X(Y)
+        mixture = {}
+
+        def mix(prop):
+            """Mixture property, computed on first use."""
+            if prop not in mixture:
+                mixture[prop] = mixture_kernels[prop]()
+            return mixture[prop]
+
+        mixture_kernels = {
+            "molar_liquid_vol": lambda: mixing_rule(get("molar_liquid_vol"), X),
+            "density": lambda: _weighted_sum(Y, get("density")),
+            "viscosity_kinematic": lambda: _mix_viscosity(
+                get("viscosity_kinematic"), X
+            ),
+            "viscosity_dynamic": lambda: mix("density") * mix("viscosity_kinematic"),
+            "psat": lambda: _weighted_sum(X, get("psat")),
+            "surface_tension": lambda: mixing_rule(get("surface_tension"), X),
+            "thermal_conductivity": lambda: _mix_thermal_conductivity(
+                get("thermal_conductivity"), Y
+            ),
+            "latent_heat_vaporization": lambda: mixing_rule(
+                get("latent_heat_vaporization"), X
+            ),
+            "Cl": lambda: mixing_rule(get("Cl"), X),
+        }
+
+        return {prop: mix(prop) for prop in props}
+
+    def parcel_properties(self, T, Y, r=None, out=None):
+        """
+        Evaluate the mixture properties of spray parcels, each with its own temperature and composition.
+
+        :meta private: Parcel n gets the properties of mixture_*(Y[n], T[n]) with the default correlations, computed for all parcels in a single pass with row-wise mixing rules instead of the (nY, nT) outer product of evaluate.
+        :meta private: Preallocated arrays in out receive the results, so a time loop can reuse them instead of allocating new arrays every step.
+
+        :param T: Temperature of each parcel in Kelvin, shape (N,).
+        :type T: np.ndarray
+        :param Y: Mass fractions of each parcel, shape (N, num_compounds).
+        :type Y: np.ndarray
+        :param r: Droplet radius of each parcel in meters, shape (N,). Adds the "mass" of each compound in a droplet, see droplet_mass.
+        :type r: np.ndarray, optional
+        :param out: Arrays to write the results to, keyed by property name, of shape (N,) or (N, num_compounds) for "mass".
+        :type out: dict of np.ndarray, optional
+        :return: Property name (see fuel.PARCEL_PROPERTIES) to values of shape (N,), and "mass" of shape (N, num_compounds) if r is given.
+        :rtype: dict of np.ndarray
+        """
+        T = np.asarray(T, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        out = {} if out is None else out
+
+        def row_sum(w, var_n, prop, scale=None):
+            """Weighted sum over the compounds of each parcel, optionally scaled."""
+            result = np.einsum("ij,ij->i", w, var_n, out=out.get(prop))
+            if scale is not None:
+                np.multiply(result, scale, out=result)
+            return result
+
+        # Per-compound properties at the temperature of each parcel (N, num_compounds)
+        Tr = self._reduced_temperature(T)
+        X = self.Y2X(Y)
+        sum_X = np.sum(X, axis=-1)
+        results = {}
+
+        # Mass-weighted density and Kendall-Monroe viscosity
+        rho = self.MW / self._molar_liquid_vol(Tr)
+        results["density"] = row_sum(Y, rho, "density")
+        nu = self.viscosity_kinematic(T) ** (1.0 / 3.0)
+        results["viscosity_dynamic"] = row_sum(X, nu, "viscosity_dynamic")
+        np.power(results["viscosity_dynamic"], 3.0, out=results["viscosity_dynamic"])
+        np.multiply(
+            results["viscosity_dynamic"],
+            results["density"],
+            out=results["viscosity_dynamic"],
+        )
+
+        # Arithmetic mixing rule, Raoult's law and arithmetic pseudo property
+        results["Cl"] = row_sum(X, self.Cl(T), "Cl", sum_X)
+        results["latent_heat_vaporization"] = row_sum(
+            X,
+            self._latent_heat_vaporization(Tr),
+            "latent_heat_vaporization",
+            sum_X,
+        )
+        results["psat"] = row_sum(X, self._psat(Tr), "psat")
+        results["surface_tension"] = row_sum(
+            X, self._surface_tension(Tr), "surface_tension", sum_X
+        )
+
+        if r is not None:
+            results["mass"] = droplet_mass(self, r, Y, T, out=out.get("mass"))
+        return results
+
     # --- Mixture functions ---
     def mixture_density(self, Yi, T):
         """
         Calculate mixture density at a given temperature.
 
-        :param Yi: Mass fractions of each compound.
+        :param Yi: Mass fractions of each compound, shape (num_compounds,) or (nY, num_compounds).
         :type Yi: np.ndarray
-        :param T: Temperature in Kelvin.
-        :type T: float
-        :return: Mixture density in kg/m^3.
-        :rtype: float
+        :param T: Temperature in Kelvin, scalar or shape (nT,).
+        :type T: float or np.ndarray
+        :return: Mixture density in kg/m^3, shape (), (nT,), (nY,) or (nY, nT).
+        :rtype: float or np.ndarray
         """
         MW = self.MW  # Molecular weights of each component (kg/mol)
         Vmi = self.molar_liquid_vol(T)  # Molar volume of each component (m^3/mol)
 
         # Calculate density (kg/m^3)
-        rho = Yi @ (MW / Vmi)
+        rho = _weighted_sum(Yi, MW / Vmi)
 
         return rho
 
@@ -822,41 +1350,34 @@ class fuel:
 
         :meta private: Uses Kendall-Monroe (default) or Arrhenius mixing correlations.
 
-        :param Yi: Mass fractions of each compound.
+        :param Yi: Mass fractions of each compound, shape (num_compounds,) or (nY, num_compounds).
         :type Yi: np.ndarray
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin, scalar or shape (nT,).
+        :type T: float or np.ndarray
         :param correlation: Mixing model ("Kendall-Monroe" or "Arrhenius").
         :type correlation: str, optional
-        :return: Mixture kinematic viscosity in m^2/s.
-        :rtype: float
+        :return: Mixture kinematic viscosity in m^2/s, shape (), (nT,), (nY,) or (nY, nT).
+        :rtype: float or np.ndarray
         """
         nu_i = self.viscosity_kinematic(T)  # Viscosities of individual components
 
         # Calculate mole fractions for each species
         Xi = self.Y2X(Yi)
 
-        if correlation.casefold() == "Arrhenius".casefold():
-            # Arrhenius mixing correlation
-            nu = np.exp(np.sum(Xi * np.log(nu_i)))
-        else:
-            # Default: Kendall-Monroe mixing correlation
-            nu = np.sum(Xi * (nu_i ** (1.0 / 3.0))) ** (3.0)
-
-        return nu
+        return _mix_viscosity(nu_i, Xi, correlation=correlation)
 
     def mixture_dynamic_viscosity(self, Yi, T, correlation="Kendall-Monroe"):
         """
         Calculate dynamic viscosity of the mixture.
 
-        :param Yi: Mass fractions of each compound.
+        :param Yi: Mass fractions of each compound, shape (num_compounds,) or (nY, num_compounds).
         :type Yi: np.ndarray
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin, scalar or shape (nT,).
+        :type T: float or np.ndarray
         :param correlation: Mixing model ("Kendall-Monroe" or "Arrhenius").
         :type correlation: str, optional
-        :return: Mixture dynamic viscosity in Pa*s.
-        :rtype: float
+        :return: Mixture dynamic viscosity in Pa*s, shape (), (nT,), (nY,) or (nY, nT).
+        :rtype: float or np.ndarray
         """
 
         nu = self.mixture_kinematic_viscosity(Yi, T, correlation=correlation)
@@ -868,14 +1389,14 @@ class fuel:
         """
         Calculate vapor pressure of the mixture.
 
-        :param Yi: Mass fractions of each compound in the mixture.
+        :param Yi: Mass fractions of each compound in the mixture, shape (num_compounds,) or (nY, num_compounds).
         :type Yi: np.ndarray
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin, scalar or shape (nT,).
+        :type T: float or np.ndarray
         :param correlation: Correlation method ("Ambrose-Walton" or "Lee-Kesler").
         :type correlation: str, optional
-        :return: Mixture vapor pressure in Pa.
-        :rtype: float
+        :return: Mixture vapor pressure in Pa, shape (), (nT,), (nY,) or (nY, nT).
+        :rtype: float or np.ndarray
         """
 
         # Mole fraction for each compound
@@ -885,12 +1406,235 @@ class fuel:
         p_sati = self.psat(T, correlation=correlation)
 
         # Mixture vapor pressure via Raoult's law
-        p_v = p_sati @ Xi
+        p_v = _weighted_sum(Xi, p_sati)
 
         return p_v
 
+    def bubble_point(self, Yi, p, correlation="Lee-Kesler", xtol=1e-6, max_iter=50):
+        """
+        Calculate the bubble-point temperature of liquid mixtures, where mixture_vapor_pressure equals p.
+
+        :meta private: Solves many compositions and pressures at once, see _saturation_temperature.
+
+        :param Yi: Mass fractions of each compound in the liquid, shape (num_compounds,) or (n, num_compounds).
+        :type Yi: np.ndarray
+        :param p: Pressure in Pa, scalar or shape (n,).
+        :type p: float or np.ndarray
+        :param correlation: Correlation method ("Ambrose-Walton" or "Lee-Kesler").
+        :type correlation: str, optional
+        :param xtol: Absolute tolerance on the temperature in Kelvin.
+        :type xtol: float, optional
+        :param max_iter: Maximum number of iterations.
+        :type max_iter: int, optional
+        :return: Bubble-point temperature in Kelvin, shape () or (n,), nan if there is no bubble point below max(Tc).
+        :rtype: float or np.ndarray
+        """
+        return self._saturation_temperature(
+            Yi, p, "bubble", correlation, xtol, max_iter
+        )
+
+    def dew_point(self, Yi, p, correlation="Lee-Kesler", xtol=1e-6, max_iter=50):
+        """
+        Calculate the dew-point temperature of vapor mixtures, where sum(X_i*p/psat_i) equals 1.
+
+        :meta private: Solves many compositions and pressures at once, see _saturation_temperature.
+
+        :param Yi: Mass fractions of each compound in the vapor, shape (num_compounds,) or (n, num_compounds).
+        :type Yi: np.ndarray
+        :param p: Pressure in Pa, scalar or shape (n,).
+        :type p: float or np.ndarray
+        :param correlation: Correlation method ("Ambrose-Walton" or "Lee-Kesler").
+        :type correlation: str, optional
+        :param xtol: Absolute tolerance on the temperature in Kelvin.
+        :type xtol: float, optional
+        :param max_iter: Maximum number of iterations.
+        :type max_iter: int, optional
+        :return: Dew-point temperature in Kelvin, shape () or (n,), nan if there is no dew point below max(Tc).
+        :rtype: float or np.ndarray
+        """
+        return self._saturation_temperature(Yi, p, "dew", correlation, xtol, max_iter)
+
+    def _saturation_temperature(self, Yi, p, kind, correlation, xtol, max_iter):
+        """
+        Solve for bubble-point or dew-point temperatures with a safeguarded Newton method.
+
+        :meta private: The residual is f = log(sum(X*psat)/p) for bubble points and f = -log(p*sum(X/psat)) for dew points, which increase with T and are nearly linear in 1/T. Newton steps in 1/T use the analytic derivative of psat. As in rtsafe (Numerical Recipes 9.4), a step is replaced by bisection when it leaves the bracket or is not at most half the step before last, so the bracket shrinks at least as fast as by bisection. Iterations start from one Newton step on the Edmister estimate of psat within the bracket [0.1*min(Tc), max(Tc)], and roots at its ends without a sign change are nan.
+        :meta private: Vapor pressures are evaluated from the psat_lk and psat_aw coefficients, for Lee-Kesler with a single matrix product. Ambrose-Walton is undefined above Tc, where psat is held at Pc with zero derivative. Rows are solved in chunks of SATURATION_CHUNK so the work arrays stay in cache.
+
+        :param Yi: Mass fractions of each compound, shape (num_compounds,) or (n, num_compounds).
+        :type Yi: np.ndarray
+        :param p: Pressure in Pa, scalar or shape (n,).
+        :type p: float or np.ndarray
+        :param kind: "bubble" or "dew".
+        :type kind: str
+        :param correlation: Correlation method ("Ambrose-Walton" or "Lee-Kesler").
+        :type correlation: str
+        :param xtol: Absolute tolerance on the temperature in Kelvin.
+        :type xtol: float
+        :param max_iter: Maximum number of iterations, after which bracketed rows get the midpoint of their bracket.
+        :type max_iter: int
+        :return: Saturation temperature in Kelvin, shape () or (n,).
+        :rtype: float or np.ndarray
+        """
+        Xi = self.Y2X(np.asarray(Yi, dtype=float))
+        p = np.asarray(p, dtype=float)
+        shape = np.broadcast_shapes(Xi.shape[:-1], p.shape)
+        X = np.broadcast_to(Xi, shape + Xi.shape[-1:]).reshape(-1, Xi.shape[-1])
+        log_p = np.log(np.broadcast_to(p, shape).ravel())
+        sign = 1.0 if kind == "bubble" else -1.0
+        lee_kesler = correlation.casefold() != "Ambrose-Walton".casefold()
+        block = self.coefficients()
+        index = self._COEFFICIENT_INDEX
+        lk = block[[index[f"psat_lk_{c}"] for c in "ABCD"]]
+        aw = block[[index[f"psat_aw_{c}"] for c in "abcd"]]
+        inv_Tc = 1.0 / self.Tc
+        # Edmister: log10(psat/Pc) = 7/3*(1 + omega)*(1 - Tc/T), for starting values
+        edmister_b = np.log(10.0) * 7.0 / 3.0 * (1.0 + self.omega) * self.Tc
+        edmister_a = np.log(self.Pc) + edmister_b * inv_Tc
+
+        # psat = p_ref*exp(sign*log_psat(T)), with the sign of the residual folded in
+        if lee_kesler:
+            log_p_ref, lk = lk[0], sign * lk[1:]
+        else:
+            log_p_ref, aw = np.log(self.Pc), sign * aw
+            # Coefficients of g(tau)*Tc and of g'(tau) = a + 1.5*b*tau^0.5 + ...
+            aw_Tc = aw * self.Tc
+            daw = aw * np.array([1.0, 1.5, 2.5, 5.0])[:, np.newaxis]
+        p_ref = np.exp(sign * log_p_ref)
+
+        # Work arrays of a chunk, the first len(T) rows are used
+        chunk = min(self.SATURATION_CHUNK, len(log_p))
+        work = np.empty((7, chunk, self.num_compounds))
+
+        def log_psat(T, derivative):
+            """sign*log(psat/p_ref) of each compound and, for Ambrose-Walton, T times its derivative."""
+            A, B, C, D, E, F, G = work[:, : len(T)]
+            if lee_kesler:
+                basis = np.stack([1.0 / T, np.log(T), T**6], axis=1)
+                return np.matmul(basis, lk, out=A), None
+
+            # g(tau)/Tr with tau = 1 - Tr held at 0 above Tc
+            tau = np.multiply(T[:, np.newaxis], inv_Tc, out=A)
+            np.subtract(1.0, tau, out=tau)
+            np.maximum(tau, 0.0, out=tau)
+            root_tau = np.sqrt(tau, out=B)
+            tau4 = np.multiply(tau, tau, out=C)
+            np.multiply(tau4, tau4, out=tau4)
+            g = np.multiply(aw_Tc[2], tau, out=D)
+            g += aw_Tc[1]
+            g *= root_tau
+            g += aw_Tc[0]
+            d_tau4 = np.multiply(aw_Tc[3], tau4, out=E)
+            g += d_tau4
+            g *= tau
+            g *= (1.0 / T)[:, np.newaxis]
+            if not derivative:
+                return g, None
+
+            # T*d(g/Tr)/dT = -(g'(tau) + g/Tr), zero above Tc where tau = 0
+            dg = np.multiply(daw[2], tau, out=F)
+            dg += daw[1]
+            dg *= root_tau
+            tau4 *= daw[3]
+            dg += tau4
+            dg += daw[0]
+            dg += g
+            np.sign(tau, out=tau)
+            dg *= tau
+            return g, dg
+
+        def residual(T, X, log_p, derivative=True):
+            """Residual and its derivative with respect to T, for X weighted with p_ref."""
+            log_psat_T, dlog_psat = log_psat(T, derivative)
+            w = np.exp(log_psat_T, out=work[6, : len(T)])
+            w *= X
+            S = np.sum(w, axis=-1)
+            f = sign * np.log(S) - log_p
+            if not derivative:
+                return f
+
+            # T*dS/dT, with T*d(log psat)/dT summed with the weights w
+            if lee_kesler:
+                dbasis = np.stack([-1.0 / T, np.ones_like(T), 6.0 * T**6], axis=1)
+                dS = np.einsum("ij,ij->i", w @ lk.T, dbasis)
+            else:
+                dS = -np.einsum("ij,ij->i", w, dlog_psat)
+            return f, sign * dS / (S * T)
+
+        def solve(X, log_p):
+            """Saturation temperatures of the rows X at pressures exp(log_p)."""
+            # f < 0 at T_lo and, unless there is no root below max(Tc), f > 0 at T_hi
+            n = len(log_p)
+            T_lo, T_hi = 0.1 * np.min(self.Tc), np.max(self.Tc)
+            lo = np.full(n, T_lo)
+            hi = np.full(n, T_hi)
+            # Start from one Newton step in 1/T on the lines log(psat) = a - b/T
+            inv_T = X @ (edmister_a / edmister_b) - log_p * (X @ (1.0 / edmister_b))
+            w = np.multiply(inv_T[:, np.newaxis], -sign * edmister_b, out=work[0, :n])
+            w += sign * edmister_a
+            with np.errstate(all="ignore"):
+                np.exp(w, out=w)
+                w *= X
+                S = np.sum(w, axis=-1)
+                inv_T += (sign * np.log(S) - log_p) * S / (w @ edmister_b)
+                T = np.clip(np.nan_to_num(1.0 / inv_T, nan=T_hi), T_lo, T_hi)
+
+            # Mole fractions weighted with p_ref, see residual
+            X = X * p_ref
+            T_root = np.empty(n)
+            active = np.arange(n)
+            step, step_old = hi - lo, hi - lo
+            for _ in range(max_iter):
+                if active.size == 0:
+                    break
+                with np.errstate(divide="ignore", over="ignore", under="ignore"):
+                    f, df = residual(T, X[active], log_p[active])
+                hi = np.where(f > 0, T, hi)
+                lo = np.where(f > 0, lo, T)
+
+                # Newton step in 1/T, bisection if it leaves the bracket or stalls
+                with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                    T_new = 1.0 / (1.0 / T + f / (T**2 * df))
+                bisect = ~((T_new >= lo) & (T_new <= hi))
+                bisect |= ~(2.0 * np.abs(T_new - T) <= step_old)
+                T_new = np.where(bisect, 0.5 * (lo + hi), T_new)
+                step_old, step = step, np.abs(T_new - T)
+
+                done = (step < xtol) | (hi - lo < xtol) | (f == 0)
+                T_root[active[done]] = T_new[done]
+                keep = ~done
+                active, lo, hi, T = active[keep], lo[keep], hi[keep], T_new[keep]
+                step, step_old = step[keep], step_old[keep]
+
+            # Rows still bracketed after max_iter
+            T_root[active] = 0.5 * (lo + hi)
+
+            # Roots at the ends of the bracket are checked for a sign change
+            for T_end, outside in [(T_lo, 1.0), (T_hi, -1.0)]:
+                end = np.flatnonzero(np.abs(T_root - T_end) < xtol)
+                if end.size:
+                    with np.errstate(divide="ignore", over="ignore", under="ignore"):
+                        f_end = residual(
+                            np.full(end.size, T_end), X[end], log_p[end], False
+                        )
+                    T_root[end[outside * f_end > 0]] = np.nan
+            return T_root
+
+        T_root = np.empty(len(log_p))
+        for begin in range(0, len(log_p), self.SATURATION_CHUNK):
+            rows = slice(begin, begin + self.SATURATION_CHUNK)
+            T_root[rows] = solve(X[rows], log_p[rows])
+
+        T_root = T_root.reshape(shape)
+        return T_root if shape else T_root[()]
+
     def mixture_vapor_pressure_antoine_coeffs(
-        self, Yi, Tvals=None, units="mks", correlation="Lee-Kesler"
+        self,
+        Yi,
+        Tvals=None,
+        units="mks",
+        correlation="Lee-Kesler",
+        return_residuals=False,
     ):
         """
         Estimate Antoine coefficients for vapor pressure of the mixture.
@@ -903,7 +1647,9 @@ class fuel:
         :type units: str, optional
         :param correlation: Correlation method ("Ambrose-Walton" or "Lee-Kesler").
         :type correlation: str, optional
-        :return: Coefficients A, B, C, D
+        :param return_residuals: Also return the RMS residual of log10(psat).
+        :type return_residuals: bool, optional
+        :return: Coefficients A, B, C, D (and residual if requested)
         :rtype: float
         """
 
@@ -917,47 +1663,19 @@ class fuel:
         elif len(Tvals) == 2:
             T = np.linspace(Tvals[0], Tvals[1], 20)
         elif len(Tvals) > 2:
-            T = Tvals
+            T = np.asarray(Tvals, dtype=float)
         else:
             raise ValueError("Tvals must be None, length 2, or length > 2.")
 
-        # Antoine equation log10(p) = A - B/(C + T)
-        def antoine_eq(T, A, B, C):
-            """
-            Antoine equation for vapor pressure.
-
-            :param T: Temperature.
-            :type T: float or np.ndarray
-            :param A: Antoine coefficient A.
-            :type A: float
-            :param B: Antoine coefficient B.
-            :type B: float
-            :param C: Antoine coefficient C.
-            :type C: float
-            :return: log10(pressure).
-            :rtype: float or np.ndarray
-            """
-            return A - B / (T + C)
-
         # Determine conversion factor for pressure in MKS, CGS, bar, or atm
-        D = 1  # default is Pa
-        if units.lower() == "bar":
-            D = 1e5
-        elif units.lower() == "atm":
-            D = 1.01325e5
-        elif units.lower() == "cgs":
-            D = 1 / 10  # dyne/cm^2
-
-        Pvals = np.zeros_like(T)
-        for k in range(len(T)):
-            Pvals[k] = (
-                self.mixture_vapor_pressure(Yi, T[k], correlation=correlation) / D
-            )
+        D = antoine_pressure_scale(units)
 
-        logP = np.log10(Pvals)
-        popt, _ = curve_fit(antoine_eq, T, logP, p0=[1, 1e3, -1])  # initial guess
-        A, B, C = popt
+        logP = np.log10(self.mixture_vapor_pressure(Yi, T, correlation=correlation) / D)
+        A, B, C, residuals = fit_antoine(T[:, np.newaxis], logP[:, np.newaxis])
+        A, B, C, residuals = A[0], B[0], C[0], residuals[0]
 
+        if return_residuals:
+            return A, B, C, D, residuals
         return A, B, C, D
 
     def mixture_surface_tension(self, Yi, T, correlation="Brock-Bird"):
@@ -966,14 +1684,14 @@ class fuel:
 
         :meta private: Uses arithmetic pseudo-property method recommended by Hugill and van Welsenes (1986).
 
-        :param Yi: Mass fractions of each compound in the mixture.
+        :param Yi: Mass fractions of each compound in the mixture, shape (num_compounds,) or (nY, num_compounds).
         :type Yi: np.ndarray
-        :param T: Temperature in Kelvin.
-        :type T: float
+        :param T: Temperature in Kelvin, scalar or shape (nT,).
+        :type T: float or np.ndarray
         :param correlation: Correlation method ("Pitzer" or "Brock-Bird").
         :type correlation: str, optional
-        :return: Mixture surface tension in N/m.
-        :rtype: float
+        :return: Mixture surface tension in N/m, shape (), (nT,), (nY,) or (nY, nT).
+        :rtype: float or np.ndarray
         """
 
         # Mole fraction for each compound
@@ -991,20 +1709,183 @@ class fuel:
         """
         Calculate thermal conductivity of the mixture.
 
-        :param Yi: Mass fractions of each compound in the mixture.
+        :param Yi: Mass fractions of each compound in the mixture, shape (num_compounds,) or (nY, num_compounds).
         :type Yi: np.ndarray
-        :param T: Temperature in Kelvin.
-        :type T: float
-        :return: Thermal conductivity in W/m/K.
-        :rtype: float
+        :param T: Temperature in Kelvin, scalar or shape (nT,).
+        :type T: float or np.ndarray
+        :return: Thermal conductivity in W/m/K, shape (), (nT,), (nY,) or (nY, nT).
+        :rtype: float or np.ndarray
         """
         tc = self.thermal_conductivity(T)
-        return np.sum(Yi * tc ** (-2)) ** (-0.5)
+        return _mix_thermal_conductivity(tc, Yi)
+
+
+# -----------------------------------------------------------------------------
+# Group contribution table
+# -----------------------------------------------------------------------------
+class GroupContributionTable:
+    """
+    Read-only table of the first and second order group contributions.
+
+    :param file: Path to the GCM table file.
+    :type file: str
+    """
+
+    def __init__(self, file):
+        """
+        Read the GCM table and stack the contributions of every property.
+
+        :param file: Path to the GCM table file.
+        :type file: str
+        """
+        df_table = pd.read_csv(file)
+
+        self.file = file
+        self.properties = tuple(df_table["Property"])
+        self.units = tuple(df_table["Units"])
+        self.groups = tuple(df_table.columns[2:])
+        self._index = {prop: i for i, prop in enumerate(self.properties)}
+
+        # Contributions of each group to each property (num_groups, num_props)
+        self.values = df_table.iloc[:, 2:].to_numpy(dtype=float).T
+        self.values.setflags(write=False)
+
+    def index(self, property_name):
+        """
+        Get the column of a property in the table.
+
+        :param property_name: Name of the property to retrieve.
+        :type property_name: str
+        :return: Column index of the property.
+        :rtype: int
+        :raises ValueError: If property not found in GCM table.
+        """
+        if property_name not in self._index:
+            raise ValueError(f"Property '{property_name}' not found in GCM table.")
+        return self._index[property_name]
+
+    def column(self, property_name):
+        """
+        Get the contributions of every group to a property.
+
+        :param property_name: Name of the property to retrieve.
+        :type property_name: str
+        :return: Property values for all functional groups (shape: num_groups,).
+        :rtype: np.ndarray
+        """
+        return self.values[:, self.index(property_name)]
+
+    def contributions(self, Nij):
+        """
+        Sum the group contributions of every property for each compound.
+
+        :param Nij: Number of each group in each compound (shape: num_compounds, num_groups).
+        :type Nij: np.ndarray
+        :return: Group contribution sums (shape: num_props, num_compounds).
+        :rtype: np.ndarray
+        """
+        return np.ascontiguousarray(np.matmul(Nij, self.values).T)
+
+
+# GCM table shared by all fuel objects, loaded on first use
+_gcm_table_file = os.path.join(GCMTABLE_DIR, "gcmTable.csv")
+_gcm_table = None
+
+# Memoized file digests used by file_hash
+_file_hashes = {}
+
+# Lennard-Jones parameters of common bath gases for diffusion_coeff, given as
+# (collision diameter in m, well depth over Boltzmann constant in K,
+# molecular weight in kg/mol). Values are from Poling, Table B-1, except air,
+# which keeps the historical defaults of diffusion_coeff.
+BATH_GASES = {
+    "air": (3.62e-10, 97.0, 28.97e-3),
+    "N2": (3.798e-10, 71.4, 28.014e-3),
+    "O2": (3.467e-10, 106.7, 31.999e-3),
+    "CO2": (3.941e-10, 195.2, 44.010e-3),
+    "H2O": (2.641e-10, 809.1, 18.015e-3),
+    "Ar": (3.542e-10, 93.3, 39.948e-3),
+    "He": (2.551e-10, 10.22, 4.003e-3),
+    "H2": (2.827e-10, 59.7, 2.016e-3),
+    "CO": (3.690e-10, 91.7, 28.010e-3),
+}
+
+
+def get_gcm_table():
+    """
+    Get the GCM table shared by all fuel objects, reading it on first use.
+
+    :return: Shared group contribution table.
+    :rtype: GroupContributionTable
+    """
+    global _gcm_table
+    if _gcm_table is None:
+        _gcm_table = GroupContributionTable(_gcm_table_file)
+    return _gcm_table
+
+
+def reload_gcm_table(file=None):
+    """
+    Re-read the shared GCM table, e.g. after the table file has been edited.
+
+    :param file: Path to a different GCM table file. Defaults to the current file.
+    :type file: str, optional
+    :return: Shared group contribution table.
+    :rtype: GroupContributionTable
+    """
+    global _gcm_table, _gcm_table_file
+    if file is not None:
+        _gcm_table_file = file
+    _gcm_table = GroupContributionTable(_gcm_table_file)
+    return _gcm_table
 
 
 # -----------------------------------------------------------------------------
 # Utility functions
 # -----------------------------------------------------------------------------
+def file_hash(file):
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    :meta private: Digests are memoized on the file's modification time and size.
+
+    :param file: Path to the file.
+    :type file: str
+    :return: Hexadecimal digest of the file contents.
+    :rtype: str
+    """
+    stat = os.stat(file)
+    key = (os.path.abspath(file), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_hashes:
+        with open(file, "rb") as f:
+            _file_hashes[key] = hashlib.sha256(f.read()).hexdigest()
+    return _file_hashes[key]
+
+
+def bath_gas(gas):
+    """
+    Look up Lennard-Jones parameters of bath gases in BATH_GASES.
+
+    :param gas: Name of a bath gas (e.g. "N2") or list of names.
+    :type gas: str or list of str
+    :return: Tuple of collision diameter in m, well depth over Boltzmann constant in K and molecular weight in kg/mol. Each has shape (ngas,) when gas is a list.
+    :rtype: tuple
+    :raises ValueError: If a gas is not in BATH_GASES.
+    """
+    names = [gas] if isinstance(gas, str) else list(gas)
+    for name in names:
+        if name not in BATH_GASES:
+            raise ValueError(
+                f"Unknown bath gas {name}, expected one of {list(BATH_GASES)}."
+            )
+    params = np.array([BATH_GASES[name] for name in names])
+    if isinstance(gas, str):
+        params = params[0]
+    else:
+        params = params.T
+    return tuple(params)
+
+
 def C2K(T):
     """
     Convert temperature from Celsius to Kelvin.
@@ -1033,29 +1914,191 @@ def mixing_rule(var_n, X, pseudo_prop="arithmetic"):
     """
     Mixing rules for computing mixture properties.
 
-    :param var_n: Individual compound properties.
+    :meta private: The pairwise sums over i and j reduce to sum(X) * sum(X * var_n) for the arithmetic pseudo property and (sum(X * var_n**0.5))**2 for the geometric one.
+
+    :param var_n: Individual compound properties, shape (n,) or (nT, n).
     :type var_n: np.ndarray
-    :param X: Mole fractions of the compounds.
+    :param X: Mole fractions of the compounds, shape (n,) or (nY, n).
     :type X: np.ndarray
     :param pseudo_prop: Type of mean ("arithmetic" or "geometric").
     :type pseudo_prop: str, optional
-    :return: Mixture property value.
-    :rtype: float
+    :return: Mixture property value, shape (), (nT,), (nY,) or (nY, nT).
+    :rtype: float or np.ndarray
     """
-    num_comps = len(var_n)
-    var_mix = 0.0
-    for i in range(num_comps):
-        for j in range(num_comps):
-            if pseudo_prop.casefold() == "geometric":
-                # Use geometric mean definition for the pseudo property
-                var_ij = (var_n[i] * var_n[j]) ** (0.5)
-            else:
-                # Use arithmetic definition for the pseudo property
-                var_ij = (var_n[i] + var_n[j]) / 2
-            var_mix += X[i] * X[j] * var_ij
+    var_n = np.asarray(var_n)
+    X = np.asarray(X)
+    if pseudo_prop.casefold() == "geometric":
+        # Use geometric mean definition for the pseudo property
+        var_mix = _weighted_sum(X, var_n**0.5) ** 2
+    else:
+        # Use arithmetic definition for the pseudo property
+        sum_X = np.sum(X, axis=-1)
+        if var_n.ndim > 1:
+            sum_X = sum_X[..., np.newaxis]
+        var_mix = sum_X * _weighted_sum(X, var_n)
     return var_mix
 
 
+def antoine_pressure_scale(units):
+    """
+    Pressure scale D of the Antoine fit, psat = D * 10^(A - B/(C + T)).
+
+    :param units: Units for pressure in fit ("mks", "cgs", "bar", "atm").
+    :type units: str
+    :return: Pressure scale in Pa.
+    :rtype: float
+    """
+    D = 1  # default is Pa
+    if units.lower() == "bar":
+        D = 1e5
+    elif units.lower() == "atm":
+        D = 1.01325e5
+    elif units.lower() == "cgs":
+        D = 1 / 10  # dyne/cm^2
+    return D
+
+
+def fit_antoine(T, logP, max_iter=50, rtol=1e-10):
+    """
+    Fit the Antoine equation log10(p) = A - B/(C + T) to many data sets at once.
+
+    :meta private: The initial guess solves the linearized form T*y = A*T - C*y + (A*C - B) by least squares, which is then refined with Gauss-Newton steps. Both are batched QR solves over all data sets, with step halving for any set whose residual would grow.
+
+    :param T: Temperature nodes in Kelvin (shape: nT, nsets).
+    :type T: np.ndarray
+    :param logP: log10 of the pressure at each node (shape: nT, nsets).
+    :type logP: np.ndarray
+    :param max_iter: Maximum number of Gauss-Newton iterations.
+    :type max_iter: int, optional
+    :param rtol: Relative step size at which the iterations stop.
+    :type rtol: float, optional
+    :return: Coefficients A, B, C and the RMS residual of logP for each data set.
+    :rtype: 4 np.ndarrays (shape: nsets,)
+    """
+    # Work with data sets along the first axis (nsets, nT)
+    T = np.asarray(T, dtype=float).T
+    y = np.asarray(logP, dtype=float).T
+
+    def lstsq(J, r):
+        """Batched least-squares solution of J x = r with column scaling."""
+        scale = np.linalg.norm(J, axis=1, keepdims=True)
+        q, R = np.linalg.qr(J / scale)
+        x = np.linalg.solve(R, np.einsum("snk,sn->sk", q, r)[..., np.newaxis])
+        return x[..., 0] / scale[:, 0, :]
+
+    def sum_squares(A, B, C):
+        """Sum of squared residuals of each data set."""
+        r = A[:, None] - B[:, None] / (T + C[:, None]) - y
+        return np.sum(r**2, axis=1)
+
+    # Initial guess from the linearized Antoine equation
+    a1, a2, a3 = lstsq(np.stack([T, -y, np.ones_like(T)], axis=-1), T * y).T
+    A, C = a1, a2
+    B = A * C - a3
+    ssr = sum_squares(A, B, C)
+
+    # Gauss-Newton refinement
+    converged = np.zeros(A.shape, dtype=bool)
+    for _ in range(max_iter):
+        TC = T + C[:, None]
+        r = A[:, None] - B[:, None] / TC - y
+        J = np.stack([np.ones_like(T), -1 / TC, B[:, None] / TC**2], axis=-1)
+        dA, dB, dC = lstsq(J, -r).T
+
+        # Data sets whose Gauss-Newton step is still significant
+        size = np.max(np.abs([dA / A, dB / B, dC / np.maximum(np.abs(C), 1.0)]), axis=0)
+        converged |= size < rtol
+        if np.all(converged):
+            break
+
+        # Halve the step for data sets whose residual would increase
+        step = np.where(converged, 0.0, 1.0)
+        for _ in range(30):
+            ssr_new = sum_squares(A + step * dA, B + step * dB, C + step * dC)
+            worse = ~converged & ~(ssr_new <= ssr)
+            if not np.any(worse):
+                break
+            step[worse] /= 2
+        step[worse] = 0.0
+        A, B, C = A + step * dA, B + step * dB, C + step * dC
+
+        # Data sets that can no longer reduce their residual have converged
+        converged |= ~(ssr_new < ssr * (1 - rtol))
+        ssr = np.where(step > 0, ssr_new, ssr)
+
+    residuals = np.sqrt(ssr / T.shape[1])
+    return A, B, C, residuals
+
+
+def _normalize(a):
+    """
+    Normalize compositions to unit sum, leaving compositions that sum to zero as zeros.
+
+    :param a: Amount of each compound, shape (n,) or (nY, n).
+    :type a: np.ndarray
+    :return: Normalized amounts of each compound.
+    :rtype: np.ndarray
+    """
+    total = np.sum(a, axis=-1, keepdims=True)
+    nonzero = total != 0
+    return np.where(nonzero, a / np.where(nonzero, total, 1.0), 0.0)
+
+
+def _mix_viscosity(nu_i, Xi, correlation="Kendall-Monroe"):
+    """
+    Mix compound kinematic viscosities, see fuel.mixture_kinematic_viscosity.
+
+    :param nu_i: Kinematic viscosity of each compound in m^2/s.
+    :type nu_i: np.ndarray
+    :param Xi: Mole fractions of each compound.
+    :type Xi: np.ndarray
+    :param correlation: Mixing model ("Kendall-Monroe" or "Arrhenius").
+    :type correlation: str, optional
+    :return: Mixture kinematic viscosity in m^2/s.
+    :rtype: float or np.ndarray
+    """
+    if correlation.casefold() == "Arrhenius".casefold():
+        # Arrhenius mixing correlation
+        nu = np.exp(_weighted_sum(Xi, np.log(nu_i)))
+    else:
+        # Default: Kendall-Monroe mixing correlation
+        nu = _weighted_sum(Xi, nu_i ** (1.0 / 3.0)) ** (3.0)
+
+    return nu
+
+
+def _mix_thermal_conductivity(tc, Yi):
+    """
+    Mix compound thermal conductivities, see fuel.mixture_thermal_conductivity.
+
+    :param tc: Thermal conductivity of each compound in W/m/K.
+    :type tc: np.ndarray
+    :param Yi: Mass fractions of each compound.
+    :type Yi: np.ndarray
+    :return: Mixture thermal conductivity in W/m/K.
+    :rtype: float or np.ndarray
+    """
+    weights = _weighted_sum(Yi, tc ** (-2))
+
+    # Compositions that sum to zero have zero conductivity, NaN above Tc propagates
+    tc_mix = np.where(weights == 0, np.inf, weights) ** (-0.5)
+    return tc_mix[()]
+
+
+def _weighted_sum(w, var_n):
+    """
+    Weighted sum over compounds of individual compound properties.
+
+    :param w: Weights of the compounds, shape (n,) or (nY, n).
+    :type w: np.ndarray
+    :param var_n: Individual compound properties, shape (n,) or (nT, n).
+    :type var_n: np.ndarray
+    :return: Weighted sum, shape (), (nT,), (nY,) or (nY, nT).
+    :rtype: float or np.ndarray
+    """
+    return np.matmul(w, np.transpose(var_n))
+
+
 def droplet_volume(r):
     """
     Calculate spherical volume of a droplet given the radius.
@@ -1068,23 +2111,27 @@ def droplet_volume(r):
     return 4.0 / 3.0 * np.pi * r**3
 
 
-def droplet_mass(fuel, r, Yi, T):
+def droplet_mass(fuel, r, Yi, T, out=None):
     """
     Calculate the mass of each compound in the fuel provided the radius of the droplet.
 
     :param fuel: An instance of the groupContribution class.
     :type fuel: groupContribution object
-    :param r: Radius of the droplet in meters.
-    :type r: float
-    :param Yi: Mass fractions of each compound.
+    :param r: Radius of the droplet in meters, scalar or shape (N,).
+    :type r: float or np.ndarray
+    :param Yi: Mass fractions of each compound, shape (num_compounds,) or (N, num_compounds).
     :type Yi: np.ndarray
-    :param T: Droplet temperature in Kelvin.
-    :type T: float
-    :return: Mass of each compound in droplet in kg.
+    :param T: Droplet temperature in Kelvin, scalar or shape (N,).
+    :type T: float or np.ndarray
+    :param out: Array of the result's shape to write the masses to.
+    :type out: np.ndarray, optional
+    :return: Mass of each compound in droplet in kg, shape (num_compounds,) or (N, num_compounds). Droplets with zero radius have zero mass.
     :rtype: np.ndarray
     """
-    volume = droplet_volume(r)  # m^3
-    if volume > 0:
-        return volume / (fuel.molar_liquid_vol(T) @ Yi) * Yi * fuel.MW
-    else:
-        return np.zeros_like(fuel.MW)
+    volume = np.asarray(droplet_volume(r), dtype=float)[..., np.newaxis]  # m^3
+    Yi = np.asarray(Yi, dtype=float)
+    Vm = np.sum(fuel.molar_liquid_vol(T) * Yi, axis=-1, keepdims=True)
+    moles = np.divide(
+        volume, Vm, out=np.zeros(np.broadcast(volume, Vm).shape), where=volume > 0
+    )
+    return np.multiply(moles, Yi * fuel.MW, out=out)
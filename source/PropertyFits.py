@@ -0,0 +1,320 @@
+import os
+import sys
+import numpy as np
+import FuelLib as fl
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+
+"""
+Chebyshev polynomial fits of the temperature-dependent properties of each
+compound of a fuel.
+
+Every property of every compound is fitted over its own temperature range
+[T_min, T_max], by default from the melting point to TR_MAX times the
+critical temperature, in the variable x = (2*T - T_min - T_max)/(T_max - T_min)
+in [-1, 1]. The degree of each fit is the lowest that reproduces the
+correlation within the requested relative tolerance, so solvers can evaluate
+the properties with a short Horner scheme instead of the exponentials, logs
+and fractional powers of the correlations. Properties that span many orders
+of magnitude (LOG_PROPERTIES) are fitted in log space and need one exp.
+
+All compounds and properties share the Chebyshev nodes in x, so every fit
+is obtained from a single least-squares solve with one right-hand side per
+compound and property.
+
+Usage:
+    import FuelLib as fl
+    from PropertyFits import PropertyFits
+
+    fuel = fl.fuel("posf10325")
+    fits = PropertyFits(fuel, rtol=1e-4)
+    rho = fits.evaluate(T, props=["density"])["density"]
+    coeffs = fits.power_coefficients("density")
+"""
+
+
+class PropertyFits:
+    """
+    Chebyshev fits of per-compound properties with a target relative accuracy.
+
+    :param fuel: Fuel to fit.
+    :type fuel: fl.fuel
+    :param props: Names of the properties to fit (see fuel.PROPERTIES). Defaults to all.
+    :type props: list of str, optional
+    :param T_min: Lower end of the fits in Kelvin, scalar or shape (num_compounds,). Defaults to the melting point of each compound.
+    :type T_min: float or np.ndarray, optional
+    :param T_max: Upper end of the fits in Kelvin, scalar or shape (num_compounds,). Defaults to TR_MAX times the critical temperature of each compound.
+    :type T_max: float or np.ndarray, optional
+    :param rtol: Maximum relative error of each fit.
+    :type rtol: float, optional
+    :param max_degree: Highest polynomial degree of the fits.
+    :type max_degree: int, optional
+    """
+
+    # Properties fitted in log space, which vary exponentially with T
+    LOG_PROPERTIES = ("psat", "viscosity_kinematic", "viscosity_dynamic")
+
+    # Default upper end of the fits relative to Tc. The surface tension, latent
+    # heat and thermal conductivity vanish at Tc with unbounded slopes, so the
+    # degree needed for a given accuracy grows quickly closer to Tc.
+    TR_MAX = 0.95
+
+    # Number of points per degree at which the fit error is checked
+    ERROR_CHECK_DENSITY = 8
+
+    def __init__(
+        self,
+        fuel,
+        props=None,
+        T_min=None,
+        T_max=None,
+        rtol=1e-4,
+        max_degree=24,
+    ):
+        """
+        Fit the properties of each compound and choose the degree of each fit.
+
+        :param fuel: Fuel to fit.
+        :type fuel: fl.fuel
+        :param props: Names of the properties to fit.
+        :type props: list of str, optional
+        :param T_min: Lower end of the fits in Kelvin.
+        :type T_min: float or np.ndarray, optional
+        :param T_max: Upper end of the fits in Kelvin.
+        :type T_max: float or np.ndarray, optional
+        :param rtol: Maximum relative error of each fit.
+        :type rtol: float, optional
+        :param max_degree: Highest polynomial degree of the fits.
+        :type max_degree: int, optional
+        :raises ValueError: If a property is unknown, the temperature ranges are invalid or rtol cannot be met with max_degree.
+        """
+        self.name = fuel.name
+        self.compounds = list(fuel.compounds)
+        self.props = list(fuel.PROPERTIES if props is None else props)
+        for prop in self.props:
+            if prop not in fuel.PROPERTIES:
+                raise ValueError(
+                    f"Unknown property '{prop}', options are {fuel.PROPERTIES}."
+                )
+        shape = (fuel.num_compounds,)
+        if T_min is None:
+            T_min = fuel.Tm
+        if T_max is None:
+            T_max = self.TR_MAX * fuel.Tc
+        self.T_min = np.broadcast_to(T_min, shape).astype(float)
+        self.T_max = np.broadcast_to(T_max, shape).astype(float)
+        if not np.all(self.T_max > self.T_min):
+            bad = [
+                c for c, ok in zip(self.compounds, self.T_max > self.T_min) if not ok
+            ]
+            raise ValueError(f"T_max must be greater than T_min for compounds {bad}.")
+        self.rtol = rtol
+
+        # Chebyshev-Gauss nodes, twice as many as coefficients, and check points
+        num_nodes = 2 * (max_degree + 1)
+        x = -np.cos(np.pi * (np.arange(num_nodes) + 0.5) / num_nodes)
+        x_check = np.linspace(-1.0, 1.0, self.ERROR_CHECK_DENSITY * max_degree + 1)
+
+        # Least-squares Chebyshev coefficients of every compound and property
+        values = self._evaluate(fuel, x)
+        vander = np.polynomial.chebyshev.chebvander(x, max_degree)
+        coefficients = np.linalg.lstsq(vander, values, rcond=None)[0]
+
+        # Error of every truncation of the fits at the check points
+        exact = self._evaluate(fuel, x_check)
+        terms = np.polynomial.chebyshev.chebvander(x_check, max_degree)
+        partial_sums = np.cumsum(terms[:, :, np.newaxis] * coefficients, axis=1)
+        log_columns = self._log_columns()
+        partial_sums[:, :, log_columns] = np.exp(partial_sums[:, :, log_columns])
+        exact[:, log_columns] = np.exp(exact[:, log_columns])
+        rel_error = np.max(np.abs(partial_sums / exact[:, np.newaxis] - 1), axis=0)
+
+        # Lowest degree of each fit that meets rtol
+        converged = rel_error <= rtol
+        if not np.all(np.any(converged, axis=0)):
+            bad = self._column_names(~np.any(converged, axis=0))
+            raise ValueError(
+                f"Fits of {bad} do not reach rtol = {rtol:.3e} with degree "
+                f"{max_degree}. Increase max_degree or reduce T_max away from "
+                f"the critical point."
+            )
+        degrees = np.argmax(converged, axis=0)
+        column_errors = rel_error[degrees, np.arange(len(degrees))]
+
+        # Drop the terms above the degree of each fit
+        coefficients[np.arange(max_degree + 1)[:, np.newaxis] > degrees] = 0.0
+
+        # Split the columns by property: (max_degree + 1, num_compounds) each
+        num_compounds = len(self.compounds)
+        self.coefficients = {}
+        self.degrees = {}
+        self.errors = {}
+        for k, prop in enumerate(self.props):
+            cols = slice(k * num_compounds, (k + 1) * num_compounds)
+            self.coefficients[prop] = coefficients[:, cols]
+            self.degrees[prop] = degrees[cols]
+            self.errors[prop] = column_errors[cols]
+
+    def _evaluate(self, fuel, x):
+        """
+        Evaluate the properties of each compound at the same points x of their ranges.
+
+        :param fuel: Fuel to fit.
+        :type fuel: fl.fuel
+        :param x: Points in [-1, 1], shape (n,).
+        :type x: np.ndarray
+        :return: Values of shape (n, num_props * num_compounds), in log space for LOG_PROPERTIES.
+        :rtype: np.ndarray
+        """
+        T = self.temperature(x)
+        comp_idx = np.arange(len(self.compounds))
+        blocks = []
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for prop in self.props:
+                values = getattr(fuel, prop)(T, comp_idx=comp_idx)
+                if prop in self.LOG_PROPERTIES:
+                    values = np.log(values)
+                blocks.append(values)
+        values = np.hstack(blocks)
+        if not np.all(np.isfinite(values)):
+            bad = self._column_names(~np.all(np.isfinite(values), axis=0))
+            raise ValueError(
+                f"Properties {bad} are not finite within the fitted ranges, "
+                f"reduce T_max below the critical temperature."
+            )
+        return values
+
+    def _log_columns(self):
+        """
+        Mask of the columns that are fitted in log space.
+
+        :return: Boolean mask of shape (num_props * num_compounds,).
+        :rtype: np.ndarray
+        """
+        return np.repeat(
+            [prop in self.LOG_PROPERTIES for prop in self.props], len(self.compounds)
+        )
+
+    def _column_names(self, mask):
+        """
+        Names of the property and compound of masked columns.
+
+        :param mask: Boolean mask of shape (num_props * num_compounds,).
+        :type mask: np.ndarray
+        :return: "property/compound" of each masked column.
+        :rtype: list of str
+        """
+        names = [f"{prop}/{c}" for prop in self.props for c in self.compounds]
+        return [name for name, bad in zip(names, mask) if bad]
+
+    def temperature(self, x):
+        """
+        Map points in [-1, 1] to the temperature range of each compound.
+
+        :param x: Points in [-1, 1], shape (n,).
+        :type x: np.ndarray
+        :return: Temperatures in Kelvin, shape (n, num_compounds).
+        :rtype: np.ndarray
+        """
+        x = np.asarray(x, dtype=float)[:, np.newaxis]
+        return 0.5 * (self.T_min + self.T_max) + 0.5 * (self.T_max - self.T_min) * x
+
+    def evaluate(self, T, props=None):
+        """
+        Evaluate the fits of each compound at the given temperatures.
+
+        :meta private: Temperatures outside [T_min, T_max] of a compound extrapolate its fit.
+
+        :param T: Temperature in Kelvin, shape (nT,).
+        :type T: float or np.ndarray
+        :param props: Names of the properties to evaluate. Defaults to all fitted properties.
+        :type props: list of str, optional
+        :return: Property name to values of shape (nT, num_compounds).
+        :rtype: dict of np.ndarray
+        :raises ValueError: If a property is not fitted.
+        """
+        if props is None:
+            props = self.props
+        for prop in props:
+            if prop not in self.coefficients:
+                raise ValueError(f"Property '{prop}' is not fitted.")
+
+        T = np.atleast_1d(np.asarray(T, dtype=float))[:, np.newaxis]
+        x = (2 * T - self.T_min - self.T_max) / (self.T_max - self.T_min)
+        results = {}
+        for prop in props:
+            values = np.polynomial.chebyshev.chebval(
+                x, self.coefficients[prop], tensor=False
+            )
+            if prop in self.LOG_PROPERTIES:
+                values = np.exp(values)
+            results[prop] = values
+        return results
+
+    def power_coefficients(self, prop, scale=1.0):
+        """
+        Convert the fits of a property to coefficients of powers of x for Horner's scheme.
+
+        :meta private: The value at T is sum_k a[k] * x^k with x = (2*T - T_min - T_max)/(T_max - T_min), or the exp of that sum for LOG_PROPERTIES.
+
+        :param prop: Name of a fitted property.
+        :type prop: str
+        :param scale: Factor applied to the property, such as a unit conversion.
+        :type scale: float, optional
+        :return: Coefficients a of shape (max_degree + 1, num_compounds), zero above the degree of each fit.
+        :rtype: np.ndarray
+        """
+        chebyshev = self.coefficients[prop]
+        basis = np.zeros((len(chebyshev), len(chebyshev)))
+        for k in range(len(chebyshev)):
+            unit = np.zeros(len(chebyshev))
+            unit[k] = 1.0
+            power = np.polynomial.chebyshev.cheb2poly(unit)
+            basis[: len(power), k] = power
+        power = basis @ chebyshev
+        if prop in self.LOG_PROPERTIES:
+            power[0] += np.log(scale)
+        else:
+            power *= scale
+        return power
+
+    def coefficient_table(self, labels=None, scales=None):
+        """
+        Collect the fits in a table with one row per compound and property.
+
+        :param labels: Label of each property in the table. Defaults to the property names.
+        :type labels: dict, optional
+        :param scales: Factor applied to each property, such as a unit conversion. Defaults to 1.
+        :type scales: dict, optional
+        :return: Columns "Index", "Component", "Property", "T_min (K)", "T_max (K)", "Log", "Degree", "Max Relative Error" and the power coefficients "a_0" to "a_<max_degree>".
+        :rtype: dict
+        """
+        labels = {} if labels is None else labels
+        scales = {} if scales is None else scales
+        num_compounds = len(self.compounds)
+        num_props = len(self.props)
+        power = np.hstack(
+            [
+                self.power_coefficients(prop, scales.get(prop, 1.0))
+                for prop in self.props
+            ]
+        )
+        table = {
+            "Index": np.tile(np.arange(num_compounds), num_props),
+            "Component": np.tile(self.compounds, num_props),
+            "Property": np.repeat(
+                [labels.get(p, p) for p in self.props], num_compounds
+            ),
+            "T_min (K)": np.tile(self.T_min, num_props),
+            "T_max (K)": np.tile(self.T_max, num_props),
+            "Log": self._log_columns().astype(int),
+            "Degree": np.hstack([self.degrees[prop] for prop in self.props]),
+            "Max Relative Error": np.hstack([self.errors[prop] for prop in self.props]),
+        }
+        for k, coefficients in enumerate(power):
+            table[f"a_{k}"] = coefficients
+        return table
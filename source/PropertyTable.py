@@ -0,0 +1,427 @@
+import os
+import sys
+import json
+import numpy as np
+import FuelLib as fl
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+
+"""
+Interpolation tables of fuel properties for fast repeated evaluation.
+
+A PropertyTable tabulates the per-compound and mixture properties of a fuel
+on a uniform temperature grid and interpolates them with monotone piecewise
+cubic Hermite (PCHIP) polynomials, or linearly for tables that are handed
+to solvers which interpolate linearly themselves. Lookups locate the grid interval of each
+temperature in O(1), so millions of temperatures can be evaluated at a cost
+independent of the correlations behind the properties.
+
+Usage:
+    import FuelLib as fl
+    from PropertyTable import PropertyTable
+
+    fuel = fl.fuel("posf10325")
+    table = PropertyTable(fuel, Y=fuel.Y_0, rtol=1e-4, T_max=600.0)
+    table.save("posf10325.npz")
+    props = PropertyTable.load("posf10325.npz").lookup(T, mixture=True)
+"""
+
+
+class PropertyTable:
+    """
+    Interpolation table of per-compound and mixture properties of a fuel.
+
+    :param fuel: Fuel to tabulate.
+    :type fuel: fl.fuel
+    :param Y: Mass fractions of the mixture(s) to tabulate, shape (num_compounds,) or (nY, num_compounds). Defaults to None for per-compound properties only.
+    :type Y: np.ndarray, optional
+    :param props: Names of the properties to tabulate (see fuel.PROPERTIES). Defaults to all.
+    :type props: list of str, optional
+    :param T_min: Lower end of the table in Kelvin. Defaults to min(Tm).
+    :type T_min: float, optional
+    :param T_max: Upper end of the table in Kelvin. Defaults to TR_MAX * min(Tc).
+    :type T_max: float, optional
+    :param nT: Number of temperature nodes. Defaults to 257.
+    :type nT: int, optional
+    :param rtol: Maximum relative interpolation error. The grid is refined until it is met.
+    :type rtol: float, optional
+    :param max_nodes: Maximum number of temperature nodes when refining for rtol.
+    :type max_nodes: int, optional
+    :param interpolation: Interpolation between the nodes, one of INTERPOLATIONS. Defaults to "pchip".
+    :type interpolation: str, optional
+    """
+
+    # Interpolation methods between the temperature nodes
+    INTERPOLATIONS = ("pchip", "linear")
+
+    # Properties interpolated in log space, which vary exponentially with T
+    LOG_PROPERTIES = ("psat", "viscosity_kinematic", "viscosity_dynamic")
+
+    # Default upper end of the table relative to min(Tc). The surface tension,
+    # latent heat and thermal conductivity vanish at Tc with unbounded slopes,
+    # so no polynomial interpolant is accurate right up to the critical point.
+    TR_MAX = 0.99
+
+    # Fractions of each interval at which the interpolation error is checked
+    ERROR_CHECK_POINTS = (0.25, 0.5, 0.75)
+
+    def __init__(
+        self,
+        fuel,
+        Y=None,
+        props=None,
+        T_min=None,
+        T_max=None,
+        nT=257,
+        rtol=None,
+        max_nodes=65537,
+        interpolation="pchip",
+    ):
+        """
+        Tabulate the properties of a fuel and estimate the interpolation error.
+
+        :param fuel: Fuel to tabulate.
+        :type fuel: fl.fuel
+        :param Y: Mass fractions of the mixture(s) to tabulate.
+        :type Y: np.ndarray, optional
+        :param props: Names of the properties to tabulate.
+        :type props: list of str, optional
+        :param T_min: Lower end of the table in Kelvin.
+        :type T_min: float, optional
+        :param T_max: Upper end of the table in Kelvin.
+        :type T_max: float, optional
+        :param nT: Number of temperature nodes.
+        :type nT: int, optional
+        :param rtol: Maximum relative interpolation error.
+        :type rtol: float, optional
+        :param max_nodes: Maximum number of temperature nodes when refining for rtol.
+        :type max_nodes: int, optional
+        :param interpolation: Interpolation between the nodes, "pchip" or "linear".
+        :type interpolation: str, optional
+        :raises ValueError: If the temperature range or interpolation is invalid or rtol cannot be met with max_nodes.
+        """
+        if interpolation not in self.INTERPOLATIONS:
+            raise ValueError(
+                f"interpolation must be one of {self.INTERPOLATIONS}, got '{interpolation}'"
+            )
+        self.interpolation = interpolation
+        self.name = fuel.name
+        self.compounds = list(fuel.compounds)
+        self.props = list(fuel.PROPERTIES if props is None else props)
+        self.Y = None if Y is None else np.asarray(Y, dtype=float)
+        self.T_min = float(np.min(fuel.Tm) if T_min is None else T_min)
+        self.T_max = float(self.TR_MAX * np.min(fuel.Tc) if T_max is None else T_max)
+        if not self.T_max > self.T_min:
+            raise ValueError(
+                f"T_max ({self.T_max:.2f} K) must be greater than T_min ({self.T_min:.2f} K)."
+            )
+
+        # Column layout of the table: one block per (kind, property)
+        num_mixtures = 1 if self.Y is None or self.Y.ndim == 1 else self.Y.shape[0]
+        self.columns = {}
+        start = 0
+        kinds = ["compound"] if self.Y is None else ["compound", "mixture"]
+        for kind in kinds:
+            width = fuel.num_compounds if kind == "compound" else num_mixtures
+            for prop in self.props:
+                self.columns[f"{kind}/{prop}"] = (start, start + width)
+                start += width
+        self.log_columns = np.zeros(start, dtype=bool)
+        for key, (begin, end) in self.columns.items():
+            if key.split("/")[1] in self.LOG_PROPERTIES:
+                self.log_columns[begin:end] = True
+
+        # Tabulate, refining the grid until the error tolerance is met
+        while True:
+            self._tabulate(fuel, nT)
+            if rtol is None or max(self.errors.values()) <= rtol:
+                break
+            if 2 * nT - 1 > max_nodes:
+                raise ValueError(
+                    f"Interpolation error {max(self.errors.values()):.3e} exceeds "
+                    f"rtol = {rtol:.3e} with {nT} nodes. Increase max_nodes or "
+                    f"reduce T_max away from the critical point."
+                )
+            nT = 2 * nT - 1
+
+    def _evaluate(self, fuel, T):
+        """
+        Evaluate the tabulated properties directly with the fuel correlations.
+
+        :param fuel: Fuel to tabulate.
+        :type fuel: fl.fuel
+        :param T: Temperatures in Kelvin, shape (nT,).
+        :type T: np.ndarray
+        :return: Property values of shape (nT, num_columns), in log space for LOG_PROPERTIES.
+        :rtype: np.ndarray
+        """
+        blocks = {}
+        with np.errstate(invalid="ignore", divide="ignore"):
+            compound = fuel.evaluate(T, props=self.props)
+            for prop in self.props:
+                blocks[f"compound/{prop}"] = compound[prop]
+            if self.Y is not None:
+                mixture = fuel.evaluate(T, self.Y, props=self.props)
+                for prop in self.props:
+                    # Mixture values (nY, nT) or (nT,) to columns (nT, nY)
+                    blocks[f"mixture/{prop}"] = np.transpose(
+                        np.reshape(mixture[prop], (-1, len(T)))
+                    )
+            values = np.hstack([blocks[key] for key in self.columns])
+            values[:, self.log_columns] = np.log(values[:, self.log_columns])
+        return values
+
+    def _tabulate(self, fuel, nT):
+        """
+        Build the table on nT uniformly spaced nodes and estimate its error.
+
+        :param fuel: Fuel to tabulate.
+        :type fuel: fl.fuel
+        :param nT: Number of temperature nodes.
+        :type nT: int
+        :raises ValueError: If a property is not finite within the temperature range.
+        """
+        self.T = np.linspace(self.T_min, self.T_max, nT)
+        self.dT = self.T[1] - self.T[0]
+        self.values = self._evaluate(fuel, self.T)
+        if not np.all(np.isfinite(self.values)):
+            bad = [
+                key
+                for key, (begin, end) in self.columns.items()
+                if not np.all(np.isfinite(self.values[:, begin:end]))
+            ]
+            raise ValueError(
+                f"Properties {bad} are not finite between {self.T_min:.2f} K and "
+                f"{self.T_max:.2f} K, reduce T_max below the critical temperature."
+            )
+        self._set_coefficients()
+
+        # Maximum relative error of each property at points inside the intervals
+        points = np.concatenate(
+            [self.T[:-1] + s * self.dT for s in self.ERROR_CHECK_POINTS]
+        )
+        exact = self._evaluate(fuel, points)
+        approx = self._interpolate(points, slice(None))
+        exact[:, self.log_columns] = np.exp(exact[:, self.log_columns])
+        approx[:, self.log_columns] = np.exp(approx[:, self.log_columns])
+        error = np.abs(approx - exact)
+        scale = np.abs(exact)
+        rel_error = np.divide(
+            error, scale, out=np.where(error > 0, np.inf, 0.0), where=scale > 0
+        )
+        self.column_errors = np.max(rel_error, axis=0)
+        self.errors = {
+            key: float(np.max(self.column_errors[begin:end]))
+            for key, (begin, end) in self.columns.items()
+        }
+
+    def _set_coefficients(self):
+        """
+        Compute the node slopes and the polynomial coefficients of each interval.
+
+        :meta private: Linear interpolation is the cubic Hermite polynomial with the secant as slope at both ends of each interval, so c2 = c3 = 0 and the slopes are those of the n - 1 intervals.
+        """
+        if self.interpolation == "linear":
+            self.slopes = np.diff(self.values, axis=0) / self.dT
+            c1 = self.slopes * self.dT
+            self.coefficients = (self.values[:-1].copy(), c1, 0 * c1, 0 * c1)
+        else:
+            self.slopes = pchip_slopes(self.values, self.dT)
+            self.coefficients = hermite_coefficients(self.values, self.slopes, self.dT)
+
+    def _interpolate(self, T, cols):
+        """
+        Interpolate table columns at the given temperatures.
+
+        :param T: Temperatures in Kelvin within [T_min, T_max], shape (m,).
+        :type T: np.ndarray
+        :param cols: Columns of the table to interpolate.
+        :type cols: slice or np.ndarray
+        :return: Interpolated values of shape (m, ncols), in log space for LOG_PROPERTIES.
+        :rtype: np.ndarray
+        """
+        # Uniform grid: the interval of each temperature follows directly from T
+        x = (T - self.T_min) / self.dT
+        i = np.clip(x.astype(int), 0, len(self.T) - 2)
+        t = (x - i)[:, np.newaxis]
+
+        # Horner evaluation of the cubic on each interval
+        c0, c1, c2, c3 = [c[:, cols] for c in self.coefficients]
+        values = np.take(c3, i, axis=0)
+        for c in (c2, c1, c0):
+            values *= t
+            values += np.take(c, i, axis=0)
+        return values
+
+    def lookup(self, T, props=None, mixture=False):
+        """
+        Interpolate properties at the given temperatures.
+
+        :param T: Temperature in Kelvin within [T_min, T_max], scalar or any shape.
+        :type T: float or np.ndarray
+        :param props: Names of the properties to look up. Defaults to all tabulated properties.
+        :type props: list of str, optional
+        :param mixture: Look up mixture instead of per-compound properties.
+        :type mixture: bool, optional
+        :return: Property name to per-compound values of shape T.shape + (num_compounds,), or mixture values of shape T.shape (one composition) or (nY,) + T.shape.
+        :rtype: dict of np.ndarray
+        :raises ValueError: If a property is not tabulated or T is outside the table.
+        """
+        kind = "mixture" if mixture else "compound"
+        if props is None:
+            props = self.props
+        for prop in props:
+            if f"{kind}/{prop}" not in self.columns:
+                raise ValueError(
+                    f"{kind.capitalize()} property '{prop}' is not tabulated."
+                )
+
+        T = np.asarray(T, dtype=float)
+        Tflat = T.reshape(-1)
+        if Tflat.size and (np.min(Tflat) < self.T_min or np.max(Tflat) > self.T_max):
+            raise ValueError(
+                f"Temperatures must be between {self.T_min:.2f} K and {self.T_max:.2f} K."
+            )
+
+        # Interpolate all requested columns together, sharing the interval search
+        blocks = [self.columns[f"{kind}/{prop}"] for prop in props]
+        cols = np.concatenate([np.arange(begin, end) for begin, end in blocks])
+        values = self._interpolate(Tflat, cols)
+        log_cols = self.log_columns[cols]
+        values[:, log_cols] = np.exp(values[:, log_cols])
+
+        results = {}
+        offset = 0
+        for prop, (begin, end) in zip(props, blocks):
+            block = values[:, offset : offset + end - begin]
+            offset += end - begin
+            if not mixture:
+                results[prop] = block.reshape(T.shape + (end - begin,))
+            elif self.Y.ndim == 1:
+                results[prop] = block.reshape(T.shape)
+            else:
+                results[prop] = np.moveaxis(block, 0, 1).reshape((-1,) + T.shape)
+        return results
+
+    def save(self, file):
+        """
+        Save the table to a NumPy .npz file.
+
+        :param file: Path to the file.
+        :type file: str
+        """
+        meta = {
+            "name": self.name,
+            "compounds": self.compounds,
+            "props": self.props,
+            "columns": self.columns,
+            "errors": self.errors,
+            "interpolation": self.interpolation,
+        }
+        arrays = {
+            "meta": np.array(json.dumps(meta)),
+            "T": self.T,
+            "values": self.values,
+            "slopes": self.slopes,
+            "log_columns": self.log_columns,
+            "column_errors": self.column_errors,
+        }
+        if self.Y is not None:
+            arrays["Y"] = self.Y
+        np.savez(file, **arrays)
+
+    @classmethod
+    def load(cls, file):
+        """
+        Load a table saved with PropertyTable.save.
+
+        :param file: Path to the file.
+        :type file: str
+        :return: Property table.
+        :rtype: PropertyTable
+        """
+        table = cls.__new__(cls)
+        with np.load(file) as data:
+            meta = json.loads(str(data["meta"]))
+            table.T = data["T"]
+            table.values = data["values"]
+            table.log_columns = data["log_columns"]
+            table.column_errors = (
+                data["column_errors"] if "column_errors" in data else None
+            )
+            table.Y = data["Y"] if "Y" in data else None
+        table.name = meta["name"]
+        table.compounds = meta["compounds"]
+        table.props = meta["props"]
+        table.columns = {key: tuple(cols) for key, cols in meta["columns"].items()}
+        table.errors = meta["errors"]
+        table.T_min = float(table.T[0])
+        table.T_max = float(table.T[-1])
+        table.interpolation = meta.get("interpolation", "pchip")
+        table.dT = table.T[1] - table.T[0]
+        table._set_coefficients()
+        return table
+
+
+def pchip_slopes(values, h):
+    """
+    Compute monotone cubic Hermite slopes of data on a uniform grid.
+
+    :meta private: Uses the Fritsch-Carlson harmonic mean of neighboring secants, with one-sided three-point end slopes (see scipy.interpolate.PchipInterpolator).
+
+    :param values: Values at the grid nodes, shape (n, ncols) with n >= 2.
+    :type values: np.ndarray
+    :param h: Grid spacing.
+    :type h: float
+    :return: Slopes at the grid nodes, shape (n, ncols).
+    :rtype: np.ndarray
+    """
+    delta = np.diff(values, axis=0) / h
+    slopes = np.zeros_like(values)
+    if len(values) == 2:
+        slopes[:] = delta
+        return slopes
+
+    # Interior nodes: harmonic mean of secants of equal sign, zero otherwise
+    d0 = delta[:-1]
+    d1 = delta[1:]
+    same_sign = d0 * d1 > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        harmonic = 2.0 / (1.0 / d0 + 1.0 / d1)
+    slopes[1:-1] = np.where(same_sign, harmonic, 0.0)
+
+    # End nodes: one-sided three-point estimate, limited to preserve monotonicity
+    for end, d0, d1 in [(0, delta[0], delta[1]), (-1, delta[-1], delta[-2])]:
+        d = (3 * d0 - d1) / 2
+        d = np.where(np.sign(d) != np.sign(d0), 0.0, d)
+        d = np.where(
+            (np.sign(d0) != np.sign(d1)) & (np.abs(d) > np.abs(3 * d0)), 3 * d0, d
+        )
+        slopes[end] = d
+    return slopes
+
+
+def hermite_coefficients(values, slopes, h):
+    """
+    Convert cubic Hermite data on a uniform grid to polynomial coefficients.
+
+    :param values: Values at the grid nodes, shape (n, ncols).
+    :type values: np.ndarray
+    :param slopes: Slopes at the grid nodes, shape (n, ncols).
+    :type slopes: np.ndarray
+    :param h: Grid spacing.
+    :type h: float
+    :return: Coefficients c0, c1, c2, c3 of shape (n - 1, ncols), such that the value at fraction t of interval i is c0[i] + c1[i]*t + c2[i]*t^2 + c3[i]*t^3.
+    :rtype: tuple of np.ndarray
+    """
+    y0 = values[:-1]
+    y1 = values[1:]
+    m0 = slopes[:-1] * h
+    m1 = slopes[1:] * h
+    c2 = 3 * (y1 - y0) - 2 * m0 - m1
+    c3 = 2 * (y0 - y1) + m0 + m1
+    return y0.copy(), m0, c2, c3
@@ -0,0 +1,76 @@
+import io
+import os
+import sys
+import contextlib
+import numpy as np
+import unittest
+from scipy.optimize import curve_fit
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+
+
+def antoine(T, A, B, C):
+    """log10 of the pressure from the Antoine equation"""
+    return A - B / (C + T)
+
+
+class AntoineTestCase(unittest.TestCase):
+    """Test batched Antoine fits against independent fits of each data set"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fuel = fl.fuel("posf10325")
+        cls.units = ["mks", "cgs", "bar"]
+
+    def assertFitEqual(self, T, logP, coeffs, residual):
+        """Check a batched fit against curve_fit from a generic starting point"""
+        ref, _ = curve_fit(antoine, T, logP, p0=(10.0, 2000.0, -50.0), maxfev=10000)
+        np.testing.assert_allclose(coeffs, ref, rtol=1e-5)
+        rms = np.sqrt(np.mean((antoine(T, *coeffs) - logP) ** 2))
+        rms_ref = np.sqrt(np.mean((antoine(T, *ref) - logP) ** 2))
+        self.assertLessEqual(rms, rms_ref * (1 + 1e-6))
+        self.assertAlmostEqual(residual, rms, delta=1e-12 + 1e-10 * rms)
+
+    def test_compounds(self):
+        """Do the compound coefficients match curve_fit in every unit system?"""
+
+        fuel = self.fuel
+        coeffs = {}
+        for units in self.units:
+            # Default nodes are [273.15, Tb] of each compound
+            with contextlib.redirect_stdout(io.StringIO()):
+                A, B, C, D, residuals = fuel.psat_antoine_coeffs(
+                    units=units, return_residuals=True
+                )
+            np.testing.assert_array_equal(D, fl.antoine_pressure_scale(units))
+            for i in range(fuel.num_compounds):
+                T = np.linspace(273.15, fuel.Tb[i], 20)
+                logP = np.log10(fuel.psat(T)[:, i] / D[i])
+                self.assertFitEqual(T, logP, (A[i], B[i], C[i]), residuals[i])
+            coeffs[units] = A + np.log10(D), B, C
+
+        # Changing the pressure units only shifts A
+        for units in self.units[1:]:
+            for pred, ref in zip(coeffs[units], coeffs["mks"]):
+                np.testing.assert_allclose(pred, ref, rtol=1e-6, err_msg=units)
+
+    def test_mixture(self):
+        """Do the mixture coefficients match curve_fit in every unit system?"""
+
+        fuel = self.fuel
+        T = np.linspace(273.15, 450.0, 20)
+        for units in self.units:
+            A, B, C, D, residual = fuel.mixture_vapor_pressure_antoine_coeffs(
+                fuel.Y_0, Tvals=T, units=units, return_residuals=True
+            )
+            logP = np.log10(fuel.mixture_vapor_pressure(fuel.Y_0, T) / D)
+            self.assertFitEqual(T, logP, (A, B, C), residual)
+
+
+if __name__ == "__main__":
+    unittest.main()
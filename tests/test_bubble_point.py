@@ -0,0 +1,133 @@
+import os
+import sys
+import numpy as np
+import unittest
+from scipy.optimize import brentq
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+
+
+class BubblePointTestCase(unittest.TestCase):
+    """Test vectorized bubble-point and dew-point solvers"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fuel = fl.fuel("posf10264")
+        rng = np.random.default_rng(0)
+        cls.Y = cls.fuel.mass2Y(rng.random((20, cls.fuel.num_compounds)))
+        cls.p = 10 ** rng.uniform(3.5, 6.0, 20)
+        cls.correlations = ["Lee-Kesler", "Ambrose-Walton"]
+
+    def test_dpsat_dT(self):
+        """Does the analytic derivative match finite differences of psat?"""
+
+        T = np.linspace(250, 600, 8)
+        h = 1e-3
+        for correlation in self.correlations:
+            with np.errstate(invalid="ignore"):
+                fd = (
+                    self.fuel.psat(T + h, correlation=correlation)
+                    - self.fuel.psat(T - h, correlation=correlation)
+                ) / (2 * h)
+                pred = self.fuel.dpsat_dT(T, correlation=correlation)
+            finite = np.isfinite(fd)
+            self.assertTrue(np.any(finite))
+            np.testing.assert_allclose(
+                pred[finite], fd[finite], rtol=1e-6, err_msg=correlation
+            )
+
+    def test_scalar_root(self):
+        """Do the batched solvers match scalar root finding of each mixture?"""
+
+        for correlation in self.correlations:
+            bubble = self.fuel.bubble_point(self.Y, self.p, correlation=correlation)
+            dew = self.fuel.dew_point(self.Y, self.p, correlation=correlation)
+            self.assertEqual(bubble.shape, self.p.shape)
+            for n in range(len(self.p)):
+                X = self.fuel.Y2X(self.Y[n])
+
+                def f_bubble(T):
+                    p_v = self.fuel.mixture_vapor_pressure(
+                        self.Y[n], T, correlation=correlation
+                    )
+                    return np.log(p_v / self.p[n])
+
+                def f_dew(T):
+                    psat = self.fuel.psat(T, correlation=correlation)
+                    return np.log(np.sum(X * self.p[n] / psat))
+
+                T_max = np.min(self.fuel.Tc) - 1e-6
+                for pred, f in [(bubble[n], f_bubble), (dew[n], f_dew)]:
+                    if f(T_max) * f(200.0) < 0:
+                        T = brentq(f, 200.0, T_max, xtol=1e-10)
+                        self.assertAlmostEqual(pred, T, delta=1e-5)
+            self.assertTrue(np.all(dew > bubble))
+
+    def test_near_critical(self):
+        """Are roots near the critical pressure of the lightest compounds finite and exact?"""
+
+        fuel = self.fuel
+        light = np.argsort(fuel.Tc)[:3]
+        rng = np.random.default_rng(1)
+        Y = fuel.mass2Y(rng.random((40, fuel.num_compounds)))
+        Y[20:, light] += 5 * rng.random((20, 3))
+        Y = fuel.mass2Y(Y)
+        p = np.outer(rng.uniform(0.8, 1.05, 40), fuel.Pc[light]).ravel()
+        Y = np.repeat(Y, 3, axis=0)
+        T_max = np.max(fuel.Tc)
+        for correlation in self.correlations:
+
+            def psat(T):
+                # Ambrose-Walton is held at Pc above Tc, as in the solvers
+                with np.errstate(invalid="ignore"):
+                    psat = fuel.psat(T, correlation=correlation)
+                if correlation == "Ambrose-Walton":
+                    psat = np.where(T < fuel.Tc, psat, fuel.Pc)
+                return psat
+
+            bubble = fuel.bubble_point(Y, p, correlation=correlation)
+            dew = fuel.dew_point(Y, p, correlation=correlation)
+            for n in range(len(p)):
+                X = fuel.Y2X(Y[n])
+
+                def f_bubble(T):
+                    return np.log(np.sum(X * psat(T)) / p[n])
+
+                def f_dew(T):
+                    return np.log(np.sum(X * p[n] / psat(T)))
+
+                for pred, f in [(bubble[n], f_bubble), (dew[n], f_dew)]:
+                    if f(200.0) < 0 < f(T_max):
+                        T = brentq(f, 200.0, T_max, xtol=1e-10)
+                        self.assertAlmostEqual(pred, T, delta=1e-5, msg=correlation)
+
+    def test_max_iter(self):
+        """Do rows still bracketed after max_iter get a finite temperature?"""
+
+        for correlation in self.correlations:
+            T = self.fuel.bubble_point(
+                self.Y, self.p, correlation=correlation, max_iter=1
+            )
+            self.assertTrue(np.all(np.isfinite(T)))
+            self.assertTrue(np.all(T <= np.max(self.fuel.Tc)))
+
+    def test_pure_compound(self):
+        """Are the bubble and dew points of a single compound equal?"""
+
+        fuel = fl.fuel("decane")
+        p = np.array([1e4, 101325.0, 1e6])
+        bubble = fuel.bubble_point(fuel.Y_0, p)
+        np.testing.assert_allclose(fuel.dew_point(fuel.Y_0, p), bubble, atol=1e-6)
+        np.testing.assert_allclose(fuel.psat(bubble)[:, 0], p, rtol=1e-7)
+
+        # No bubble point above the critical pressure
+        self.assertTrue(np.isnan(fuel.bubble_point(fuel.Y_0, 2 * fuel.Pc[0])))
+
+
+if __name__ == "__main__":
+    unittest.main()
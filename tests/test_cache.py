@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import numpy as np
+import unittest
+from unittest import mock
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+
+
+class CacheTestCase(unittest.TestCase):
+    """Test the compiled cache of the derived GCM properties"""
+
+    def setUp(self):
+        self.name = "heptane-decane"
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dataDir = os.path.join(self.tmpdir.name, "fuelData")
+        self.cacheDir = os.path.join(self.tmpdir.name, "cache")
+        self.gcData = os.path.join(self.dataDir, "gcData", f"{self.name}_init.csv")
+        self.decomp = os.path.join(
+            self.dataDir, "groupDecompositionData", f"{self.name}.csv"
+        )
+        self.gcmTable = os.path.join(self.tmpdir.name, "gcmTable.csv")
+        os.makedirs(os.path.dirname(self.gcData))
+        os.makedirs(os.path.dirname(self.decomp))
+        shutil.copy(os.path.join(FUELDATA_GC_DIR, f"{self.name}_init.csv"), self.gcData)
+        shutil.copy(os.path.join(FUELDATA_DECOMP_DIR, f"{self.name}.csv"), self.decomp)
+        shutil.copy(fl._gcm_table_file, self.gcmTable)
+        self.gcmTableFile = fl._gcm_table_file
+        fl.reload_gcm_table(self.gcmTable)
+
+    def tearDown(self):
+        fl.reload_gcm_table(self.gcmTableFile)
+        self.tmpdir.cleanup()
+
+    def fuel(self, useCache=True):
+        """Fuel from the temporary copies of the input files"""
+        return fl.fuel(
+            self.name,
+            fuelDataDir=self.dataDir,
+            useCache=useCache,
+            cacheDir=self.cacheDir,
+        )
+
+    def edit(self, file, old, new):
+        """Replace text in an input file and give it a new modification time"""
+        with open(file, encoding="utf-8") as f:
+            text = f.read()
+        self.assertIn(old, text)
+        with open(file, "w", encoding="utf-8") as f:
+            f.write(text.replace(old, new, 1))
+        stat = os.stat(file)
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def assertFuelEqual(self, fuel, expected):
+        """Check that two fuels have the same derived GCM properties"""
+        for prop in fuel.CACHED_PROPS + ("Nij", "fam", "Y_0"):
+            np.testing.assert_array_equal(
+                getattr(fuel, prop), getattr(expected, prop), err_msg=prop
+            )
+        self.assertEqual(fuel.compounds, expected.compounds)
+        self.assertEqual(fuel.pelephysics_keys, expected.pelephysics_keys)
+        self.assertEqual(fuel.num_groups, expected.num_groups)
+
+    def test_cache_matches_build(self):
+        """Does a fuel loaded from the cache equal a freshly built fuel?"""
+
+        built = self.fuel()
+        self.assertTrue(os.path.exists(built.cacheFile))
+
+        # The cached fuel does not read the input files
+        with mock.patch.object(fl.pd, "read_csv", side_effect=AssertionError):
+            cached = self.fuel()
+        self.assertFuelEqual(cached, self.fuel(useCache=False))
+        self.assertFuelEqual(cached, built)
+
+        T = np.linspace(300, 500, 5)
+        for prop in ["density", "psat", "surface_tension", "thermal_conductivity"]:
+            np.testing.assert_array_equal(
+                getattr(cached, prop)(T), getattr(built, prop)(T), err_msg=prop
+            )
+
+    def test_invalidation(self):
+        """Is the cache rebuilt when an input file changes?"""
+
+        edits = [
+            (self.gcData, "73.75", "70.00", "Y_0"),
+            (self.decomp, "NC7H16,2,5,", "NC7H16,2,6,", "Tc"),
+            (self.gcmTable, "1.6781", "1.7781", "Tc"),
+        ]
+        for file, old, new, prop in edits:
+            fuel = self.fuel()
+            self.edit(file, old, new)
+            fl.reload_gcm_table()
+            changed = self.fuel()
+            self.assertNotEqual(changed.cacheFile, fuel.cacheFile, msg=file)
+            self.assertFalse(
+                np.array_equal(getattr(changed, prop), getattr(fuel, prop))
+            )
+            self.assertFuelEqual(changed, self.fuel(useCache=False))
+
+    def test_file_hash(self):
+        """Are memoized file digests recomputed when the file changes?"""
+
+        digest = fl.file_hash(self.gcData)
+        self.assertEqual(fl.file_hash(self.gcData), digest)
+        self.edit(self.gcData, "73.75", "73.76")
+        self.assertNotEqual(fl.file_hash(self.gcData), digest)
+
+    def test_corrupt_cache(self):
+        """Does a corrupt or truncated cache fall back to rebuilding the fuel?"""
+
+        expected = self.fuel(useCache=False)
+        cacheFile = self.fuel().cacheFile
+        with open(cacheFile, "rb") as f:
+            valid = f.read()
+        header, body = valid.split(b"\n", 1)
+        layout = json.loads(header)
+        layout["arrays"][1][2][0] -= 1
+        corruptions = {
+            "truncated body": valid[:-8],
+            "padded body": valid + b"\0" * 8,
+            "missing body": header + b"\n",
+            "truncated header": valid[: len(header) // 2],
+            "empty": b"",
+            "missing key": header.replace(b'"props"', b'"propz"', 1) + b"\n" + body,
+            "wrong shape": json.dumps(layout).encode() + b"\n" + body,
+            "not json": b"\xff" + valid[1:],
+        }
+        for corruption, data in corruptions.items():
+            with open(cacheFile, "wb") as f:
+                f.write(data)
+            self.assertFalse(self.fuel(useCache=False).load_cache(cacheFile))
+            fuel = self.fuel()
+            self.assertFuelEqual(fuel, expected)
+
+            # The rebuilt fuel replaces the corrupt cache
+            with open(cacheFile, "rb") as f:
+                self.assertEqual(f.read(), valid, msg=corruption)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import numpy as np
+import unittest
+from scipy.optimize import brentq
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+from Distillation import distillation_curve
+
+
+class DistillationTestCase(unittest.TestCase):
+    """Test simulated distillation curves"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fuel = fl.fuel("heptane-decane")
+        cls.p = np.array([5e4, 101325.0])
+
+    def bubble_point(self, fuel, Y, p):
+        """Bubble-point temperature by scalar root finding"""
+        return brentq(lambda T: fuel.mixture_vapor_pressure(Y, T) - p, 200.0, 700.0)
+
+    def test_pure_compound(self):
+        """Does a single compound distill at its boiling point?"""
+
+        fuel = fl.fuel("decane")
+        T = distillation_curve(fuel, p=self.p, steps=20)["T"]
+        for j, p in enumerate(self.p):
+            Tb = self.bubble_point(fuel, fuel.Y_0, p)
+            np.testing.assert_allclose(T[j], Tb, atol=1e-4)
+
+    def test_binary(self):
+        """Does the curve rise from the bubble point to the heavy compound?"""
+
+        curve = distillation_curve(self.fuel, p=self.p, recovered=[0.0, 0.5, 0.99])
+        T = curve["T"]
+        self.assertEqual(T.shape, (len(self.p), 3))
+        for j, p in enumerate(self.p):
+            ibp = self.bubble_point(self.fuel, self.fuel.Y_0, p)
+            decane = self.bubble_point(self.fuel, np.array([0.0, 1.0]), p)
+            self.assertAlmostEqual(T[j, 0], ibp, delta=1e-4)
+            self.assertTrue(np.all(np.diff(T[j]) > 0))
+            self.assertAlmostEqual(T[j, -1], decane, delta=0.5)
+
+        # Converged in the number of steps
+        fine = distillation_curve(self.fuel, p=self.p, recovered=[0.5], steps=800)
+        np.testing.assert_allclose(fine["T"][:, 0], T[:, 1], atol=0.01)
+
+    def test_batch(self):
+        """Do batched fuels and pressures match individual curves?"""
+
+        fuels = [self.fuel, fl.fuel("posf10264")]
+        batch = distillation_curve(fuels, p=self.p, steps=50)["T"]
+        self.assertEqual(batch.shape[:2], (len(fuels), len(self.p)))
+        for i, fuel in enumerate(fuels):
+            for j, p in enumerate(self.p):
+                single = distillation_curve(fuel, p=p, steps=50)["T"]
+                np.testing.assert_allclose(batch[i, j], single, rtol=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import sys
+import numpy as np
+import unittest
+from scipy.integrate import solve_ivp
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+from DropletEvaporation import DropletEnsemble, evaporation_constant, d2_lifetimes
+
+
+class DropletEvaporationTestCase(unittest.TestCase):
+    """Test the heating and evaporation of droplet ensembles"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fuel = fl.fuel("heptane-decane")
+        cls.r = np.array([10e-6, 25e-6, 40e-6])
+        cls.T_gas = np.array([700.0, 800.0, 1000.0])
+        cls.t = np.linspace(0.0, 4e-3, 9)
+
+    def test_ensemble(self):
+        """Does an ensemble evolve like its droplets on their own?"""
+
+        ensemble = DropletEnsemble(self.fuel, self.r, 300.0, T_gas=self.T_gas)
+        history = ensemble.solve(self.t)
+        self.assertEqual(history["Y"].shape, (len(self.t), 3, 2))
+        for i in range(3):
+            single = DropletEnsemble(self.fuel, self.r[i], 300.0, T_gas=self.T_gas[i])
+            ref = single.solve(self.t)
+            for key in ["r", "T", "Y"]:
+                np.testing.assert_allclose(
+                    history[key][:, i], ref[key][:, 0], rtol=1e-10, err_msg=key
+                )
+
+    def test_accuracy(self):
+        """Does the adaptive integration match a tightly converged solution?"""
+
+        drop = DropletEnsemble(self.fuel, 25e-6, 300.0, T_gas=800.0)
+        nc = self.fuel.num_compounds
+
+        def rhs(t, y):
+            dm_dt, dT_dt = drop.rates(y[np.newaxis, :nc], y[nc:])
+            return np.concatenate([dm_dt[0], dT_dt])
+
+        y0 = np.concatenate([drop.mass[0], drop.T])
+        ref = solve_ivp(
+            rhs, (0.0, self.t[-1]), y0, t_eval=self.t, rtol=1e-10, atol=1e-20
+        )
+        r_ref = drop.radius(ref.y[:nc].T, ref.y[nc])
+
+        history = drop.solve(self.t, rtol=1e-5)
+        np.testing.assert_allclose(history["r"][:, 0], r_ref, rtol=1e-4)
+        np.testing.assert_allclose(history["T"][:, 0], ref.y[nc], rtol=1e-4)
+
+    def test_evaporation(self):
+        """Does the lighter compound evaporate first until the droplet is gone?"""
+
+        drop = DropletEnsemble(self.fuel, 10e-6, 300.0, T_gas=1000.0)
+        history = drop.solve(np.linspace(0.0, 5e-3, 51))
+        alive = ~history["evaporated"][:, 0]
+        self.assertFalse(alive[-1])
+        self.assertLess(history["r"][alive, 0][-1], 0.5 * history["r"][0, 0])
+        heptane = history["Y"][alive, 0, 0]
+        self.assertTrue(np.all(np.diff(heptane) < 0))
+
+    def test_d2_law(self):
+        """Does a droplet at the wet-bulb temperature follow the d^2 law?"""
+
+        fuel = fl.fuel("decane")
+        K, T_s, _ = evaporation_constant(fuel, 800.0)
+        drop = DropletEnsemble(fuel, 25e-6, T_s, T_gas=800.0)
+        history = drop.solve(self.t)
+        d2 = (2 * history["r"][:, 0]) ** 2
+        np.testing.assert_allclose(-np.diff(d2) / np.diff(self.t), K, rtol=1e-4)
+        np.testing.assert_allclose(history["T"][:, 0], T_s, rtol=1e-6)
+
+    def test_cp_vapor(self):
+        """Is the vapor specific heat of the Stefan correction configurable?"""
+
+        fuel = fl.fuel("decane")
+        K, T_s, _ = evaporation_constant(fuel, 800.0)
+        K_cl, T_cl, _ = evaporation_constant(fuel, 800.0, cp_vapor=fuel.Cl)
+        np.testing.assert_array_equal([K_cl, T_cl], [K, T_s])
+
+        # A lower vapor specific heat conducts more heat to the surface
+        cp_vapor = 0.8 * fuel.Cl(np.array([T_s]))[0]
+        K_low, T_low, _ = evaporation_constant(fuel, 800.0, cp_vapor=cp_vapor)
+        self.assertGreater(T_low, T_s)
+        self.assertGreater(K_low, K)
+
+        drop = DropletEnsemble(fuel, 25e-6, T_low, T_gas=800.0, cp_vapor=cp_vapor)
+        history = drop.solve(self.t)
+        np.testing.assert_allclose(history["T"][:, 0], T_low, rtol=1e-6)
+
+    def test_d2_lifetimes(self):
+        """Are chunked lifetimes of a size distribution consistent?"""
+
+        rng = np.random.default_rng(0)
+        d0 = rng.lognormal(np.log(30e-6), 0.5, 1000)
+        T_gas = rng.choice([600.0, 800.0, 1000.0], size=len(d0))
+        result = d2_lifetimes(self.fuel, d0, T_gas, bins=20)
+        chunked = d2_lifetimes(self.fuel, d0, T_gas, bins=20, chunk_size=64)
+        for key in ["lifetime", "evaporation_rate", "K", "histogram"]:
+            np.testing.assert_allclose(chunked[key], result[key], err_msg=key)
+        self.assertEqual(result["histogram"].sum(), len(d0))
+
+        # Lifetimes scale with d0^2 at fixed gas conditions
+        K, _, _ = evaporation_constant(self.fuel, 800.0)
+        hot = d2_lifetimes(self.fuel, d0, 800.0)
+        np.testing.assert_allclose(hot["lifetime"], d0**2 / K)
+        np.testing.assert_allclose(
+            result["lifetime"][T_gas == 800.0], hot["lifetime"][T_gas == 800.0]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
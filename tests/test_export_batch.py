@@ -0,0 +1,98 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+from Export4Pele import export_pele
+from ExportBatch import expand_manifest, export_batch, load_fuel
+
+
+def read_deck(file_path):
+    """Read a Pele input file without its generation timestamp"""
+    with open(file_path, "r") as f:
+        return [line for line in f if not line.startswith("# Generated:")]
+
+
+class ExportBatchTestCase(unittest.TestCase):
+    """Test that batch exports match the exports of the individual scripts"""
+
+    def test_expand_manifest(self):
+        """Are lists of options expanded into every combination?"""
+
+        manifest = {
+            "defaults": {"export_dir": "out/{units}"},
+            "exports": [
+                {
+                    "exporter": "pele",
+                    "fuel_name": ["posf10264", "heptane-decane"],
+                    "units": ["mks", "cgs"],
+                    "dep_fuel_names": ["NC10H22"],
+                },
+                {"exporter": "converge", "fuel_name": "posf10264", "units": "mks"},
+            ],
+        }
+        exports = expand_manifest(manifest)
+        self.assertEqual(len(exports), 5)
+        self.assertEqual(exports[1]["units"], "cgs")
+        self.assertEqual(exports[0]["dep_fuel_names"], ["NC10H22"])
+        self.assertEqual(exports[4]["exporter"], "converge")
+
+        with self.assertRaises(ValueError):
+            expand_manifest({"exports": [{"exporter": "fluent", "fuel_name": "a"}]})
+        with self.assertRaises(ValueError):
+            expand_manifest(
+                {"exports": [{"exporter": "pele", "fuel_name": "a", "temp_min": 0}]}
+            )
+        with self.assertRaises(ValueError):
+            expand_manifest(
+                {
+                    "exports": [
+                        {"exporter": "pele", "fuel_name": "a", "export_dir": "{x}"}
+                    ]
+                }
+            )
+
+    def test_batch_export(self):
+        """Do batch exports write the same files as individual exports?"""
+
+        manifest = {
+            "exports": [
+                {
+                    "exporter": "pele",
+                    "fuel_name": "heptane-decane",
+                    "units": ["mks", "cgs"],
+                    "liq_prop_model": ["gcm", "mp"],
+                }
+            ]
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest["defaults"] = {"export_dir": os.path.join(tmpdir, "{units}")}
+            export_batch(expand_manifest(manifest), jobs=2)
+
+            fuel = fl.fuel("heptane-decane")
+            for units in ["mks", "cgs"]:
+                for model in ["GCM", "MP"]:
+                    path = os.path.join(tmpdir, "ref", units)
+                    export_pele(
+                        fuel, path=path, units=units, liq_prop_model=model.lower()
+                    )
+                    file_name = f"sprayProps{model}_heptane-decane.inp"
+                    self.assertEqual(
+                        read_deck(os.path.join(tmpdir, units, file_name)),
+                        read_deck(os.path.join(path, file_name)),
+                    )
+
+    def test_shared_fuel(self):
+        """Is each fuel loaded only once per process?"""
+
+        self.assertIs(load_fuel("heptane-decane"), load_fuel("heptane-decane"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import sys
+import importlib.util
+import tempfile
+import numpy as np
+import unittest
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+from ExportFormats import FORMATS, table_file, write_table, read_table
+from Export4Converge import export_converge
+
+# Optional package required to write each binary format
+OPTIONAL_PACKAGES = {"parquet": "pyarrow", "hdf5": "h5py"}
+
+
+class ExportFormatsTestCase(unittest.TestCase):
+    """Test that tables read back from every format match the written values"""
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(0)
+        cls.table = {
+            "Compound": np.array(["n-Heptane", "Toluene", "n-Decane"]),
+            "Temperature (K)": np.array([280.0, 300.0, 320.0]),
+            "Density (kg/m^3)": rng.uniform(600.0, 900.0, 3),
+            "Vapor Pressure (Pa)": rng.lognormal(8.0, 4.0, 3),
+        }
+
+    def test_round_trip(self):
+        """Do the binary formats preserve every value exactly?"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for fmt in FORMATS:
+                package = OPTIONAL_PACKAGES.get(fmt)
+                if package is not None and importlib.util.find_spec(package) is None:
+                    continue
+                with self.subTest(fmt=fmt):
+                    file = table_file(os.path.join(tmpdir, "table"), fmt)
+                    write_table(file, self.table)
+                    table = read_table(file)
+                    self.assertEqual(list(table), list(self.table))
+                    for label, values in self.table.items():
+                        np.testing.assert_array_equal(table[label], values)
+
+                    # Read a subset of the columns
+                    table = read_table(file, columns=["Density (kg/m^3)"])
+                    self.assertEqual(list(table), ["Density (kg/m^3)"])
+
+    def test_converge_export(self):
+        """Does the npz export match the default csv export?"""
+
+        fuel = fl.fuel("heptane-decane")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for fmt in ["csv", "npz"]:
+                export_converge(
+                    fuel,
+                    path=os.path.join(tmpdir, fmt),
+                    export_mix=True,
+                    temp_min=280,
+                    temp_max=400,
+                    temp_step=20,
+                    export_format=fmt,
+                )
+            csv_file, npz_file = [
+                table_file(
+                    os.path.join(tmpdir, fmt, "mixturePropsGCM_heptane-decane"), fmt
+                )
+                for fmt in ["csv", "npz"]
+            ]
+            ref = read_table(csv_file)
+            table = read_table(npz_file)
+            self.assertEqual(list(table), list(ref))
+            for label in ref:
+                np.testing.assert_array_equal(table[label], ref[label], err_msg=label)
+
+    def test_unknown_format(self):
+        """Are unsupported formats rejected?"""
+
+        with self.assertRaises(ValueError):
+            table_file("table", "xlsx")
+        with self.assertRaises(ValueError):
+            write_table("table.xlsx", self.table)
+
+
+if __name__ == "__main__":
+    unittest.main()
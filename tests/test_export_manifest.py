@@ -0,0 +1,98 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+from Export4Pele import export_pele, get_filename
+from Export4Converge import export_converge
+import PropertyTable
+import PropertyFits
+
+
+class ExportManifestTestCase(unittest.TestCase):
+    """Test that exports are only regenerated when their inputs change"""
+
+    def setUp(self):
+        self.fuel = fl.fuel("heptane-decane")
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = self.tmpdir.name
+        self.file = get_filename(self.fuel.name, "gcm", False, self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def export(self, **kwargs):
+        """Export the fuel for Pele and return whether the file was written"""
+        if os.path.exists(self.file):
+            os.utime(self.file, ns=(0, 0))
+        export_pele(self.fuel, path=self.path, **kwargs)
+        return os.stat(self.file).st_mtime_ns != 0
+
+    def test_skip_unchanged(self):
+        """Are exports with unchanged inputs and parameters skipped?"""
+
+        self.assertTrue(self.export())
+        self.assertFalse(self.export())
+        self.assertTrue(self.export(force=True))
+        self.assertTrue(os.path.exists(f"{self.file}.manifest.json"))
+
+    def test_regenerate_changed(self):
+        """Are exports regenerated when parameters, fuel or outputs change?"""
+
+        self.export()
+        self.assertTrue(self.export(units="cgs"))
+        self.assertFalse(self.export(units="cgs"))
+
+        # Change the composition of the fuel
+        self.fuel.Y_0 = self.fuel.Y_0[::-1].copy()
+        self.assertTrue(self.export(units="cgs"))
+
+        # Modify the exported file
+        with open(self.file, "a") as f:
+            f.write("\n")
+        self.assertTrue(self.export(units="cgs"))
+
+    def test_regenerate_code_changed(self):
+        """Are exports regenerated when the table or fit modules change?"""
+
+        file_hash = fl.file_hash
+        converge_file = os.path.join(self.path, f"mixturePropsGCM_{self.fuel.name}.csv")
+        options = dict(path=self.path, temp_min=280, temp_max=400, temp_step=20)
+        for module in [PropertyTable, PropertyFits]:
+            self.export()
+            export_converge(self.fuel, export_mix=True, **options)
+            os.utime(converge_file, ns=(0, 0))
+
+            def edited_hash(file):
+                """Hash of the files with the module source edited"""
+                if os.path.samefile(file, module.__file__):
+                    return "edited"
+                return file_hash(file)
+
+            with mock.patch.object(fl, "file_hash", edited_hash):
+                self.assertTrue(self.export(), msg=module.__name__)
+                export_converge(self.fuel, export_mix=True, **options)
+            self.assertNotEqual(os.stat(converge_file).st_mtime_ns, 0)
+
+    def test_converge_components(self):
+        """Are component exports regenerated when a component file is missing?"""
+
+        options = dict(path=self.path, temp_min=280, temp_max=400, temp_step=20)
+        export_converge(self.fuel, **options)
+        component = os.path.join(
+            self.path, self.fuel.name, f"0_{self.fuel.compounds[0]}.csv"
+        )
+        os.remove(component)
+        export_converge(self.fuel, **options)
+        self.assertTrue(os.path.exists(component))
+
+
+if __name__ == "__main__":
+    unittest.main()
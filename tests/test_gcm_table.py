@@ -0,0 +1,73 @@
+import os
+import sys
+import shutil
+import tempfile
+import numpy as np
+import unittest
+from unittest import mock
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+
+
+class GcmTableTestCase(unittest.TestCase):
+    """Test the GCM table shared by all fuel objects"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.gcmTableFile = fl._gcm_table_file
+        self.gcmTable = os.path.join(self.tmpdir.name, "gcmTable.csv")
+        shutil.copy(self.gcmTableFile, self.gcmTable)
+
+    def tearDown(self):
+        fl.reload_gcm_table(self.gcmTableFile)
+        self.tmpdir.cleanup()
+
+    def test_shared(self):
+        """Is the GCM table read once and shared by every fuel?"""
+
+        fl._gcm_table = None
+        with mock.patch.object(
+            fl, "GroupContributionTable", wraps=fl.GroupContributionTable
+        ) as table:
+            fl.fuel("heptane")
+            shared = fl.get_gcm_table()
+            fl.fuel("posf10264")
+            self.assertIs(fl.get_gcm_table(), shared)
+        table.assert_called_once_with(self.gcmTableFile)
+
+        # The shared table cannot be modified by a fuel
+        with self.assertRaises(ValueError):
+            shared.values[0, 0] = 0.0
+
+    def test_reload(self):
+        """Does reload_gcm_table pick up changes of the table file?"""
+
+        table = fl.reload_gcm_table(self.gcmTable)
+        self.assertEqual(table.file, self.gcmTable)
+        Tc = fl.fuel("heptane").Tc
+
+        with open(self.gcmTable, encoding="utf-8") as f:
+            text = f.read()
+        with open(self.gcmTable, "w", encoding="utf-8") as f:
+            f.write(text.replace("tck,K,1.6781,3.492,", "tck,K,1.7781,3.592,", 1))
+
+        # Fuels use the shared table until it is reloaded
+        np.testing.assert_array_equal(fl.fuel("heptane").Tc, Tc)
+        reloaded = fl.reload_gcm_table()
+        self.assertIsNot(reloaded, table)
+        self.assertIs(fl.get_gcm_table(), reloaded)
+        self.assertEqual(reloaded.file, self.gcmTable)
+        self.assertTrue(np.all(fl.fuel("heptane").Tc > Tc))
+
+        # Reloading the original file restores the original properties
+        fl.reload_gcm_table(self.gcmTableFile)
+        np.testing.assert_array_equal(fl.fuel("heptane").Tc, Tc)
+
+
+if __name__ == "__main__":
+    unittest.main()
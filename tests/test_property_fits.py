@@ -0,0 +1,72 @@
+import os
+import sys
+import numpy as np
+import unittest
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+from PropertyFits import PropertyFits
+
+
+class PropertyFitsTestCase(unittest.TestCase):
+    """Test that polynomial fits match the fuel correlations"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fuel = fl.fuel("posf10264")
+        cls.fits = PropertyFits(cls.fuel, rtol=1e-4)
+        rng = np.random.default_rng(0)
+        cls.x = rng.uniform(-1.0, 1.0, 200)
+        cls.T = cls.fits.temperature(cls.x)
+
+    def test_error_bound(self):
+        """Are the fit errors within the requested tolerance?"""
+
+        comp_idx = np.arange(self.fuel.num_compounds)
+        for prop in self.fits.props:
+            self.assertLessEqual(self.fits.errors[prop].max(), 1e-4)
+            direct = getattr(self.fuel, prop)(self.T, comp_idx=comp_idx)
+
+            # Evaluate each compound at its own temperatures, the diagonal
+            pred = np.stack(
+                [
+                    self.fits.evaluate(self.T[:, i], props=[prop])[prop][:, i]
+                    for i in comp_idx
+                ],
+                axis=1,
+            )
+            np.testing.assert_allclose(pred, direct, rtol=1e-4, err_msg=prop)
+
+    def test_power_coefficients(self):
+        """Does Horner's scheme with the power coefficients match the fits?"""
+
+        for prop in ["density", "psat"]:
+            scale = 10.0
+            power = self.fits.power_coefficients(prop, scale)
+            values = np.zeros_like(self.T)
+            for a in power[::-1]:
+                values = values * self.x[:, np.newaxis] + a
+            if prop in PropertyFits.LOG_PROPERTIES:
+                values = np.exp(values)
+            ref = np.stack(
+                [
+                    self.fits.evaluate(self.T[:, i], props=[prop])[prop][:, i]
+                    for i in range(self.fuel.num_compounds)
+                ],
+                axis=1,
+            )
+            np.testing.assert_allclose(values, scale * ref, rtol=1e-9, err_msg=prop)
+
+    def test_degree_limit(self):
+        """Is an unreachable tolerance reported?"""
+
+        with self.assertRaises(ValueError):
+            PropertyFits(self.fuel, props=["surface_tension"], rtol=1e-12, max_degree=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import sys
+import tempfile
+import numpy as np
+import unittest
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+from PropertyTable import PropertyTable
+
+
+class PropertyTableTestCase(unittest.TestCase):
+    """Test that interpolated properties match the fuel correlations"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fuel = fl.fuel("posf10264")
+        cls.Y = np.vstack([cls.fuel.Y_0, cls.fuel.Y_0[::-1]])
+        cls.table = PropertyTable(cls.fuel, Y=cls.Y, T_max=500.0, rtol=1e-5)
+        rng = np.random.default_rng(0)
+        cls.T = rng.uniform(cls.table.T_min, cls.table.T_max, 500)
+
+    def test_error_bound(self):
+        """Are the interpolation errors within the requested tolerance?"""
+
+        self.assertLessEqual(max(self.table.errors.values()), 1e-5)
+
+        compound = self.table.lookup(self.T)
+        direct = self.fuel.evaluate(self.T)
+        for prop, pred in compound.items():
+            self.assertEqual(pred.shape, (len(self.T), self.fuel.num_compounds))
+            np.testing.assert_allclose(pred, direct[prop], rtol=1e-5, err_msg=prop)
+
+        mixture = self.table.lookup(self.T, mixture=True)
+        direct = self.fuel.evaluate(self.T, self.Y)
+        for prop, pred in mixture.items():
+            self.assertEqual(pred.shape, (len(self.Y), len(self.T)))
+            np.testing.assert_allclose(pred, direct[prop], rtol=1e-5, err_msg=prop)
+
+    def test_save_load(self):
+        """Does a saved table give the same lookups after loading?"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file = os.path.join(tmpdir, "table.npz")
+            self.table.save(file)
+            table = PropertyTable.load(file)
+
+        self.assertEqual(table.errors, self.table.errors)
+        self.assertEqual(table.interpolation, self.table.interpolation)
+        for mixture in [False, True]:
+            pred = table.lookup(self.T, mixture=mixture)
+            ref = self.table.lookup(self.T, mixture=mixture)
+            for prop in ref:
+                np.testing.assert_array_equal(pred[prop], ref[prop], err_msg=prop)
+
+    def test_linear(self):
+        """Do linear tables interpolate between nodes within their error estimate?"""
+
+        table = PropertyTable(self.fuel, T_max=500.0, nT=129, interpolation="linear")
+        self.assertGreater(max(table.errors.values()), self.table.errors["compound/Cl"])
+
+        # Midpoints of the intervals against linear interpolation of the nodes
+        T = 0.5 * (table.T[1:] + table.T[:-1])
+        pred = table.lookup(T, props=["density", "psat"])
+        direct = self.fuel.evaluate(table.T, props=["density", "psat"])
+        rho = 0.5 * (direct["density"][1:] + direct["density"][:-1])
+        psat = np.sqrt(direct["psat"][1:] * direct["psat"][:-1])
+        np.testing.assert_allclose(pred["density"], rho, rtol=1e-12)
+        np.testing.assert_allclose(pred["psat"], psat, rtol=1e-12)
+
+        # Errors of each compound are bounded by the error of the property
+        begin, end = table.columns["compound/density"]
+        exact = self.fuel.evaluate(T, props=["density"])["density"]
+        rel_error = np.max(np.abs(pred["density"] / exact - 1), axis=0)
+        self.assertTrue(np.all(rel_error <= table.column_errors[begin:end] * 1.001))
+        self.assertEqual(
+            np.max(table.column_errors[begin:end]), table.errors["compound/density"]
+        )
+
+    def test_out_of_range(self):
+        """Are temperatures outside the table rejected?"""
+
+        with self.assertRaises(ValueError):
+            self.table.lookup(self.table.T_max + 1.0)
+        with self.assertRaises(ValueError):
+            self.table.lookup(self.T, props=["Cp"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,263 @@
+import os
+import sys
+import numpy as np
+import unittest
+
+# Add the FuelLib directory to the Python path
+FUELLIB_DIR = os.path.dirname(os.path.dirname(__file__))
+if FUELLIB_DIR not in sys.path:
+    sys.path.append(FUELLIB_DIR)
+from paths import *
+import FuelLib as fl
+
+
+class VectorizationTestCase(unittest.TestCase):
+    """Test that vectorized evaluations match scalar evaluations"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fuel = fl.fuel("posf10264")
+        cls.T = np.linspace(250, 800, 12)
+
+    def test_compound_temperature_arrays(self):
+        """Do per-compound properties of a temperature array match a loop over T?"""
+
+        methods = [
+            "density",
+            "viscosity_dynamic",
+            "Cl",
+            "psat",
+            "molar_liquid_vol",
+            "latent_heat_vaporization",
+            "surface_tension",
+            "thermal_conductivity",
+        ]
+        for method in methods:
+            prop = getattr(self.fuel, method)
+            with np.errstate(invalid="ignore"):
+                pred = prop(self.T)
+                loop = np.array([prop(T) for T in self.T])
+                comp = np.stack(
+                    [prop(self.T, comp_idx=i) for i in range(self.fuel.num_compounds)],
+                    axis=1,
+                )
+
+            self.assertEqual(pred.shape, (len(self.T), self.fuel.num_compounds))
+            np.testing.assert_allclose(pred, loop, rtol=1e-12, err_msg=method)
+            np.testing.assert_allclose(comp, loop, rtol=1e-12, err_msg=method)
+
+    def test_mixing_rule(self):
+        """Does the closed-form mixing rule match the pairwise definition?"""
+
+        X = self.fuel.Y2X(self.fuel.Y_0)
+        var_n = self.fuel.psat(self.T)
+        for pseudo_prop in ["arithmetic", "geometric"]:
+            if pseudo_prop == "geometric":
+                var_ij = np.sqrt(var_n[:, :, None] * var_n[:, None, :])
+            else:
+                var_ij = (var_n[:, :, None] + var_n[:, None, :]) / 2
+            pairwise = np.einsum("i,tij,j->t", X, var_ij, X)
+
+            pred = fl.mixing_rule(var_n, X, pseudo_prop)
+            np.testing.assert_allclose(pred, pairwise, rtol=1e-12)
+
+            # Batched compositions give one row per composition
+            pred = fl.mixing_rule(var_n, np.vstack([X, X]), pseudo_prop)
+            self.assertEqual(pred.shape, (2, len(self.T)))
+            np.testing.assert_allclose(pred[1], pairwise, rtol=1e-12)
+
+    def test_mixture_compositions(self):
+        """Do mixture properties of many compositions match a loop over Y and T?"""
+
+        rng = np.random.default_rng(0)
+        Y = rng.random((4, self.fuel.num_compounds))
+        Y /= np.sum(Y, axis=1, keepdims=True)
+        Y[2] = 0.0
+        T = self.T[:6]
+
+        methods = [
+            "mixture_density",
+            "mixture_kinematic_viscosity",
+            "mixture_dynamic_viscosity",
+            "mixture_vapor_pressure",
+            "mixture_surface_tension",
+            "mixture_thermal_conductivity",
+        ]
+        for method in methods:
+            prop = getattr(self.fuel, method)
+            pred = prop(Y, T)
+            loop = np.array([[prop(Y_i, T_k) for T_k in T] for Y_i in Y])
+
+            self.assertEqual(pred.shape, (len(Y), len(T)))
+            np.testing.assert_allclose(pred, loop, rtol=1e-12, err_msg=method)
+            np.testing.assert_array_equal(pred[2], 0.0, err_msg=method)
+
+    def test_evaluate(self):
+        """Does the single-pass evaluation match the individual property methods?"""
+
+        props = self.fuel.evaluate(self.T[:6])
+        for prop, pred in props.items():
+            direct = getattr(self.fuel, prop)(self.T[:6])
+            np.testing.assert_allclose(pred, direct, rtol=1e-12, err_msg=prop)
+
+        props = self.fuel.evaluate(self.T[:6], self.fuel.Y_0)
+        mixture = {
+            "density": self.fuel.mixture_density,
+            "viscosity_dynamic": self.fuel.mixture_dynamic_viscosity,
+            "psat": self.fuel.mixture_vapor_pressure,
+            "surface_tension": self.fuel.mixture_surface_tension,
+            "thermal_conductivity": self.fuel.mixture_thermal_conductivity,
+        }
+        for prop, method in mixture.items():
+            direct = method(self.fuel.Y_0, self.T[:6])
+            np.testing.assert_allclose(props[prop], direct, rtol=1e-12, err_msg=prop)
+
+    def test_parcel_properties(self):
+        """Do parcel properties match the mixture functions of each parcel?"""
+
+        rng = np.random.default_rng(0)
+        N = 8
+        T = rng.uniform(280, 500, N)
+        Y = self.fuel.mass2Y(rng.random((N, self.fuel.num_compounds)))
+        r = rng.uniform(1e-6, 5e-5, N)
+        r[0] = 0.0
+        props = self.fuel.parcel_properties(T, Y, r)
+
+        mixture = {
+            "density": self.fuel.mixture_density,
+            "viscosity_dynamic": self.fuel.mixture_dynamic_viscosity,
+            "psat": self.fuel.mixture_vapor_pressure,
+            "surface_tension": self.fuel.mixture_surface_tension,
+        }
+        for n in range(N):
+            direct = self.fuel.evaluate(
+                T[n], Y[n], props=["Cl", "latent_heat_vaporization"]
+            )
+            direct.update(
+                {prop: method(Y[n], T[n]) for prop, method in mixture.items()}
+            )
+            for prop in self.fuel.PARCEL_PROPERTIES:
+                np.testing.assert_allclose(
+                    props[prop][n], np.squeeze(direct[prop]), rtol=1e-12, err_msg=prop
+                )
+            mass = fl.droplet_mass(self.fuel, r[n], Y[n], T[n])
+            np.testing.assert_allclose(props["mass"][n], mass, rtol=1e-12)
+        np.testing.assert_array_equal(props["mass"][0], 0.0)
+
+        # Preallocated buffers are filled in place
+        out = {prop: np.empty(N) for prop in self.fuel.PARCEL_PROPERTIES}
+        out["mass"] = np.empty((N, self.fuel.num_compounds))
+        buffered = self.fuel.parcel_properties(T, Y, r, out=out)
+        for prop, values in out.items():
+            self.assertIs(buffered[prop], values)
+            np.testing.assert_array_equal(values, props[prop], err_msg=prop)
+
+    def test_supercritical_thermal_conductivity(self):
+        """Does the mixture thermal conductivity stay NaN above a critical temperature?"""
+
+        T = np.array([300.0, 700.0])
+        with np.errstate(invalid="ignore"):
+            self.assertTrue(np.isnan(self.fuel.thermal_conductivity(700.0)).any())
+            tc = self.fuel.mixture_thermal_conductivity(self.fuel.Y_0, T)
+            props = self.fuel.evaluate(T, self.fuel.Y_0, props=["thermal_conductivity"])
+        self.assertGreater(tc[0], 0.0)
+        self.assertTrue(np.isnan(tc[1]))
+        self.assertTrue(np.isnan(props["thermal_conductivity"][..., 1]).all())
+
+        # Compositions that sum to zero still give zero conductivity
+        self.assertEqual(
+            self.fuel.mixture_thermal_conductivity(np.zeros_like(self.fuel.Y_0), 300.0),
+            0.0,
+        )
+
+    def test_diffusion_coeff_grid(self):
+        """Do diffusion coefficients on a (p, T) grid match a loop over p and T?"""
+
+        p = np.array([1e5, 1e6, 4e6])
+        for correlation in ["Tee", "Wilke"]:
+            pred = self.fuel.diffusion_coeff(
+                p[:, None], self.T, correlation=correlation
+            )
+            loop = np.array(
+                [
+                    [
+                        self.fuel.diffusion_coeff(p_j, T_k, correlation=correlation)
+                        for T_k in self.T
+                    ]
+                    for p_j in p
+                ]
+            )
+            self.assertEqual(pred.shape, (len(p), len(self.T), self.fuel.num_compounds))
+            np.testing.assert_allclose(pred, loop, rtol=1e-12, err_msg=correlation)
+
+        # Several bath gases give a leading gas axis
+        gases = ["N2", "O2", "CO2"]
+        pred = self.fuel.diffusion_coeff(p[:, None], self.T, gas=gases)
+        self.assertEqual(
+            pred.shape, (len(gases), len(p), len(self.T), self.fuel.num_compounds)
+        )
+        for i, gas in enumerate(gases):
+            sigma, epsilonByKB, MW = fl.bath_gas(gas)
+            direct = self.fuel.diffusion_coeff(
+                p[:, None], self.T, sigma, epsilonByKB, MW
+            )
+            np.testing.assert_allclose(pred[i], direct, rtol=1e-12, err_msg=gas)
+
+    def test_coefficients_reset(self):
+        """Are the precomputed coefficients recomputed when the fuel properties change?"""
+
+        fuel = fl.fuel("posf10264")
+        T = self.T[:4]
+        st = fuel.surface_tension(T)
+        block = fuel.coefficients()
+        self.assertIs(fuel.coefficients(), block)
+
+        # Reassigning a property resets the coefficients
+        fuel.Tc = fuel.Tc * 1.05
+        self.assertIsNot(fuel.coefficients(), block)
+        fresh = fl.fuel("posf10264")
+        fresh.Tc = fresh.Tc * 1.05
+        np.testing.assert_allclose(fuel.surface_tension(T), fresh.surface_tension(T))
+
+        # Reassigning the original values restores the coefficients
+        fuel.Tc = fuel.Tc / 1.05
+        fuel.Pc = fresh.Pc
+        np.testing.assert_allclose(fuel.surface_tension(T), st, rtol=1e-12)
+
+        # An explicit reset recomputes the same coefficients
+        block = fuel.coefficients()
+        fuel.reset_coefficients()
+        self.assertIsNot(fuel.coefficients(), block)
+        np.testing.assert_array_equal(fuel.coefficients(), block)
+
+    def test_coefficients_read_only(self):
+        """Are in-place changes of the coefficient inputs rejected?"""
+
+        fuel = fl.fuel("posf10264")
+        block = fuel.coefficients()
+        for name in fuel.COEFFICIENT_INPUTS:
+            with self.assertRaises(ValueError, msg=name):
+                getattr(fuel, name)[0] = 1
+        with self.assertRaises(ValueError):
+            fuel.Tc *= 1.05
+        self.assertIs(fuel.coefficients(), block)
+
+        # Assigned arrays are copied, so later changes to them have no effect
+        Tc = fuel.Tc * 1.05
+        fuel.Tc = Tc
+        Tc[0] = 1.0
+        self.assertEqual(fuel.Tc[0], 1.05 * fl.fuel("posf10264").Tc[0])
+
+        fresh = fl.fuel("posf10264")
+        fresh.Tc = fuel.Tc.copy()
+        T = self.T[:4]
+        np.testing.assert_allclose(
+            fuel.bubble_point(fuel.Y_0, 101325.0),
+            fresh.bubble_point(fresh.Y_0, 101325.0),
+            rtol=1e-12,
+        )
+        np.testing.assert_allclose(fuel.psat(T), fresh.psat(T), rtol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()